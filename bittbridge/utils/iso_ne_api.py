@@ -3,91 +3,226 @@ ISO-NE Web Services API helper for Five Minute System Load.
 
 Fetches LoadMw data from https://webservices.iso-ne.com/api/v1.1/fiveminutesystemload/day/{YYYYMMDD}
 using HTTP Basic Auth. Credentials from .env: ISO_NE_USERNAME, ISO_NE_PASSWORD.
+
+Closed Eastern days are persisted in the local day store (see ``iso_ne_store``) and read from
+disk before hitting the API; only the current day is refetched, and once it has been fetched its
+refreshes append the newest interval from the ``current`` endpoint instead of the whole day.
+HTTP goes through the pooled, host-wide rate-limited clients in ``iso_ne_client`` (blocking and
+asyncio variants) and is parsed straight into NumPy arrays by ``iso_ne_parse`` (XML by default,
+JSON with ISO_NE_RESPONSE_FORMAT=json). Failed fetches are logged with their cause (429,
+timeout, ...) rather than only showing up as missing data.
+
+Fetched days are kept in a bounded in-memory LRU (``iso_ne_cache``): closed days until evicted for
+space, the open day for a short TTL. Hit/miss/eviction counters are available from
+:func:`get_cache_stats`.
 """
 
-import os
-import xml.etree.ElementTree as ET
+import asyncio
+import threading
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import bittensor as bt
 
+from bittbridge.utils.iso_ne_cache import DayCache
+from bittbridge.utils.iso_ne_client import DEFAULT_BASE_URL, get_async_client, get_sync_client
+from bittbridge.utils.iso_ne_day import SLOT_SECONDS, DayLoad
+from bittbridge.utils.iso_ne_parse import ACCEPT_HEADERS, parse_response
+from bittbridge.utils.iso_ne_store import get_day_store, is_day_closed
 from bittbridge.utils.timestamp import get_now
 
-import requests
 from pytz import timezone
 
-ISO_NE_BASE_URL = "https://webservices.iso-ne.com/api/v1.1"
+ISO_NE_BASE_URL = DEFAULT_BASE_URL
 UTC = timezone("UTC")
 # ISO-NE uses Eastern time for "day" in the API (day/YYYYMMDD)
 EASTERN = timezone("America/New_York")
 
-# Day-level cache for validator: {day_yyyymmdd: [(datetime_utc, load_mw), ...]}
-_day_cache: dict = {}
+# Day-level cache for validator, bounded by ISO_NE_CACHE_* settings
+_day_cache: DayCache = DayCache.from_env()
+# Latest fetch of each still-open day, kept even for use_cache=False so the next refresh of that
+# day can apply only the newly published interval(s): {day_yyyymmdd: DayLoad}. Shared by the
+# poller thread, predictor worker threads and asyncio callers, so only touched under the lock.
+_live_days: dict = {}
+_live_days_lock = threading.Lock()
+_last_fetch_error: Optional[str] = None
 
+CURRENT_PATH = "fiveminutesystemload/current"
 
-def _get_credentials() -> Tuple[Optional[str], Optional[str]]:
-    """Get ISO-NE credentials from environment."""
-    username = os.getenv("ISO_NE_USERNAME")
-    password = os.getenv("ISO_NE_PASSWORD")
-    return username, password
 
+def _day_path(day_yyyymmdd: str) -> str:
+    return f"fiveminutesystemload/day/{day_yyyymmdd}"
 
-def _parse_xml_response(text: str) -> List[Tuple[datetime, float]]:
+
+def _incremental_base(day_yyyymmdd: str, incremental: bool) -> Optional[DayLoad]:
+    """Previously fetched copy of an open day that a ``current`` delta can be applied to."""
+    if not incremental or is_day_closed(day_yyyymmdd):
+        return None
+    with _live_days_lock:
+        base = _live_days.get(day_yyyymmdd)
+    if base is None or base.newest_epoch is None:
+        return None
+    return base
+
+
+def _apply_current_delta(base: DayLoad, text: str, response_format: str) -> Optional[DayLoad]:
     """
-    Parse XML response from fiveminutesystemload endpoint.
-    Returns list of (datetime_utc, load_mw) sorted by datetime.
+    Merge the ``current`` endpoint's interval(s) into ``base``.
+
+    Returns None (caller falls back to a full-day fetch) when the delta does not continue the
+    day without a gap, e.g. a poll was missed or the current interval belongs to the next day.
     """
-    root = ET.fromstring(text)
-    # Handle namespace: xmlns="http://WEBSERV.iso-ne.com"
-    ns = {"iso": "http://WEBSERV.iso-ne.com"}
-    # Try with namespace first
-    elements = root.findall(".//iso:FiveMinSystemLoad", ns)
-    if not elements:
-        elements = root.findall(".//FiveMinSystemLoad")
-    if not elements:
-        # Fallback: search without namespace
-        for elem in root.iter():
-            if "FiveMinSystemLoad" in elem.tag:
-                elements = root.findall(f".//{{*}}{elem.tag.split('}')[-1]}")
-                break
-        if not elements:
-            elements = list(root.iter("FiveMinSystemLoad"))
-
-    results = []
-    for elem in elements:
-        begin_date_elem = elem.find("iso:BeginDate", ns) or elem.find("BeginDate")
-        load_mw_elem = elem.find("iso:LoadMw", ns) or elem.find("LoadMw")
-        if begin_date_elem is None:
-            for child in elem:
-                if "BeginDate" in child.tag:
-                    begin_date_elem = child
-                    break
-        if load_mw_elem is None:
-            for child in elem:
-                if "LoadMw" in child.tag:
-                    load_mw_elem = child
-                    break
-
-        if begin_date_elem is None or load_mw_elem is None:
-            continue
-
-        begin_str = begin_date_elem.text
-        load_str = load_mw_elem.text
-        if not begin_str or not load_str:
-            continue
+    epochs, loads = parse_response(text, response_format)
+    if epochs.size == 0:
+        return None
+    newest = base.newest_epoch
+    if int(epochs.min()) > newest + SLOT_SECONDS:
+        return None
+    if base.slot_index(int(epochs.max())) is None:
+        return None
+    if int(epochs.max()) <= newest:
+        return base
+    return base.merged(epochs, loads)
+
+
+def _day_load_from_response(day_yyyymmdd: str, text: str, response_format: str) -> DayLoad:
+    epochs, loads = parse_response(text, response_format)
+    return DayLoad.from_arrays(day_yyyymmdd, epochs, loads)
+
+
+def _cached_or_stored_day(day_yyyymmdd: str, use_cache: bool) -> Optional[DayLoad]:
+    """Memory cache first (when allowed), then the on-disk store for closed days."""
+    if use_cache:
+        cached = _day_cache.get(day_yyyymmdd)
+        if cached is not None:
+            return cached
+
+    store = get_day_store()
+    if store is not None and is_day_closed(day_yyyymmdd):
+        try:
+            stored = store.get_day(day_yyyymmdd)
+        except Exception:
+            stored = None
+        if stored is not None and stored.n_valid:
+            _day_cache.put(stored)
+            return stored
+    return None
 
+
+def _note_fetch_failure(day_yyyymmdd: str, error: Exception) -> None:
+    """Log why a day could not be fetched (429, timeout, ...) and keep it for get_last_fetch_error()."""
+    global _last_fetch_error
+    status = getattr(error, "status", None)
+    kind = "throttled (HTTP 429)" if status == 429 else f"HTTP {status}" if status else type(error).__name__
+    _last_fetch_error = f"{day_yyyymmdd}: {kind}: {error}"
+    bt.logging.warning(f"ISO-NE fetch failed for day {day_yyyymmdd} ({kind}): {error}")
+
+
+def get_last_fetch_error() -> Optional[str]:
+    """Reason for the most recent failed day fetch in this process, or None."""
+    return _last_fetch_error
+
+
+def _remember_day(day_load: DayLoad, use_cache: bool) -> None:
+    """Cache a freshly fetched day and persist it when it is closed and complete."""
+    if use_cache:
+        _day_cache.put(day_load)
+    with _live_days_lock:
+        for day in [d for d in _live_days if d != day_load.day and is_day_closed(d)]:
+            del _live_days[day]
+        if is_day_closed(day_load.day):
+            _live_days.pop(day_load.day, None)
+        else:
+            _live_days[day_load.day] = day_load
+    store = get_day_store()
+    if store is not None and day_load.n_valid:
         try:
-            # Parse BeginDate e.g. "2026-03-09T00:00:00.000-04:00"
-            dt = datetime.fromisoformat(begin_str.replace("Z", "+00:00"))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=UTC)
-            dt_utc = dt.astimezone(UTC)
-            load_mw = float(load_str)
-            results.append((dt_utc, load_mw))
-        except (ValueError, TypeError):
-            continue
+            if store.put_day(day_load):
+                _day_cache.put(day_load)
+        except Exception:
+            pass
+
+
+def fetch_day_load(day_yyyymmdd: str, use_cache: bool = True) -> Optional[DayLoad]:
+    """
+    Fetch one Eastern day of Five Minute System Load as a slot-indexed :class:`DayLoad`.
+
+    Closed days come from the on-disk day store when present (they never change, so this
+    applies even with use_cache=False); a successful fetch of a closed, complete day is
+    written back to the store. Network requests go through the pooled keep-alive client;
+    concurrent calls for the same day share one upstream request.
 
-    results.sort(key=lambda x: x[0])
-    return results
+    Refreshing a still-open day that was fetched before only asks the ``current`` endpoint for
+    the newest interval and appends it; the full day is downloaded again only when that leaves a
+    gap (disable with ISO_NE_INCREMENTAL=0).
+
+    Args:
+        day_yyyymmdd: Day in YYYYMMDD format (e.g. "20260309")
+        use_cache: If True, return cached data for this day when available
+
+    Returns:
+        DayLoad for the day, or None on failure.
+    """
+    local = _cached_or_stored_day(day_yyyymmdd, use_cache)
+    if local is not None:
+        return local
+
+    client = get_sync_client()
+    if not client.config.has_credentials:
+        return None
+    fmt = client.config.response_format
+    day_load = None
+    base = _incremental_base(day_yyyymmdd, client.config.incremental)
+    if base is not None:
+        try:
+            day_load = _apply_current_delta(base, client.get_text(CURRENT_PATH, ACCEPT_HEADERS[fmt]), fmt)
+        except Exception:
+            day_load = None
+    if day_load is None:
+        try:
+            text = client.get_text(_day_path(day_yyyymmdd), ACCEPT_HEADERS[fmt])
+            day_load = _day_load_from_response(day_yyyymmdd, text, fmt)
+        except Exception as e:
+            _note_fetch_failure(day_yyyymmdd, e)
+            return None
+    _remember_day(day_load, use_cache)
+    return day_load
+
+
+async def fetch_day_load_async(day_yyyymmdd: str, use_cache: bool = True) -> Optional[DayLoad]:
+    """
+    asyncio counterpart of :func:`fetch_day_load` for code running on an event loop
+    (validator evaluation loop, miner axon). Never blocks the loop on ISO-NE latency.
+    """
+    if use_cache:
+        cached = _day_cache.get(day_yyyymmdd)
+        if cached is not None:
+            return cached
+    local = await asyncio.to_thread(_cached_or_stored_day, day_yyyymmdd, False)
+    if local is not None:
+        return local
+
+    client = get_async_client()
+    if not client.config.has_credentials:
+        return None
+    fmt = client.config.response_format
+    day_load = None
+    base = _incremental_base(day_yyyymmdd, client.config.incremental)
+    if base is not None:
+        try:
+            text = await client.get_text(CURRENT_PATH, ACCEPT_HEADERS[fmt])
+            day_load = _apply_current_delta(base, text, fmt)
+        except Exception:
+            day_load = None
+    if day_load is None:
+        try:
+            text = await client.get_text(_day_path(day_yyyymmdd), ACCEPT_HEADERS[fmt])
+            day_load = _day_load_from_response(day_yyyymmdd, text, fmt)
+        except Exception as e:
+            _note_fetch_failure(day_yyyymmdd, e)
+            return None
+    await asyncio.to_thread(_remember_day, day_load, use_cache)
+    return day_load
 
 
 def fetch_fiveminute_system_load(
@@ -104,28 +239,10 @@ def fetch_fiveminute_system_load(
     Returns:
         List of (datetime_utc, load_mw) sorted by datetime. Empty list on failure.
     """
-    if use_cache and day_yyyymmdd in _day_cache:
-        return _day_cache[day_yyyymmdd]
-
-    username, password = _get_credentials()
-    if not username or not password:
-        return []
-
-    url = f"{ISO_NE_BASE_URL}/fiveminutesystemload/day/{day_yyyymmdd}"
-    try:
-        response = requests.get(
-            url,
-            auth=(username, password),
-            headers={"Accept": "application/xml"},
-            timeout=30,
-        )
-        response.raise_for_status()
-        results = _parse_xml_response(response.text)
-        if use_cache:
-            _day_cache[day_yyyymmdd] = results
-        return results
-    except Exception:
+    day_load = fetch_day_load(day_yyyymmdd, use_cache=use_cache)
+    if day_load is None:
         return []
+    return day_load.to_pairs()
 
 
 def _parse_timestamp(timestamp: str) -> Optional[datetime]:
@@ -144,6 +261,26 @@ def _parse_timestamp(timestamp: str) -> Optional[datetime]:
         return None
 
 
+def _resolve_slot(timestamp: str) -> Optional[Tuple[str, float, bool]]:
+    """
+    Map a request timestamp to (eastern_day_yyyymmdd, slot_epoch, use_cache).
+    Recent slots (within the last 30 min) bypass the cache so retries see fresh API data.
+    """
+    from bittbridge.utils.timestamp import round_to_interval
+
+    dt = _parse_timestamp(timestamp)
+    if dt is None:
+        return None
+    dt_rounded = round_to_interval(dt, interval_minutes=5)
+    # dt_rounded is already in Eastern (timestamp module uses Eastern); API day is Eastern
+    day_yyyymmdd = dt_rounded.strftime("%Y%m%d")
+    now_eastern = get_now()
+    if dt_rounded.tzinfo is None:
+        dt_rounded = dt_rounded.replace(tzinfo=EASTERN)
+    is_recent = (now_eastern - dt_rounded) <= timedelta(minutes=30)
+    return day_yyyymmdd, dt_rounded.timestamp(), not is_recent
+
+
 def get_load_mw_for_timestamp(timestamp: str) -> Optional[float]:
     """
     Get actual LoadMw for a 5-minute slot matching the given timestamp.
@@ -155,33 +292,43 @@ def get_load_mw_for_timestamp(timestamp: str) -> Optional[float]:
     Returns:
         LoadMw for that 5-min slot, or None if not found
     """
-    from bittbridge.utils.timestamp import round_to_interval
-
     try:
-        dt = _parse_timestamp(timestamp)
-        if dt is None:
+        slot = _resolve_slot(timestamp)
+        if slot is None:
+            return None
+        day_yyyymmdd, slot_epoch, use_cache = slot
+        day_load = fetch_day_load(day_yyyymmdd, use_cache=use_cache)
+        if day_load is None:
             return None
-        dt_rounded = round_to_interval(dt, interval_minutes=5)
-        # dt_rounded is already in Eastern (timestamp module uses Eastern); API day is Eastern
-        day_yyyymmdd = dt_rounded.strftime("%Y%m%d")
-        # For recent slots (within last 30 min), bypass cache so retries get fresh API data
-        now_eastern = get_now()
-        if dt_rounded.tzinfo is None:
-            dt_rounded = dt_rounded.replace(tzinfo=EASTERN)
-        is_recent = (now_eastern - dt_rounded) <= timedelta(minutes=30)
-        use_cache = not is_recent
-        data = fetch_fiveminute_system_load(day_yyyymmdd, use_cache=use_cache)
-        dt_rounded = dt_rounded.replace(second=0, microsecond=0)
-        for slot_dt, load_mw in data:
-            slot_normalized = slot_dt.replace(second=0, microsecond=0)
-            if slot_normalized == dt_rounded:
-                return load_mw
+        return day_load.get(slot_epoch)
+    except Exception:
         return None
+
+
+async def get_load_mw_for_timestamp_async(timestamp: str) -> Optional[float]:
+    """asyncio counterpart of :func:`get_load_mw_for_timestamp`."""
+    try:
+        slot = _resolve_slot(timestamp)
+        if slot is None:
+            return None
+        day_yyyymmdd, slot_epoch, use_cache = slot
+        day_load = await fetch_day_load_async(day_yyyymmdd, use_cache=use_cache)
+        if day_load is None:
+            return None
+        return day_load.get(slot_epoch)
     except Exception:
         return None
 
 
+def get_cache_stats() -> Dict[str, float]:
+    """Day cache counters (hits, misses, evictions, expirations, days, nbytes)."""
+    return _day_cache.stats.as_dict()
+
+
 def clear_cache() -> None:
-    """Clear the day cache (e.g. for testing)."""
-    global _day_cache
-    _day_cache = {}
+    """Clear the day cache and its counters, re-reading ISO_NE_CACHE_* (e.g. for testing)."""
+    global _day_cache, _last_fetch_error
+    _day_cache = DayCache.from_env()
+    with _live_days_lock:
+        _live_days.clear()
+    _last_fetch_error = None
@@ -0,0 +1,175 @@
+"""
+In-memory rolling window of the latest ISO-NE five-minute system load.
+
+:class:`LoadRingBuffer` holds the last 24h of published intervals in fixed NumPy arrays addressed
+by slot number (``epoch // 300``), so reading the newest ``n`` values is a constant-time slice
+instead of an HTTP request plus parse. :class:`LoadBufferPoller` keeps it filled from a daemon
+thread, only calling ISO-NE when a new interval is due to have been published.
+
+Settings (optional): ``ISO_NE_POLL_SEC`` (30; ``0`` disables the poller in the miner),
+``ISO_NE_BUFFER_MAX_AGE_SEC`` (900; older buffers are treated as stale and callers fetch directly).
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+import bittensor as bt
+import numpy as np
+
+from bittbridge.utils.iso_ne_api import fetch_day_load
+from bittbridge.utils.iso_ne_day import SLOT_SECONDS, DayLoad, eastern_day_for_epoch
+
+DAY_SLOTS = 24 * 60 * 60 // SLOT_SECONDS
+DEFAULT_POLL_SEC = 30.0
+DEFAULT_MAX_AGE_SEC = 15 * 60.0
+
+
+class LoadRingBuffer:
+    """Thread-safe ring of the latest ``capacity`` five-minute intervals (default 24h)."""
+
+    def __init__(self, capacity: int = DAY_SLOTS):
+        self.capacity = capacity
+        self._epochs = np.full(capacity, -1, dtype=np.int64)
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._newest: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def newest_epoch(self) -> Optional[int]:
+        """Start (POSIX seconds) of the newest interval held, or None when empty."""
+        return self._newest
+
+    def extend(self, epochs: np.ndarray, values: np.ndarray) -> int:
+        """Insert intervals (any order, re-sends allowed); returns how many were new or changed."""
+        epochs = np.asarray(epochs, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        if epochs.size == 0:
+            return 0
+        with self._lock:
+            newest = int(epochs.max()) if self._newest is None else max(self._newest, int(epochs.max()))
+            keep = epochs > newest - self.capacity * SLOT_SECONDS
+            epochs, values = epochs[keep], values[keep]
+            pos = (epochs // SLOT_SECONDS) % self.capacity
+            changed = int(np.count_nonzero((self._epochs[pos] != epochs) | (self._values[pos] != values)))
+            self._epochs[pos] = epochs
+            self._values[pos] = values
+            self._newest = newest
+        return changed
+
+    def extend_day(self, day_load: DayLoad) -> int:
+        return self.extend(day_load.valid_epochs(), day_load.valid_values())
+
+    def latest(self, n: int) -> Optional[np.ndarray]:
+        """The newest ``n`` published values in time order, or None if fewer are held."""
+        if n <= 0 or n > self.capacity:
+            return None
+        with self._lock:
+            if self._newest is None:
+                return None
+            window = self._newest - SLOT_SECONDS * np.arange(n - 1, -1, -1, dtype=np.int64)
+            pos = (window // SLOT_SECONDS) % self.capacity
+            if np.array_equal(self._epochs[pos], window):
+                return self._values[pos].copy()
+            # Gap inside the window (interval not published): newest n that are present.
+            held = self._epochs > self._newest - self.capacity * SLOT_SECONDS
+            if np.count_nonzero(held) < n:
+                return None
+            order = np.argsort(self._epochs[held])[-n:]
+            return self._values[held][order]
+
+    def age_sec(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds since the newest held interval ended, or None when empty."""
+        if self._newest is None:
+            return None
+        now = time.time() if now is None else now
+        return now - (self._newest + SLOT_SECONDS)
+
+    def is_fresh(self, max_age_sec: float = DEFAULT_MAX_AGE_SEC, now: Optional[float] = None) -> bool:
+        age = self.age_sec(now)
+        return age is not None and age <= max_age_sec
+
+
+class LoadBufferPoller:
+    """
+    Daemon thread that keeps a :class:`LoadRingBuffer` filled from ISO-NE.
+
+    The first refresh loads yesterday and today (closed days come from the day store); later
+    refreshes re-fetch only the current Eastern day, and only once the interval after the newest
+    one held has ended. Yesterday is re-fetched during the first hour after midnight, while its
+    last intervals may still be published.
+    """
+
+    def __init__(
+        self,
+        buffer: LoadRingBuffer,
+        interval_sec: float = DEFAULT_POLL_SEC,
+        fetch: Callable[..., Optional[DayLoad]] = fetch_day_load,
+    ):
+        self.buffer = buffer
+        self.interval_sec = interval_sec
+        self._fetch = fetch
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _due(self, now: float) -> bool:
+        newest = self.buffer.newest_epoch
+        if newest is None:
+            return True
+        current_slot = int(now) // SLOT_SECONDS * SLOT_SECONDS
+        # The interval starting at current_slot - 300 has ended; anything older is already held.
+        return newest < current_slot - SLOT_SECONDS
+
+    def refresh(self, now: Optional[float] = None, force: bool = False) -> int:
+        """Fetch what is due and merge it into the buffer; returns the number of new intervals."""
+        now = time.time() if now is None else now
+        primed = self.buffer.newest_epoch is not None
+        if primed and not force and not self._due(now):
+            return 0
+        today = eastern_day_for_epoch(now)
+        yesterday = eastern_day_for_epoch(now - 24 * 60 * 60)
+        days = [(today, False)]
+        if not primed:
+            days.insert(0, (yesterday, True))
+        elif eastern_day_for_epoch(now - 60 * 60) == yesterday:
+            days.insert(0, (yesterday, False))
+        added = 0
+        for day, use_cache in days:
+            day_load = self._fetch(day, use_cache=use_cache)
+            if day_load is not None:
+                added += self.buffer.extend_day(day_load)
+        return added
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                bt.logging.warning(f"ISO-NE load buffer refresh failed: {e}")
+            self._stop.wait(self.interval_sec)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="iso-ne-load-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+
+def poll_interval_from_env() -> float:
+    return max(0.0, float(os.getenv("ISO_NE_POLL_SEC", str(DEFAULT_POLL_SEC))))
+
+
+def max_age_from_env() -> float:
+    return float(os.getenv("ISO_NE_BUFFER_MAX_AGE_SEC", str(DEFAULT_MAX_AGE_SEC)))
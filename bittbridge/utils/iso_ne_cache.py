@@ -0,0 +1,123 @@
+"""
+Bounded in-memory cache of ISO-NE days for long-running processes.
+
+Entries are :class:`DayLoad` arrays (a few KiB per day). The cache is bounded by day count and by
+total array bytes, evicting least-recently-used closed days first. Days that are still open (the
+current Eastern day, or one not yet settled) are never evicted for space; they expire after
+``open_day_ttl_sec`` so newly published intervals become visible. Closed days never change and
+are only evicted for space.
+
+Settings (optional): ``ISO_NE_CACHE_MAX_DAYS`` (8), ``ISO_NE_CACHE_MAX_BYTES`` (4 MiB),
+``ISO_NE_CACHE_OPEN_DAY_TTL_SEC`` (60).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from bittbridge.utils.iso_ne_day import DayLoad
+from bittbridge.utils.iso_ne_store import is_day_closed
+
+DEFAULT_MAX_DAYS = 8
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_OPEN_DAY_TTL_SEC = 60.0
+
+
+@dataclass
+class DayCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    days: int = 0
+    nbytes: int = 0
+
+    def as_dict(self, prefix: str = "") -> Dict[str, float]:
+        return {f"{prefix}{k}": v for k, v in asdict(self).items()}
+
+
+def _day_nbytes(day_load: DayLoad) -> int:
+    return int(day_load.values.nbytes + day_load.valid.nbytes)
+
+
+class DayCache:
+    """Thread-safe LRU of closed :class:`DayLoad` days, plus open days held for a TTL."""
+
+    def __init__(
+        self,
+        max_days: int = DEFAULT_MAX_DAYS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        open_day_ttl_sec: float = DEFAULT_OPEN_DAY_TTL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_days = max(1, max_days)
+        self.max_bytes = max_bytes
+        self.open_day_ttl_sec = open_day_ttl_sec
+        self.stats = DayCacheStats()
+        self._clock = clock
+        # day -> (DayLoad, stored_at per clock, closed when stored)
+        self._entries: "OrderedDict[str, Tuple[DayLoad, float, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, day_yyyymmdd: str) -> bool:
+        return self.get(day_yyyymmdd, count=False) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, entry: Tuple[DayLoad, float, bool], now: float) -> bool:
+        _, stored_at, closed = entry
+        return not closed and now - stored_at > self.open_day_ttl_sec
+
+    def get(self, day_yyyymmdd: str, count: bool = True) -> Optional[DayLoad]:
+        with self._lock:
+            entry = self._entries.get(day_yyyymmdd)
+            if entry is not None and self._expired(entry, self._clock()):
+                self._drop(day_yyyymmdd)
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                if count:
+                    self.stats.misses += 1
+                return None
+            self._entries.move_to_end(day_yyyymmdd)
+            if count:
+                self.stats.hits += 1
+            return entry[0]
+
+    def put(self, day_load: DayLoad) -> None:
+        closed = is_day_closed(day_load.day)
+        with self._lock:
+            if day_load.day in self._entries:
+                self._drop(day_load.day)
+            now = self._clock()
+            self._entries[day_load.day] = (day_load, now, closed)
+            self.stats.nbytes += _day_nbytes(day_load)
+            # Open days stored earlier and never read again would otherwise never leave the cache.
+            for day in [d for d, entry in self._entries.items() if self._expired(entry, now)]:
+                self._drop(day)
+                self.stats.expirations += 1
+            # Oldest first; the day just stored is kept even when it alone exceeds the bounds.
+            closed_days = [d for d, (_, _, c) in self._entries.items() if c and d != day_load.day]
+            for oldest in closed_days:
+                if len(self._entries) <= self.max_days and self.stats.nbytes <= self.max_bytes:
+                    break
+                self._drop(oldest)
+                self.stats.evictions += 1
+            self.stats.days = len(self._entries)
+
+    def _drop(self, day_yyyymmdd: str) -> None:
+        day_load, _, _ = self._entries.pop(day_yyyymmdd)
+        self.stats.nbytes -= _day_nbytes(day_load)
+        self.stats.days = len(self._entries)
+
+    @classmethod
+    def from_env(cls) -> "DayCache":
+        return cls(
+            max_days=int(os.getenv("ISO_NE_CACHE_MAX_DAYS", str(DEFAULT_MAX_DAYS))),
+            max_bytes=int(os.getenv("ISO_NE_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))),
+            open_day_ttl_sec=float(os.getenv("ISO_NE_CACHE_OPEN_DAY_TTL_SEC", str(DEFAULT_OPEN_DAY_TTL_SEC))),
+        )
@@ -0,0 +1,321 @@
+"""
+Pooled HTTP clients for ISO-NE Web Services.
+
+Both clients keep connections alive across calls (one TCP/TLS handshake per pooled connection
+instead of per request), retry transient failures (timeouts, connection errors, 429 and 5xx) with
+exponential backoff, and coalesce concurrent requests for the same path into a single upstream
+call. Every attempt first takes a token from the host-wide limiter in ``iso_ne_ratelimit``.
+
+- :class:`IsoNeSyncClient` wraps a ``requests.Session``; used from threads / blocking code.
+- :class:`IsoNeAsyncClient` wraps an ``aiohttp.ClientSession``; used from asyncio coroutines so the
+  event loop never blocks on ISO-NE latency.
+
+Settings come from the environment (all optional):
+``ISO_NE_BASE_URL``, ``ISO_NE_TIMEOUT_SEC`` (30), ``ISO_NE_MAX_RETRIES`` (2),
+``ISO_NE_RETRY_BACKOFF_SEC`` (0.5), ``ISO_NE_POOL_SIZE`` (8),
+``ISO_NE_RESPONSE_FORMAT`` (``xml`` or ``json``), ``ISO_NE_INCREMENTAL`` (1; refresh the current
+day from the ``current`` endpoint instead of re-downloading it, see ``iso_ne_api``).
+"""
+
+import asyncio
+import base64
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from bittbridge.utils.iso_ne_parse import RESPONSE_FORMATS
+from bittbridge.utils.iso_ne_ratelimit import RateLimitTimeout, get_rate_limiter
+
+DEFAULT_BASE_URL = "https://webservices.iso-ne.com/api/v1.1"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Upper bound on a server-provided Retry-After so one slow response cannot stall a caller.
+MAX_RETRY_AFTER_SEC = 30.0
+
+
+class IsoNeRequestError(Exception):
+    """Raised when an ISO-NE request fails after all retries."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True)
+class IsoNeClientConfig:
+    base_url: str = DEFAULT_BASE_URL
+    username: Optional[str] = None
+    password: Optional[str] = None
+    timeout_sec: float = 30.0
+    max_retries: int = 2
+    retry_backoff_sec: float = 0.5
+    pool_size: int = 8
+    response_format: str = "xml"
+    incremental: bool = True
+
+    @classmethod
+    def from_env(cls) -> "IsoNeClientConfig":
+        return cls(
+            base_url=os.getenv("ISO_NE_BASE_URL", DEFAULT_BASE_URL).rstrip("/"),
+            username=os.getenv("ISO_NE_USERNAME"),
+            password=os.getenv("ISO_NE_PASSWORD"),
+            timeout_sec=float(os.getenv("ISO_NE_TIMEOUT_SEC", "30")),
+            max_retries=max(0, int(os.getenv("ISO_NE_MAX_RETRIES", "2"))),
+            retry_backoff_sec=float(os.getenv("ISO_NE_RETRY_BACKOFF_SEC", "0.5")),
+            pool_size=max(1, int(os.getenv("ISO_NE_POOL_SIZE", "8"))),
+            response_format=_response_format(os.getenv("ISO_NE_RESPONSE_FORMAT", "xml")),
+            incremental=os.getenv("ISO_NE_INCREMENTAL", "1").strip().lower() not in {"0", "false", "no", "off"},
+        )
+
+    @property
+    def has_credentials(self) -> bool:
+        return bool(self.username and self.password)
+
+
+def _response_format(value: str) -> str:
+    value = value.strip().lower()
+    return value if value in RESPONSE_FORMATS else "xml"
+
+
+def _retry_delay(config: IsoNeClientConfig, attempt: int, retry_after: Optional[str]) -> float:
+    delay = config.retry_backoff_sec * (2**attempt)
+    if retry_after:
+        try:
+            delay = max(delay, min(float(retry_after), MAX_RETRY_AFTER_SEC))
+        except ValueError:
+            pass
+    return delay
+
+
+def _basic_auth_header(username: str, password: str) -> str:
+    token = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
+    return f"Basic {token}"
+
+
+class IsoNeSyncClient:
+    """Thread-safe blocking client with a keep-alive connection pool and per-path coalescing."""
+
+    def __init__(self, config: Optional[IsoNeClientConfig] = None):
+        self.config = config or IsoNeClientConfig.from_env()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.config.pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if self.config.has_credentials:
+            self._session.auth = (self.config.username, self.config.password)
+        self._inflight_lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, str], "_SyncFlight"] = {}
+
+    def get_text(self, path: str, accept: str = "application/xml") -> str:
+        """GET ``{base_url}/{path}`` and return the body; joins an identical in-flight request."""
+        key = (path, accept)
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _SyncFlight()
+                self._inflight[key] = flight
+        if not leader:
+            return flight.wait()
+        try:
+            flight.result = self._get_with_retries(path, accept)
+        except BaseException as exc:
+            flight.error = exc
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+        return flight.wait()
+
+    def _get_with_retries(self, path: str, accept: str) -> str:
+        url = f"{self.config.base_url}/{path.lstrip('/')}"
+        last_error = "no attempt made"
+        last_status: Optional[int] = None
+        for attempt in range(self.config.max_retries + 1):
+            retry_after = None
+            limiter = get_rate_limiter()
+            try:
+                if limiter is not None:
+                    limiter.acquire()
+                response = self._session.get(
+                    url, headers={"Accept": accept}, timeout=self.config.timeout_sec
+                )
+                if response.status_code < 400:
+                    return response.text
+                last_status = response.status_code
+                last_error = f"HTTP {response.status_code} for {url}"
+                if response.status_code not in RETRY_STATUSES:
+                    break
+                retry_after = response.headers.get("Retry-After")
+            except RateLimitTimeout as exc:
+                raise IsoNeRequestError(f"{exc} ({url})", status=429) from exc
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                last_status = None
+                last_error = f"{type(exc).__name__} for {url}: {exc}"
+            if attempt < self.config.max_retries:
+                time.sleep(_retry_delay(self.config, attempt, retry_after))
+        raise IsoNeRequestError(last_error, status=last_status)
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class _SyncFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> str:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class IsoNeAsyncClient:
+    """
+    asyncio client with a keep-alive ``aiohttp`` connection pool and per-path coalescing.
+
+    An ``aiohttp`` session is bound to the event loop that created it, so one session (and its
+    in-flight map) is kept per loop (e.g. the miner's axon loop vs. a test). When a new loop first
+    uses the client, sessions of loops that have since closed are closed and dropped; :meth:`close`
+    closes them all.
+    """
+
+    def __init__(self, config: Optional[IsoNeClientConfig] = None):
+        self.config = config or IsoNeClientConfig.from_env()
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._inflight: Dict[asyncio.AbstractEventLoop, Dict[Tuple[str, str], asyncio.Future]] = {}
+        self._sessions_lock = threading.Lock()
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit=self.config.pool_size, keepalive_timeout=60)
+        headers = {}
+        if self.config.has_credentials:
+            headers["Authorization"] = _basic_auth_header(self.config.username, self.config.password)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout_sec),
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            session = self._sessions.get(loop)
+            if session is not None and not session.closed:
+                return session
+            stale = [(other, s) for other, s in self._sessions.items() if other is not loop and other.is_closed()]
+            for other, _ in stale:
+                del self._sessions[other]
+                self._inflight.pop(other, None)
+            session = self._sessions[loop] = self._new_session()
+            self._inflight[loop] = {}
+        for _, old in stale:
+            # The owning loop is gone: this only marks the session closed, so it is not reported unclosed.
+            await old.close()
+        return session
+
+    async def get_text(self, path: str, accept: str = "application/xml") -> str:
+        """GET ``{base_url}/{path}`` and return the body; joins an identical in-flight request."""
+        session = await self._get_session()
+        inflight = self._inflight[asyncio.get_running_loop()]
+        key = (path, accept)
+        flight = inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._get_with_retries(session, path, accept))
+            inflight[key] = flight
+            flight.add_done_callback(lambda _f, k=key: self._forget(inflight, k, _f))
+        # shield: one cancelled waiter must not cancel the request the others are sharing.
+        return await asyncio.shield(flight)
+
+    @staticmethod
+    def _forget(inflight: Dict[Tuple[str, str], asyncio.Future], key: Tuple[str, str], flight: asyncio.Future) -> None:
+        if inflight.get(key) is flight:
+            del inflight[key]
+        if not flight.cancelled():
+            flight.exception()  # mark retrieved; waiters re-raise it themselves
+
+    async def _get_with_retries(self, session: aiohttp.ClientSession, path: str, accept: str) -> str:
+        url = f"{self.config.base_url}/{path.lstrip('/')}"
+        last_error = "no attempt made"
+        last_status: Optional[int] = None
+        for attempt in range(self.config.max_retries + 1):
+            retry_after = None
+            limiter = get_rate_limiter()
+            try:
+                if limiter is not None:
+                    await limiter.acquire_async()
+                async with session.get(url, headers={"Accept": accept}) as response:
+                    if response.status < 400:
+                        return await response.text()
+                    last_status = response.status
+                    last_error = f"HTTP {response.status} for {url}"
+                    if response.status not in RETRY_STATUSES:
+                        break
+                    retry_after = response.headers.get("Retry-After")
+            except RateLimitTimeout as exc:
+                raise IsoNeRequestError(f"{exc} ({url})", status=429) from exc
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as exc:
+                last_status = None
+                last_error = f"{type(exc).__name__} for {url}: {exc}"
+            if attempt < self.config.max_retries:
+                await asyncio.sleep(_retry_delay(self.config, attempt, retry_after))
+        raise IsoNeRequestError(last_error, status=last_status)
+
+    async def close(self) -> None:
+        """Close every session: this loop's directly, those of other running loops on their own loop."""
+        current = asyncio.get_running_loop()
+        with self._sessions_lock:
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+            self._inflight.clear()
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current or loop.is_closed():
+                await session.close()
+            else:
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+
+
+_sync_client: Optional[IsoNeSyncClient] = None
+_async_client: Optional[IsoNeAsyncClient] = None
+_clients_lock = threading.Lock()
+
+
+def get_sync_client() -> IsoNeSyncClient:
+    """Process-wide blocking client configured from the environment."""
+    global _sync_client
+    if _sync_client is None:
+        with _clients_lock:
+            if _sync_client is None:
+                _sync_client = IsoNeSyncClient()
+    return _sync_client
+
+
+def get_async_client() -> IsoNeAsyncClient:
+    """Process-wide asyncio client configured from the environment."""
+    global _async_client
+    if _async_client is None:
+        with _clients_lock:
+            if _async_client is None:
+                _async_client = IsoNeAsyncClient()
+    return _async_client
+
+
+def set_clients(
+    sync_client: Optional[IsoNeSyncClient] = None,
+    async_client: Optional[IsoNeAsyncClient] = None,
+) -> None:
+    """Replace the process-wide clients (None = rebuild from the environment on next use)."""
+    global _sync_client, _async_client
+    with _clients_lock:
+        _sync_client = sync_client
+        _async_client = async_client
@@ -0,0 +1,147 @@
+"""
+Slot-indexed representation of one ISO-NE Eastern day of Five Minute System Load.
+
+Each day is a fixed-length array with one entry per five-minute interval plus a validity mask,
+so looking up the load for a timestamp is integer arithmetic on the slot index instead of a scan
+over ``(datetime, load_mw)`` tuples.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from pytz import timezone
+
+UTC = timezone("UTC")
+EASTERN = timezone("America/New_York")
+
+SLOT_MINUTES = 5
+SLOT_SECONDS = SLOT_MINUTES * 60
+
+
+def day_bounds_utc(day_yyyymmdd: str) -> Tuple[datetime, datetime]:
+    """Start and end (exclusive) of an Eastern calendar day, as UTC datetimes. DST-aware."""
+    naive = datetime.strptime(day_yyyymmdd, "%Y%m%d")
+    start = EASTERN.localize(naive)
+    end = EASTERN.localize(naive + timedelta(days=1))
+    return start.astimezone(UTC), end.astimezone(UTC)
+
+
+def expected_slots(day_yyyymmdd: str) -> int:
+    """Number of five-minute intervals in an Eastern day (288, or 276 / 300 on DST switch days)."""
+    start, end = day_bounds_utc(day_yyyymmdd)
+    return int((end - start).total_seconds()) // SLOT_SECONDS
+
+
+def eastern_day_for_epoch(epoch: float) -> str:
+    """YYYYMMDD of the Eastern day containing a POSIX timestamp."""
+    return datetime.fromtimestamp(epoch, tz=EASTERN).strftime("%Y%m%d")
+
+
+@dataclass
+class DayLoad:
+    """
+    One Eastern day of five-minute load values.
+
+    ``values[i]`` is the LoadMw of the interval starting ``start_epoch + i * 300`` seconds;
+    ``valid[i]`` is False for intervals ISO-NE has not published (yet).
+    Values are float64 so lookups return exactly what the API reported.
+    """
+
+    day: str
+    start_epoch: int
+    values: np.ndarray
+    valid: np.ndarray
+
+    @classmethod
+    def empty(cls, day_yyyymmdd: str) -> "DayLoad":
+        start, _ = day_bounds_utc(day_yyyymmdd)
+        n = expected_slots(day_yyyymmdd)
+        return cls(
+            day=day_yyyymmdd,
+            start_epoch=int(start.timestamp()),
+            values=np.zeros(n, dtype=np.float64),
+            valid=np.zeros(n, dtype=bool),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        day_yyyymmdd: str,
+        begin_epochs: Iterable[int],
+        loads: Iterable[float],
+    ) -> "DayLoad":
+        """Build from parallel arrays of interval start (POSIX seconds) and LoadMw."""
+        out = cls.empty(day_yyyymmdd)
+        epochs = np.asarray(begin_epochs, dtype=np.int64)
+        vals = np.asarray(loads, dtype=np.float64)
+        if epochs.size == 0:
+            return out
+        offsets = epochs - out.start_epoch
+        idx = offsets // SLOT_SECONDS
+        keep = (offsets % SLOT_SECONDS == 0) & (idx >= 0) & (idx < out.values.size)
+        out.values[idx[keep]] = vals[keep]
+        out.valid[idx[keep]] = True
+        return out
+
+    @classmethod
+    def from_pairs(cls, day_yyyymmdd: str, pairs: List[Tuple[datetime, float]]) -> "DayLoad":
+        """Build from the legacy list of ``(datetime_utc, load_mw)`` tuples."""
+        epochs = [int(dt.timestamp()) for dt, _ in pairs]
+        loads = [float(v) for _, v in pairs]
+        return cls.from_arrays(day_yyyymmdd, epochs, loads)
+
+    def merged(self, begin_epochs: Iterable[int], loads: Iterable[float]) -> "DayLoad":
+        """Copy of this day with the given intervals written in (same rules as ``from_arrays``)."""
+        update = DayLoad.from_arrays(self.day, begin_epochs, loads)
+        return DayLoad(
+            day=self.day,
+            start_epoch=self.start_epoch,
+            values=np.where(update.valid, update.values, self.values),
+            valid=self.valid | update.valid,
+        )
+
+    @property
+    def newest_epoch(self) -> Optional[int]:
+        """Start of the latest published interval, or None when nothing is published."""
+        idx = np.flatnonzero(self.valid)
+        if idx.size == 0:
+            return None
+        return self.start_epoch + int(idx[-1]) * SLOT_SECONDS
+
+    @property
+    def n_valid(self) -> int:
+        return int(self.valid.sum())
+
+    @property
+    def is_complete(self) -> bool:
+        return bool(self.valid.all())
+
+    def slot_index(self, epoch: float) -> Optional[int]:
+        """Slot for a POSIX timestamp (floored to its five-minute interval), or None if outside the day."""
+        idx = int(epoch - self.start_epoch) // SLOT_SECONDS
+        if idx < 0 or idx >= self.values.size:
+            return None
+        return idx
+
+    def get(self, epoch: float) -> Optional[float]:
+        """LoadMw for the interval containing ``epoch``, or None when unpublished / outside the day."""
+        idx = self.slot_index(epoch)
+        if idx is None or not self.valid[idx]:
+            return None
+        return float(self.values[idx])
+
+    def valid_epochs(self) -> np.ndarray:
+        idx = np.flatnonzero(self.valid)
+        return self.start_epoch + idx.astype(np.int64) * SLOT_SECONDS
+
+    def valid_values(self) -> np.ndarray:
+        return self.values[self.valid]
+
+    def to_pairs(self) -> List[Tuple[datetime, float]]:
+        """Legacy ``[(datetime_utc, load_mw), ...]`` view, sorted by time."""
+        return [
+            (datetime.fromtimestamp(int(epoch), tz=UTC), float(value))
+            for epoch, value in zip(self.valid_epochs(), self.valid_values())
+        ]
@@ -0,0 +1,232 @@
+"""
+Local partitioned history of ISO-NE Five Minute System Load.
+
+One file per Eastern day under ``{root}/year=YYYY/month=MM/day=YYYYMMDD.parquet`` with columns
+``begin_epoch`` (int64, interval start in POSIX seconds) and ``load_mw`` (float64). Parquet is used
+when pyarrow is installed, CSV otherwise (same layout, ``.csv`` suffix). Files are written to a
+temporary name and renamed into place, so a partition either exists complete or not at all, and
+an interrupted backfill resumes by skipping the days already on disk. A day ISO-NE published with
+gaps is written with a ``.day=YYYYMMDD.incomplete`` marker next to it and refetched on the next
+run until it is complete.
+
+:func:`backfill` fetches a range of closed days concurrently through the pooled asyncio client
+(``iso_ne_client``), which can point at the real API or a local stand-in via its ``base_url``.
+:func:`read_history` loads a range back as one DataFrame for training, backtests or replay.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from bittbridge.utils.iso_ne_client import IsoNeAsyncClient, IsoNeClientConfig
+from bittbridge.utils.iso_ne_day import DayLoad
+from bittbridge.utils.iso_ne_parse import ACCEPT_HEADERS, parse_response
+from bittbridge.utils.iso_ne_store import is_day_closed
+
+
+def _parquet_supported() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+
+        return True
+    except Exception:
+        return False
+
+
+def day_range(start_day: str, end_day: str) -> List[str]:
+    """Inclusive list of YYYYMMDD days."""
+    start = datetime.strptime(start_day, "%Y%m%d")
+    end = datetime.strptime(end_day, "%Y%m%d")
+    return [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range((end - start).days + 1)]
+
+
+def _partition_dir(root: Path, day_yyyymmdd: str) -> Path:
+    return root / f"year={day_yyyymmdd[:4]}" / f"month={day_yyyymmdd[4:6]}"
+
+
+def partition_path(root: str, day_yyyymmdd: str) -> Optional[Path]:
+    """Existing partition file for a day (parquet or CSV), or None."""
+    base = _partition_dir(Path(root), day_yyyymmdd) / f"day={day_yyyymmdd}"
+    for suffix in (".parquet", ".csv"):
+        path = base.with_suffix(suffix)
+        if path.exists():
+            return path
+    return None
+
+
+def _incomplete_marker(root: str, day_yyyymmdd: str) -> Path:
+    return _partition_dir(Path(root), day_yyyymmdd) / f".day={day_yyyymmdd}.incomplete"
+
+
+def is_partition_incomplete(root: str, day_yyyymmdd: str) -> bool:
+    """True when the day's partition was written with gaps (see :func:`write_day_partition`)."""
+    return _incomplete_marker(root, day_yyyymmdd).exists()
+
+
+def write_day_partition(root: str, day_load: DayLoad) -> Path:
+    """
+    Atomically write the published intervals of one day; returns the partition path.
+
+    A day with gaps is marked incomplete (the marker is created before the file is replaced, so
+    a crash in between still leaves the day to be retried); a complete day clears the marker.
+    """
+    out_dir = _partition_dir(Path(root), day_load.day)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    frame = pd.DataFrame({"begin_epoch": day_load.valid_epochs(), "load_mw": day_load.valid_values()})
+    suffix = ".parquet" if _parquet_supported() else ".csv"
+    path = out_dir / f"day={day_load.day}{suffix}"
+    tmp = out_dir / f".day={day_load.day}{suffix}.{os.getpid()}.tmp"
+    if suffix == ".parquet":
+        frame.to_parquet(tmp, index=False)
+    else:
+        frame.to_csv(tmp, index=False)
+    marker = _incomplete_marker(root, day_load.day)
+    if not day_load.is_complete:
+        marker.touch()
+    os.replace(tmp, path)
+    if day_load.is_complete:
+        marker.unlink(missing_ok=True)
+    return path
+
+
+def _read_partition(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype={"begin_epoch": np.int64, "load_mw": np.float64})
+
+
+def read_day_partition(root: str, day_yyyymmdd: str) -> Optional[DayLoad]:
+    """One day from the local history as a :class:`DayLoad`, or None when it is not on disk."""
+    path = partition_path(root, day_yyyymmdd)
+    if path is None:
+        return None
+    frame = _read_partition(path)
+    return DayLoad.from_arrays(day_yyyymmdd, frame["begin_epoch"].to_numpy(), frame["load_mw"].to_numpy())
+
+
+def read_history(root: str, start_day: str, end_day: str) -> pd.DataFrame:
+    """
+    Load days ``start_day..end_day`` (inclusive) from the local history.
+
+    Returns columns ``begin_utc`` (tz-aware UTC timestamps) and ``load_mw``, sorted by time.
+    Days without a partition are simply absent.
+    """
+    frames = []
+    for day in day_range(start_day, end_day):
+        path = partition_path(root, day)
+        if path is not None:
+            frames.append(_read_partition(path))
+    if not frames:
+        return pd.DataFrame({"begin_utc": pd.Series([], dtype="datetime64[ns, UTC]"), "load_mw": []})
+    data = pd.concat(frames, ignore_index=True).sort_values("begin_epoch", kind="stable")
+    return pd.DataFrame(
+        {
+            "begin_utc": pd.to_datetime(data["begin_epoch"].to_numpy(), unit="s", utc=True),
+            "load_mw": data["load_mw"].to_numpy(dtype=np.float64),
+        }
+    )
+
+
+class _AsyncRateLimiter:
+    """Evenly spaces request starts at ``rate_per_sec`` (<= 0 disables)."""
+
+    def __init__(self, rate_per_sec: float):
+        self._interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@dataclass
+class BackfillReport:
+    written: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    incomplete: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    # Failed day -> why, e.g. "fetch: RuntimeError: HTTP 401 ..." or "write: OSError: ...".
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+async def backfill(
+    root: str,
+    days: List[str],
+    config: Optional[IsoNeClientConfig] = None,
+    concurrency: int = 4,
+    rate_per_sec: float = 2.0,
+    on_day: Optional[Callable[[str, str], None]] = None,
+) -> BackfillReport:
+    """
+    Fetch ``days`` that are not yet on disk and write one partition per day.
+
+    Uses its own pooled client built from ``config`` (default: environment), so the API or a
+    local stand-in is chosen by ``config.base_url``.
+
+    Days that are not closed yet are skipped (they would change later), as are days already on
+    disk unless they were written incomplete, which are fetched again. At most ``concurrency``
+    requests are in flight and request starts are spaced to ``rate_per_sec``. ``on_day(day,
+    status)`` is called as each day finishes, with status ``written``, ``incomplete`` (written,
+    but ISO-NE had gaps), ``skipped`` or ``failed`` (fetch or write failed; any earlier
+    partition of the day is left as it was, and the reason is kept in ``report.errors``).
+    """
+    client = IsoNeAsyncClient(config)
+    fmt = client.config.response_format
+    limiter = _AsyncRateLimiter(rate_per_sec)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    report = BackfillReport()
+
+    def _done(day: str, status: str) -> None:
+        getattr(report, status).append(day)
+        if on_day is not None:
+            on_day(day, status)
+
+    def _failed(day: str, error: str) -> None:
+        report.errors[day] = error
+        _done(day, "failed")
+
+    async def _one(day: str) -> None:
+        on_disk = partition_path(root, day) is not None and not is_partition_incomplete(root, day)
+        if on_disk or not is_day_closed(day):
+            _done(day, "skipped")
+            return
+        async with semaphore:
+            await limiter.acquire()
+            try:
+                text = await client.get_text(f"fiveminutesystemload/day/{day}", ACCEPT_HEADERS[fmt])
+                epochs, loads = parse_response(text, fmt)
+                day_load = DayLoad.from_arrays(day, epochs, loads)
+            except Exception as e:
+                _failed(day, f"fetch: {type(e).__name__}: {e}")
+                return
+        if not day_load.n_valid:
+            _failed(day, "fetch: response had no valid intervals")
+            return
+        try:
+            await asyncio.to_thread(write_day_partition, root, day_load)
+        except Exception as e:
+            _failed(day, f"write: {type(e).__name__}: {e}")
+            return
+        _done(day, "written" if day_load.is_complete else "incomplete")
+
+    try:
+        await asyncio.gather(*(_one(day) for day in days))
+    finally:
+        await client.close()
+    for days_list in (report.written, report.skipped, report.incomplete, report.failed):
+        days_list.sort()
+    return report
@@ -0,0 +1,240 @@
+"""
+Local stand-in for the ISO-NE Web Services five-minute system load API.
+
+Serves ``fiveminutesystemload/day/{YYYYMMDD}`` and ``fiveminutesystemload/current`` in the real
+XML / JSON schema (``Accept: application/json`` or a ``.json`` / ``.xml`` suffix), so
+``iso_ne_api``, the miner baseline, the validator's ground truth and the backfill can be exercised
+and benchmarked without credentials or network. Point the clients at it with
+``ISO_NE_BASE_URL=http://127.0.0.1:<port>``.
+
+Data comes from a local history written by ``scripts/backfill_iso_ne.py`` (``history_root``) or,
+for days not on disk, from a deterministic synthetic load curve. Behaviour knobs on
+:class:`StandInConfig`: response latency and jitter, the fraction of requests answered with 503
+or 429, and publication lag (an interval only appears ``publish_lag_sec`` after it ends).
+
+Run standalone with ``python scripts/iso_ne_standin.py``; in tests use
+:meth:`IsoNeStandIn.start` (asyncio) or :meth:`IsoNeStandIn.start_in_thread`.
+"""
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from aiohttp import web
+
+from bittbridge.utils.iso_ne_day import EASTERN, SLOT_SECONDS, DayLoad, eastern_day_for_epoch
+from bittbridge.utils.iso_ne_history import read_day_partition
+from bittbridge.utils.iso_ne_parse import ISO_NE_NAMESPACE
+
+# Columns of one FiveMinSystemLoad row, in the order ISO-NE returns them.
+ROW_FIELDS = ("BeginDate", "LoadMw", "NativeLoad", "ArdDemand", "SystemLoadBtmPv", "NativeLoadBtmPv")
+
+
+@dataclass
+class StandInConfig:
+    latency_sec: float = 0.0
+    latency_jitter_sec: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_sec: float = 1.0
+    publish_lag_sec: float = 0.0
+    history_root: Optional[str] = None
+    seed: Optional[int] = None
+
+
+def synthetic_load_mw(epochs: np.ndarray) -> np.ndarray:
+    """Deterministic New-England-like daily load curve (MW) for interval start epochs."""
+    epochs = np.asarray(epochs, dtype=np.float64)
+    hours = (epochs / 3600.0 - 5.0) % 24.0
+    days = np.floor((epochs / 3600.0 - 5.0) / 24.0)
+    daily = 2600.0 * np.sin(2.0 * math.pi * (hours - 10.0) / 24.0)
+    weekly = 350.0 * np.sin(2.0 * math.pi * days / 7.0)
+    return np.round(13500.0 + daily + weekly, 3)
+
+
+def day_rows(day_load: DayLoad) -> List[Dict[str, object]]:
+    """FiveMinSystemLoad rows (real field names, Eastern ISO timestamps) for the valid intervals."""
+    rows = []
+    for epoch, load in zip(day_load.valid_epochs(), day_load.valid_values()):
+        begin = datetime.fromtimestamp(int(epoch), tz=EASTERN)
+        load = round(float(load), 3)
+        rows.append(
+            {
+                "BeginDate": begin.isoformat(timespec="milliseconds"),
+                "LoadMw": load,
+                "NativeLoad": round(load + 410.25, 3),
+                "ArdDemand": 28.5,
+                "SystemLoadBtmPv": round(load + 610.75, 3),
+                "NativeLoadBtmPv": round(load + 1021.0, 3),
+            }
+        )
+    return rows
+
+
+def render_xml(rows: List[Dict[str, object]]) -> str:
+    body = "".join(
+        "<FiveMinSystemLoad>" + "".join(f"<{k}>{row[k]}</{k}>" for k in ROW_FIELDS) + "</FiveMinSystemLoad>"
+        for row in rows
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<FiveMinSystemLoads xmlns="{ISO_NE_NAMESPACE}">{body}</FiveMinSystemLoads>'
+    )
+
+
+def render_json(rows: List[Dict[str, object]]) -> str:
+    return json.dumps({"FiveMinSystemLoads": {"FiveMinSystemLoad": rows}})
+
+
+class IsoNeStandIn:
+    """aiohttp application imitating the ISO-NE five-minute system load endpoints."""
+
+    def __init__(self, config: Optional[StandInConfig] = None, now: Callable[[], float] = time.time):
+        self.config = config or StandInConfig()
+        self.now = now
+        self.requests: Counter = Counter()
+        self.injected: Counter = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.base_url: Optional[str] = None
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/fiveminutesystemload/day/{day}", self._handle_day)
+        app.router.add_get("/fiveminutesystemload/current", self._handle_current)
+        app.router.add_get("/fiveminutesystemload/current.{fmt}", self._handle_current)
+        return app
+
+    def _full_day(self, day_yyyymmdd: str) -> DayLoad:
+        if self.config.history_root:
+            recorded = read_day_partition(self.config.history_root, day_yyyymmdd)
+            if recorded is not None:
+                return recorded
+        day_load = DayLoad.empty(day_yyyymmdd)
+        epochs = day_load.start_epoch + SLOT_SECONDS * np.arange(day_load.values.size, dtype=np.int64)
+        return DayLoad.from_arrays(day_yyyymmdd, epochs, synthetic_load_mw(epochs))
+
+    def published_day(self, day_yyyymmdd: str) -> DayLoad:
+        """The day as a client would see it now: intervals appear ``publish_lag_sec`` after they end."""
+        day_load = self._full_day(day_yyyymmdd)
+        cutoff = self.now() - self.config.publish_lag_sec - SLOT_SECONDS
+        epochs = day_load.valid_epochs()
+        visible = epochs <= cutoff
+        return DayLoad.from_arrays(day_yyyymmdd, epochs[visible], day_load.valid_values()[visible])
+
+    async def _misbehave(self) -> Optional[web.Response]:
+        cfg = self.config
+        delay = cfg.latency_sec + (self._rng.uniform(0.0, cfg.latency_jitter_sec) if cfg.latency_jitter_sec else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        roll = self._rng.random()
+        if roll < cfg.throttle_rate:
+            self.injected[429] += 1
+            return web.Response(status=429, headers={"Retry-After": f"{cfg.retry_after_sec:g}"})
+        if roll < cfg.throttle_rate + cfg.error_rate:
+            self.injected[503] += 1
+            return web.Response(status=503)
+        return None
+
+    @staticmethod
+    def _wants_json(request: web.Request, suffix: str) -> bool:
+        if suffix:
+            return suffix == "json"
+        return "application/json" in request.headers.get("Accept", "")
+
+    def _respond(self, rows, as_json: bool) -> web.Response:
+        if as_json:
+            return web.Response(text=render_json(rows), content_type="application/json")
+        return web.Response(text=render_xml(rows), content_type="application/xml")
+
+    async def _handle_day(self, request: web.Request) -> web.Response:
+        day, _, suffix = request.match_info["day"].partition(".")
+        self.requests[f"day/{day}"] += 1
+        failure = await self._misbehave()
+        if failure is not None:
+            return failure
+        try:
+            datetime.strptime(day, "%Y%m%d")
+        except ValueError:
+            return web.Response(status=400, text=f"bad day {day!r}")
+        return self._respond(day_rows(self.published_day(day)), self._wants_json(request, suffix))
+
+    async def _handle_current(self, request: web.Request) -> web.Response:
+        self.requests["current"] += 1
+        failure = await self._misbehave()
+        if failure is not None:
+            return failure
+        cutoff = self.now() - self.config.publish_lag_sec - SLOT_SECONDS
+        day_load = self.published_day(eastern_day_for_epoch(cutoff))
+        newest = day_load.newest_epoch
+        rows = []
+        if newest is not None:
+            rows = day_rows(DayLoad.from_arrays(day_load.day, [newest], [day_load.get(newest)]))
+        return self._respond(rows, self._wants_json(request, request.match_info.get("fmt", "")))
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving on the running loop; returns the base URL (port 0 = pick a free one)."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Serve from a background thread with its own event loop (for blocking callers).
+
+        Raises whatever :meth:`start` raised in the thread (e.g. ``OSError`` when the port is taken).
+        """
+        started = threading.Event()
+        failure: List[BaseException] = []
+        loop = asyncio.new_event_loop()
+
+        def _serve() -> None:
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.start(host, port))
+            except BaseException as exc:
+                failure.append(exc)
+                loop.run_until_complete(self.stop())
+                loop.close()
+                return
+            finally:
+                started.set()
+            loop.run_forever()
+            loop.run_until_complete(self.stop())
+            loop.close()
+
+        thread = threading.Thread(target=_serve, name="iso-ne-standin", daemon=True)
+        thread.start()
+        started.wait()
+        if failure:
+            thread.join()
+            raise failure[0]
+        self._loop, self._thread = loop, thread
+        return self.base_url
+
+    def stop_thread(self, timeout: float = 5.0) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._thread = None
+            self._loop = None
+
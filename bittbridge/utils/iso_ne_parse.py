@@ -0,0 +1,133 @@
+"""
+Fast parsers for ISO-NE Five Minute System Load responses.
+
+Both parsers return parallel NumPy arrays ``(begin_epochs int64, load_mw float64)`` that feed
+:meth:`DayLoad.from_arrays` directly:
+
+- :func:`parse_xml_arrays` makes one pass over the XML rows using the fixed
+  ``http://WEBSERV.iso-ne.com`` namespace (picked once from the root tag), with exact-tag
+  lookups instead of per-row namespace fallbacks.
+- :func:`parse_json_arrays` reads the JSON representation served for ``Accept: application/json``.
+
+``BeginDate`` strings (e.g. ``2026-03-09T00:00:00.000-04:00``) are converted in bulk: the local
+wall-clock part goes through NumPy ``datetime64[s]`` in one call and the UTC offset is looked up
+from the handful of distinct suffixes in the payload, instead of ``fromisoformat`` per row.
+"""
+
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+ISO_NE_NAMESPACE = "http://WEBSERV.iso-ne.com"
+RESPONSE_FORMATS = ("xml", "json")
+ACCEPT_HEADERS = {"xml": "application/xml", "json": "application/json"}
+
+_NS_PREFIX = f"{{{ISO_NE_NAMESPACE}}}"
+
+LoadArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def _empty_arrays() -> LoadArrays:
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+
+def _offset_seconds(suffix: str) -> int:
+    """UTC offset in seconds from the part of a timestamp after ``YYYY-MM-DDTHH:MM:SS``."""
+    if suffix.startswith("."):
+        suffix = suffix.lstrip(".0123456789")
+    if not suffix or suffix in ("Z", "z"):
+        return 0  # no offset: treat as UTC, like the per-row parser did
+    sign = -1 if suffix[0] == "-" else 1
+    hours, _, minutes = suffix[1:].partition(":")
+    return sign * (int(hours) * 3600 + int(minutes or 0) * 60)
+
+
+def parse_timestamps(begin_dates: List[str]) -> np.ndarray:
+    """Convert ISO-8601 ``BeginDate`` strings to POSIX seconds (int64) in bulk."""
+    if not begin_dates:
+        return np.empty(0, dtype=np.int64)
+    local = np.array(begin_dates, dtype="U19").astype("datetime64[s]").astype(np.int64)
+    offsets: Dict[str, int] = {}
+    shift = np.empty(len(begin_dates), dtype=np.int64)
+    for i, value in enumerate(begin_dates):
+        suffix = value[19:]
+        offset = offsets.get(suffix)
+        if offset is None:
+            offset = offsets[suffix] = _offset_seconds(suffix)
+        shift[i] = offset
+    return local - shift
+
+
+def _to_arrays(begin_dates: List[str], loads: List) -> LoadArrays:
+    if not begin_dates:
+        return _empty_arrays()
+    try:
+        return parse_timestamps(begin_dates), np.asarray(loads, dtype=np.float64)
+    except ValueError:
+        pass
+    # A malformed row somewhere: fall back to row-by-row and drop the bad ones.
+    epochs, values = [], []
+    for begin, load in zip(begin_dates, loads):
+        try:
+            dt = datetime.fromisoformat(begin.replace("Z", "+00:00"))
+            epoch = dt.timestamp() if dt.tzinfo is not None else _naive_utc_epoch(dt)
+            value = float(load)
+        except (ValueError, TypeError):
+            continue
+        epochs.append(int(epoch))
+        values.append(value)
+    return np.asarray(epochs, dtype=np.int64), np.asarray(values, dtype=np.float64)
+
+
+def _naive_utc_epoch(dt: datetime) -> float:
+    return (dt - datetime(1970, 1, 1)).total_seconds()
+
+
+def parse_xml_arrays(payload: Union[str, bytes]) -> LoadArrays:
+    """Single pass over the rows of an XML ``FiveMinSystemLoads`` document."""
+    root = ET.fromstring(payload)
+    # A pull parser was measured slower than expat's C tree builder on full-day payloads
+    # (~70 KiB), so the tree is built in one C call and only the rows are walked in Python.
+    prefix = _NS_PREFIX if root.tag.startswith(_NS_PREFIX) else ""
+    row_tag = f"{prefix}FiveMinSystemLoad"
+    begin_tag = f"{prefix}BeginDate"
+    load_tag = f"{prefix}LoadMw"
+
+    begin_dates: List[str] = []
+    loads: List[str] = []
+    for row in root.iter(row_tag):
+        begin = row.findtext(begin_tag)
+        load = row.findtext(load_tag)
+        if begin and load:
+            begin_dates.append(begin.strip())
+            loads.append(load)
+    return _to_arrays(begin_dates, loads)
+
+
+def parse_json_arrays(payload: Union[str, bytes]) -> LoadArrays:
+    """Parse the JSON representation: ``{"FiveMinSystemLoads": {"FiveMinSystemLoad": [...]}}``."""
+    doc = json.loads(payload)
+    rows = doc.get("FiveMinSystemLoads", doc) if isinstance(doc, dict) else doc
+    if isinstance(rows, dict):
+        rows = rows.get("FiveMinSystemLoad", [])
+    if isinstance(rows, dict):
+        rows = [rows]  # a single interval is serialized as an object, not a list
+    begin_dates: List[str] = []
+    loads: List = []
+    for row in rows or []:
+        begin = row.get("BeginDate")
+        load = row.get("LoadMw")
+        if begin and load is not None:
+            begin_dates.append(begin)
+            loads.append(load)
+    return _to_arrays(begin_dates, loads)
+
+
+def parse_response(payload: Union[str, bytes], response_format: str = "xml") -> LoadArrays:
+    """Dispatch on ``response_format`` (``"xml"`` or ``"json"``)."""
+    if response_format == "json":
+        return parse_json_arrays(payload)
+    return parse_xml_arrays(payload)
@@ -0,0 +1,202 @@
+"""
+Host-wide token-bucket rate limiter for ISO-NE requests.
+
+Every bittbridge process on a machine (several miners, a validator, a backfill) shares one bucket
+stored in a small state file. Taking a token locks the file with ``fcntl.flock``, refills the
+bucket from the elapsed wall-clock time, and writes it back, so the combined request rate to
+ISO-NE stays under ``rate`` per second with bursts of up to ``burst`` requests. On platforms
+without ``fcntl`` the bucket is shared between threads of one process only.
+
+Time spent waiting for a token is recorded in :class:`RateLimiterStats` (logged by the validator
+and sent to W&B), so upstream pressure is visible. A single wait is bounded by ``max_wait_sec``;
+past that the request fails with :class:`RateLimitTimeout` instead of queueing indefinitely.
+
+Settings (optional): ``ISO_NE_RATE_LIMIT_PER_SEC`` (4), ``ISO_NE_RATE_LIMIT_BURST`` (8),
+``ISO_NE_RATE_LIMIT_MAX_WAIT_SEC`` (30), ``ISO_NE_RATE_LIMIT_PATH`` (default
+``~/.bittbridge/iso_ne/ratelimit.state``; ``off`` disables the limiter).
+"""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: per-process limiting only
+    fcntl = None
+
+DEFAULT_RATE_LIMIT_PATH = str(Path.home() / ".bittbridge" / "iso_ne" / "ratelimit.state")
+DEFAULT_RATE_PER_SEC = 4.0
+DEFAULT_BURST = 8.0
+DEFAULT_MAX_WAIT_SEC = 30.0
+
+# tokens available, wall-clock time of the last refill
+_STATE = struct.Struct("<dd")
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a token is not available within ``max_wait_sec``."""
+
+
+@dataclass
+class RateLimiterStats:
+    acquired: int = 0
+    throttled: int = 0
+    timeouts: int = 0
+    wait_sec_total: float = 0.0
+    wait_sec_max: float = 0.0
+
+    def as_dict(self, prefix: str = "") -> Dict[str, float]:
+        return {f"{prefix}{k}": v for k, v in asdict(self).items()}
+
+
+class HostRateLimiter:
+    def __init__(
+        self,
+        path: str,
+        rate_per_sec: float = DEFAULT_RATE_PER_SEC,
+        burst: float = DEFAULT_BURST,
+        max_wait_sec: float = DEFAULT_MAX_WAIT_SEC,
+    ):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.path = path
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(1.0, burst)
+        self.max_wait_sec = max_wait_sec
+        self.stats = RateLimiterStats()
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._local_state = (self.burst, time.time())
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _read_state(self, fd: Optional[int]) -> tuple:
+        if fd is None:
+            return self._local_state
+        raw = os.pread(fd, _STATE.size, 0)
+        if len(raw) < _STATE.size:
+            return self.burst, time.time()
+        return _STATE.unpack(raw)
+
+    def _write_state(self, fd: Optional[int], tokens: float, stamp: float) -> None:
+        if fd is None:
+            self._local_state = (tokens, stamp)
+        else:
+            os.pwrite(fd, _STATE.pack(tokens, stamp), 0)
+
+    def _take(self) -> float:
+        """Take a token if one is available (returns 0.0), else return seconds until one is."""
+        # flock is per open file, so threads of this process also need the thread lock.
+        with self._lock:
+            fd = self._open() if fcntl is not None else None
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                tokens, stamp = self._read_state(fd)
+                now = time.time()
+                tokens = min(self.burst, tokens + max(0.0, now - stamp) * self.rate_per_sec)
+                if tokens >= 1.0:
+                    self._write_state(fd, tokens - 1.0, now)
+                    return 0.0
+                self._write_state(fd, tokens, now)
+                return (1.0 - tokens) / self.rate_per_sec
+            finally:
+                if fd is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _record(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.stats.timeouts += 1
+            else:
+                self.stats.acquired += 1
+            if waited > 0:
+                self.stats.throttled += 1
+                self.stats.wait_sec_total += waited
+                self.stats.wait_sec_max = max(self.stats.wait_sec_max, waited)
+
+    def acquire(self) -> float:
+        """Block until a token is taken; returns seconds waited. Raises RateLimitTimeout."""
+        start = time.monotonic()
+        waited = 0.0
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                self._record(waited)
+                return waited
+            if waited + wait > self.max_wait_sec:
+                self._record(waited, timed_out=True)
+                raise RateLimitTimeout(f"ISO-NE rate limit: no token within {self.max_wait_sec:.0f}s")
+            time.sleep(wait)
+            waited = time.monotonic() - start
+
+    async def acquire_async(self) -> float:
+        """
+        asyncio counterpart of :meth:`acquire`. The state file lock is taken in a worker thread
+        and the wait is an ``asyncio.sleep``, so another process holding the lock never stalls the loop.
+        """
+        start = time.monotonic()
+        waited = 0.0
+        while True:
+            wait = await asyncio.to_thread(self._take)
+            if wait <= 0:
+                self._record(waited)
+                return waited
+            if waited + wait > self.max_wait_sec:
+                self._record(waited, timed_out=True)
+                raise RateLimitTimeout(f"ISO-NE rate limit: no token within {self.max_wait_sec:.0f}s")
+            await asyncio.sleep(wait)
+            waited = time.monotonic() - start
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+_limiter: Optional[HostRateLimiter] = None
+_limiter_initialized = False
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[HostRateLimiter]:
+    """Process-wide limiter built from the environment; None when disabled or unusable."""
+    global _limiter, _limiter_initialized
+    if _limiter_initialized:
+        return _limiter
+    with _limiter_lock:
+        if not _limiter_initialized:
+            path = os.getenv("ISO_NE_RATE_LIMIT_PATH", DEFAULT_RATE_LIMIT_PATH).strip()
+            if path and path.lower() not in {"off", "none", "false", "0"}:
+                try:
+                    _limiter = HostRateLimiter(
+                        path,
+                        rate_per_sec=float(os.getenv("ISO_NE_RATE_LIMIT_PER_SEC", str(DEFAULT_RATE_PER_SEC))),
+                        burst=float(os.getenv("ISO_NE_RATE_LIMIT_BURST", str(DEFAULT_BURST))),
+                        max_wait_sec=float(
+                            os.getenv("ISO_NE_RATE_LIMIT_MAX_WAIT_SEC", str(DEFAULT_MAX_WAIT_SEC))
+                        ),
+                    )
+                except (OSError, ValueError):
+                    _limiter = None
+            _limiter_initialized = True
+    return _limiter
+
+
+def set_rate_limiter(limiter: Optional[HostRateLimiter]) -> None:
+    """Override the process-wide limiter (None disables it). Mainly for tests."""
+    global _limiter, _limiter_initialized
+    with _limiter_lock:
+        _limiter = limiter
+        _limiter_initialized = True
@@ -0,0 +1,162 @@
+"""
+Durable on-disk store for ISO-NE Five Minute System Load days.
+
+Fully elapsed Eastern days never change once ISO-NE has published every interval, so they are
+written once to a local SQLite file and served from disk on every later request (including after
+a miner/validator restart). The current Eastern day is never persisted: it stays refreshable
+through the API.
+
+Location: ``ISO_NE_STORE_PATH`` from the environment (default
+``~/.bittbridge/iso_ne/fiveminutesystemload.sqlite3``). Set it to ``off`` to disable the store.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from bittbridge.utils.iso_ne_day import (  # noqa: F401 - re-exported for callers of the store
+    EASTERN,
+    UTC,
+    DayLoad,
+    day_bounds_utc,
+    expected_slots,
+)
+
+DEFAULT_STORE_PATH = str(Path.home() / ".bittbridge" / "iso_ne" / "fiveminutesystemload.sqlite3")
+# A day only counts as closed once this long has passed after Eastern midnight (publication lag).
+CLOSED_DAY_SETTLE = timedelta(hours=1)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS days (
+        day TEXT PRIMARY KEY,
+        fetched_at REAL NOT NULL,
+        n_rows INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS loads (
+        day TEXT NOT NULL,
+        begin_epoch INTEGER NOT NULL,
+        load_mw REAL NOT NULL,
+        PRIMARY KEY (day, begin_epoch)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def is_day_closed(day_yyyymmdd: str, now: Optional[datetime] = None) -> bool:
+    """True once the Eastern day has fully elapsed (plus the publication settle margin)."""
+    if now is None:
+        now = datetime.now(UTC)
+    _, end = day_bounds_utc(day_yyyymmdd)
+    return now >= end + CLOSED_DAY_SETTLE
+
+
+class IsoNeDayStore:
+    """
+    SQLite-backed store of closed ISO-NE days.
+
+    Safe to share between threads and between processes on one host (WAL journal, busy timeout).
+    """
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for stmt in _SCHEMA:
+                conn.execute(stmt)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_day(self, day_yyyymmdd: str) -> Optional[DayLoad]:
+        """Return a stored closed day, or None when the day is not in the store."""
+        with self._lock, self._connect() as conn:
+            meta = conn.execute("SELECT n_rows FROM days WHERE day = ?", (day_yyyymmdd,)).fetchone()
+            if meta is None:
+                return None
+            rows = conn.execute(
+                "SELECT begin_epoch, load_mw FROM loads WHERE day = ? ORDER BY begin_epoch",
+                (day_yyyymmdd,),
+            ).fetchall()
+        return DayLoad.from_arrays(
+            day_yyyymmdd,
+            [epoch for epoch, _ in rows],
+            [load_mw for _, load_mw in rows],
+        )
+
+    def put_day(self, day_load: DayLoad, fetched_at: Optional[datetime] = None) -> bool:
+        """
+        Persist a day if it is closed and complete. Returns True when the day was written.
+        Open or partially published days are ignored so they keep being refetched.
+        """
+        day_yyyymmdd = day_load.day
+        if fetched_at is None:
+            fetched_at = datetime.now(UTC)
+        if not is_day_closed(day_yyyymmdd, fetched_at):
+            return False
+        if not day_load.is_complete:
+            return False
+        payload = [
+            (day_yyyymmdd, int(epoch), float(load_mw))
+            for epoch, load_mw in zip(day_load.valid_epochs(), day_load.valid_values())
+        ]
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM loads WHERE day = ?", (day_yyyymmdd,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO loads (day, begin_epoch, load_mw) VALUES (?, ?, ?)",
+                payload,
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO days (day, fetched_at, n_rows) VALUES (?, ?, ?)",
+                (day_yyyymmdd, fetched_at.timestamp(), len(payload)),
+            )
+        return True
+
+    def has_day(self, day_yyyymmdd: str) -> bool:
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT 1 FROM days WHERE day = ?", (day_yyyymmdd,)).fetchone()
+        return row is not None
+
+
+_store: Optional[IsoNeDayStore] = None
+_store_initialized = False
+_store_lock = threading.Lock()
+
+
+def get_day_store() -> Optional[IsoNeDayStore]:
+    """Process-wide store built from ``ISO_NE_STORE_PATH``; None when disabled or unusable."""
+    global _store, _store_initialized
+    if _store_initialized:
+        return _store
+    with _store_lock:
+        if not _store_initialized:
+            path = os.getenv("ISO_NE_STORE_PATH", DEFAULT_STORE_PATH).strip()
+            if path and path.lower() not in {"off", "none", "false", "0"}:
+                try:
+                    _store = IsoNeDayStore(path)
+                except (OSError, sqlite3.Error):
+                    _store = None
+            _store_initialized = True
+    return _store
+
+
+def set_day_store(store: Optional[IsoNeDayStore]) -> None:
+    """Override the process-wide store (None disables it). Mainly for tests."""
+    global _store, _store_initialized
+    with _store_lock:
+        _store = store
+        _store_initialized = True
@@ -1,7 +1,8 @@
 import random
 import bittensor as bt
 import numpy as np
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 
 def check_uid_availability(
@@ -60,3 +61,32 @@ def get_random_uids(self, k: int, exclude: List[int] = None) -> np.ndarray:
         )
     uids = np.array(random.sample(available_uids, k))
     return uids
+
+
+@dataclass(frozen=True)
+class HotkeyIndex:
+    """Snapshot of hotkey -> uid with per-uid stake and validator permit, for O(1) request admission.
+
+    Built once per metagraph sync and replaced as a whole, so readers never see a half-updated index.
+    """
+
+    uids: Dict[str, int] = field(default_factory=dict)
+    stake: Tuple[float, ...] = ()
+    validator_permit: Tuple[bool, ...] = ()
+
+    @classmethod
+    def from_metagraph(cls, metagraph: "bt.Metagraph") -> "HotkeyIndex":
+        return cls(
+            uids={hotkey: uid for uid, hotkey in enumerate(metagraph.hotkeys)},
+            stake=tuple(float(s) for s in np.asarray(metagraph.S).reshape(-1)),
+            validator_permit=tuple(bool(p) for p in np.asarray(metagraph.validator_permit).reshape(-1)),
+        )
+
+    def uid(self, hotkey: str) -> Optional[int]:
+        return self.uids.get(hotkey)
+
+    def has_validator_permit(self, uid: int) -> bool:
+        return uid < len(self.validator_permit) and self.validator_permit[uid]
+
+    def stake_of(self, uid: int) -> float:
+        return self.stake[uid] if uid < len(self.stake) else 0.0
@@ -59,6 +59,7 @@ def log_wandb(
     last_round_weights=None,
     ground_truth=None,
     timestamp=None,
+    extra_metrics=None,
 ):
     try:
         # rewards may be list or numpy array; make it list
@@ -101,6 +102,9 @@ def log_wandb(
             "timestamp": timestamp if timestamp is not None else None,
         }
 
+        if extra_metrics:
+            wandb_val_log.update(extra_metrics)
+
         # Flatten metrics for plotting
         for uid, resp, rew in zip(miner_uids, responses, rewards):
             point_pred = getattr(resp, "prediction", None)
@@ -30,7 +30,7 @@ import bittensor as bt
 from typing import List, Dict, Tuple, Optional
 
 from bittbridge.protocol import Challenge
-from bittbridge.utils.iso_ne_api import get_load_mw_for_timestamp
+from bittbridge.utils.iso_ne_api import get_load_mw_for_timestamp, get_load_mw_for_timestamp_async
 
 # Median percentage error of the 5-hour MA baseline (~9.76% as a fraction). See docs/guide/incentive-mechanism.md
 INCENTIVE_T = 0.097634
@@ -50,6 +50,14 @@ def get_actual_load_mw(timestamp: str) -> Optional[float]:
     return get_load_mw_for_timestamp(timestamp)
 
 
+async def get_actual_load_mw_async(timestamp: str) -> Optional[float]:
+    """
+    Same as :func:`get_actual_load_mw`, but awaits the pooled asyncio ISO-NE client so the
+    validator's event loop is not blocked while waiting on the API.
+    """
+    return await get_load_mw_for_timestamp_async(timestamp)
+
+
 def calculate_point_forecast_scores(actual_load_mw: float, predictions: List[float]) -> Dict[int, float]:
     """
     Point-forecast weights: score_i = exp(-error_i / T), then normalize to sum to 1.
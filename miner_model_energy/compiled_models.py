@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+_TREE_LEAF = -1  # sklearn.tree._tree.TREE_LEAF
+_BATCH_CHUNK_ROWS = 65536
+
+
+@dataclass
+class CompiledLinear:
+    """
+    ``StandardScaler`` + ``LinearRegression`` folded into one weight vector and bias:
+    ``y = X @ weights + bias``. Works on one row or millions without sklearn.
+    """
+
+    weights: np.ndarray
+    bias: float
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return np.asarray(X, dtype=np.float64) @ self.weights + self.bias
+
+
+@dataclass
+class CompiledTree:
+    """
+    Flat node arrays of a fitted ``DecisionTreeRegressor`` (same layout as ``tree_``).
+
+    Rows are compared as float32 against float64 thresholds like sklearn, and NaNs follow
+    ``missing_left`` (sklearn >= 1.3). Single rows walk the tree in a scalar loop; batches
+    descend one level per step with array indexing, so backtests stay vectorized.
+    """
+
+    feature: np.ndarray
+    threshold: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    value: np.ndarray
+    missing_left: Optional[np.ndarray] = None
+    _nodes: list = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        n_nodes = len(self.feature)
+        missing_left = self.missing_left if self.missing_left is not None else np.zeros(n_nodes, dtype=bool)
+        # Plain Python lists: scalar indexing is several times cheaper than on ndarrays.
+        self._nodes = list(
+            zip(
+                self.feature.tolist(),
+                self.threshold.tolist(),
+                self.left.tolist(),
+                self.right.tolist(),
+                self.value.tolist(),
+                missing_left.tolist(),
+            )
+        )
+        # Batch form: leaves point at themselves, so every row can take ``depth`` steps.
+        leaf = self.left == _TREE_LEAF
+        ids = np.arange(n_nodes, dtype=np.intp)
+        self._batch_feature = np.where(leaf, 0, self.feature)
+        self._batch_threshold = np.where(leaf, np.inf, self.threshold)
+        self._batch_left = np.where(leaf, ids, self.left)
+        self._batch_right = np.where(leaf, ids, self.right)
+        self._batch_missing_left = np.where(leaf, False, missing_left)
+        depth = np.zeros(n_nodes, dtype=np.intp)
+        for node in range(n_nodes):  # sklearn numbers children after their parent
+            if not leaf[node]:
+                depth[self.left[node]] = depth[self.right[node]] = depth[node] + 1
+        self._depth = int(depth.max())
+
+    def _predict_row(self, row: List[float]) -> float:
+        nodes = self._nodes
+        feature, threshold, left, right, value, missing_left = nodes[0]
+        while left != _TREE_LEAF:
+            x = row[feature]
+            if x != x:  # NaN
+                node = left if missing_left else right
+            else:
+                node = left if x <= threshold else right
+            feature, threshold, left, right, value, missing_left = nodes[node]
+        return value
+
+    def _predict_batch(self, X: np.ndarray) -> np.ndarray:
+        rows = np.arange(len(X))
+        node = np.zeros(len(X), dtype=np.intp)
+        for _ in range(self._depth):
+            x = X[rows, self._batch_feature[node]].astype(np.float32)
+            go_left = x <= self._batch_threshold[node]
+            if self.missing_left is not None:
+                go_left = np.where(np.isnan(x), self._batch_missing_left[node], go_left)
+            node = np.where(go_left, self._batch_left[node], self._batch_right[node])
+        return self.value[node]
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        if len(X) == 1:
+            return np.array([self._predict_row(X[0].astype(np.float32).tolist())], dtype=np.float64)
+        if len(X) <= _BATCH_CHUNK_ROWS:
+            return self._predict_batch(X)
+        # Chunks keep the per-level gathers in cache for backtests over millions of rows.
+        return np.concatenate(
+            [self._predict_batch(X[i : i + _BATCH_CHUNK_ROWS]) for i in range(0, len(X), _BATCH_CHUNK_ROWS)]
+        )
+
+
+def compile_linear(model, scaler) -> CompiledLinear:
+    coef = np.asarray(model.coef_, dtype=np.float64).reshape(-1)
+    intercept = float(np.ravel(model.intercept_)[0])  # 0.0 when fit_intercept=False
+    mean = getattr(scaler, "mean_", None) if getattr(scaler, "with_mean", True) else None
+    scale = getattr(scaler, "scale_", None) if getattr(scaler, "with_std", True) else None
+    weights = coef if scale is None else coef / np.asarray(scale, dtype=np.float64)
+    bias = intercept if mean is None else intercept - float(np.asarray(mean, dtype=np.float64) @ weights)
+    return CompiledLinear(weights=weights, bias=bias)
+
+
+def compile_tree(model) -> CompiledTree:
+    tree = model.tree_
+    missing = getattr(tree, "missing_go_to_left", None)
+    return CompiledTree(
+        feature=np.asarray(tree.feature, dtype=np.intp),
+        threshold=np.asarray(tree.threshold, dtype=np.float64),
+        left=np.asarray(tree.children_left, dtype=np.intp),
+        right=np.asarray(tree.children_right, dtype=np.intp),
+        value=np.asarray(tree.value, dtype=np.float64)[:, 0, 0].copy(),
+        missing_left=None if missing is None else np.asarray(missing, dtype=bool),
+    )
+
+
+def save_compiled_linear(compiled: CompiledLinear, out_path: str) -> str:
+    with Path(out_path).open("wb") as handle:
+        np.savez(handle, weights=compiled.weights, bias=np.array([compiled.bias]))
+    return out_path
+
+
+def load_compiled_linear(path: str) -> CompiledLinear:
+    with np.load(path, allow_pickle=False) as data:
+        return CompiledLinear(weights=data["weights"], bias=float(data["bias"][0]))
+
+
+def save_compiled_tree(compiled: CompiledTree, out_path: str) -> str:
+    arrays = {
+        "feature": compiled.feature,
+        "threshold": compiled.threshold,
+        "left": compiled.left,
+        "right": compiled.right,
+        "value": compiled.value,
+    }
+    if compiled.missing_left is not None:
+        arrays["missing_left"] = compiled.missing_left
+    with Path(out_path).open("wb") as handle:
+        np.savez(handle, **arrays)
+    return out_path
+
+
+def load_compiled_tree(path: str) -> CompiledTree:
+    with np.load(path, allow_pickle=False) as data:
+        return CompiledTree(
+            feature=data["feature"].astype(np.intp),
+            threshold=data["threshold"],
+            left=data["left"].astype(np.intp),
+            right=data["right"].astype(np.intp),
+            value=data["value"],
+            missing_left=data["missing_left"] if "missing_left" in data.files else None,
+        )
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import bittensor as bt
+
+from .custom_plugin_runtime import read_plugin_metadata, resolve_plugin_dir
+from .inference_runtime import PredictorRouter, is_valid_prediction, predict_with_context
+from .precompute import upcoming_challenge_timestamps
+
+# Control file dropped into the artifact root to ask a running miner for a model swap.
+RELOAD_REQUEST_NAME = "reload_request.json"
+# Outcome of the last request, written next to it.
+RELOAD_STATUS_NAME = "reload_status.json"
+DEFAULT_RELOAD_POLL_SEC = 5.0
+DEFAULT_WARMUP_PREDICTIONS = 2
+TRAINABLE_MODEL_TYPES = ("linear", "cart", "rnn", "lstm")
+
+
+@dataclass
+class ReloadRequest:
+    """
+    One parsed control request: ``manifest`` (saved artifact run), ``plugin`` (custom plugin
+    model file), ``train`` (train a built-in model type) or ``rollback`` (back to the predictor
+    served before the last swap).
+    """
+
+    kind: str
+    manifest_path: Optional[Path] = None
+    plugin_dir: Optional[Path] = None
+    model_path: Optional[Path] = None
+    model_type: Optional[str] = None
+
+
+def parse_reload_request(payload: Any, artifact_root: str | Path) -> ReloadRequest:
+    """
+    Accepted payloads (relative paths resolve against ``artifact_root``)::
+
+        {"manifest": "<run dir or manifest.json>"}
+        {"plugin": "<plugin folder>", "model_file": "<file in it>"}   # model_file optional
+        {"train": "linear" | "cart" | "rnn" | "lstm"}
+        {"rollback": true}
+    """
+    if not isinstance(payload, dict):
+        raise ValueError(f"Reload request must be a JSON object, got {type(payload).__name__}.")
+    root = Path(artifact_root)
+    if payload.get("rollback"):
+        return ReloadRequest(kind="rollback")
+    if payload.get("train"):
+        model_type = str(payload["train"]).strip().lower()
+        if model_type not in TRAINABLE_MODEL_TYPES:
+            raise ValueError(f"Unknown model type to train: {model_type}. Allowed: {', '.join(TRAINABLE_MODEL_TYPES)}.")
+        return ReloadRequest(kind="train", model_type=model_type)
+    if payload.get("manifest"):
+        path = Path(payload["manifest"])
+        path = path if path.is_absolute() else root / path
+        if path.is_dir():
+            path = path / "manifest.json"
+        if not path.is_file():
+            raise ValueError(f"Manifest not found: {path}")
+        return ReloadRequest(kind="manifest", manifest_path=path)
+    if payload.get("plugin"):
+        plugin_dir = resolve_plugin_dir(root, str(payload["plugin"]))
+        if not plugin_dir.is_dir():
+            raise ValueError(f"Plugin folder not found: {plugin_dir}")
+        model_file = payload.get("model_file") or read_plugin_metadata(plugin_dir).get("selected_model_file")
+        if not model_file:
+            raise ValueError("Plugin reload needs model_file (none recorded in plugin_metadata.json).")
+        model_path = plugin_dir / Path(str(model_file)).name
+        if not model_path.exists():
+            raise ValueError(f"Plugin model file not found: {model_path}")
+        return ReloadRequest(kind="plugin", plugin_dir=plugin_dir, model_path=model_path)
+    raise ValueError("Reload request needs one of: manifest, plugin, train, rollback.")
+
+
+class ModelReloader:
+    """
+    Swaps the router's predictor while the miner keeps serving.
+
+    A daemon thread polls ``control_dir`` for :data:`RELOAD_REQUEST_NAME` every ``poll_sec``,
+    consumes it and hands it to :meth:`reload`. The candidate is built off the request path by
+    ``load_candidate`` (which runs the deploy compatibility probe for plugins), then warmed up
+    with predictions for the next ``warmup_predictions`` challenge slots; every one must be
+    finite and, when the router has a timeout, finish within it. Only then is it swapped in
+    with :meth:`PredictorRouter.set_predictor`. On any failure the running predictor stays.
+    The replaced predictor is kept so a ``rollback`` request can restore it.
+
+    :meth:`reload_in_background` runs a request off the caller's thread, e.g. startup training
+    while the baseline already serves.
+    """
+
+    def __init__(
+        self,
+        router: PredictorRouter,
+        load_candidate: Callable[[ReloadRequest], tuple[Any, str]],
+        control_dir: str | Path,
+        poll_sec: float = DEFAULT_RELOAD_POLL_SEC,
+        warmup_predictions: int = DEFAULT_WARMUP_PREDICTIONS,
+        upcoming: Callable[[int], list[str]] = upcoming_challenge_timestamps,
+    ):
+        self.router = router
+        self.load_candidate = load_candidate
+        self.control_dir = Path(control_dir)
+        self.poll_sec = poll_sec
+        self.warmup_predictions = warmup_predictions
+        self._upcoming = upcoming
+        self.previous: Optional[tuple[Any, str]] = None
+        self.last_status: dict[str, Any] = {}
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._background: Optional[threading.Thread] = None
+
+    @property
+    def request_path(self) -> Path:
+        return self.control_dir / RELOAD_REQUEST_NAME
+
+    def _warmup(self, predictor) -> float:
+        """Slowest warmup latency; raises if a prediction is missing, non-finite or too slow."""
+        slowest = 0.0
+        for timestamp in self._upcoming(max(1, self.warmup_predictions)):
+            started = time.monotonic()
+            pred, context = predict_with_context(predictor, timestamp)
+            latency = time.monotonic() - started
+            if not is_valid_prediction(pred):
+                raise ValueError(f"warmup prediction for {timestamp} is {pred!r}: {context.get('error', '')}")
+            if self.router.timeout_sec is not None and latency > self.router.timeout_sec:
+                raise ValueError(
+                    f"warmup prediction took {latency:.2f}s, over the {self.router.timeout_sec:g}s request timeout"
+                )
+            slowest = max(slowest, latency)
+        return slowest
+
+    def reload(self, request: ReloadRequest) -> dict[str, Any]:
+        """Run one request to completion; returns (and keeps in :attr:`last_status`) its outcome."""
+        with self._reload_lock:
+            status: dict[str, Any] = {
+                "request": request.kind,
+                "previous_mode": self.router.mode,
+                "finished_utc": None,
+            }
+            try:
+                if request.kind == "rollback":
+                    if self.previous is None:
+                        raise ValueError("no previous predictor to roll back to")
+                    predictor, mode = self.previous
+                else:
+                    predictor, mode = self.load_candidate(request)
+                    status["warmup_max_latency_sec"] = round(self._warmup(predictor), 4)
+                self.previous = self.router.set_predictor(predictor, mode)
+                status.update(ok=True, mode=mode)
+                bt.logging.success(f"Hot-swapped predictor: {status['previous_mode']} -> {mode}")
+            except Exception as e:
+                status.update(ok=False, mode=self.router.mode, error=f"{type(e).__name__}: {e}")
+                bt.logging.error(f"Model reload ({request.kind}) failed, still serving {self.router.mode}: {e}")
+            status["finished_utc"] = datetime.now(timezone.utc).isoformat()
+            self.last_status = status
+            return status
+
+    def reload_in_background(self, request: ReloadRequest) -> threading.Thread:
+        """Start :meth:`reload` for ``request`` in a daemon thread and return the thread."""
+        thread = threading.Thread(target=self.reload, args=(request,), name=f"model-{request.kind}", daemon=True)
+        self._background = thread
+        thread.start()
+        return thread
+
+    @property
+    def is_reloading(self) -> bool:
+        return self._background is not None and self._background.is_alive()
+
+    def check_once(self) -> Optional[dict[str, Any]]:
+        """Consume and run a pending control request, if any."""
+        path = self.request_path
+        if not path.is_file():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            payload = e
+        finally:
+            # Consumed either way so a malformed file is not retried every poll.
+            path.unlink(missing_ok=True)
+        try:
+            if isinstance(payload, Exception):
+                raise ValueError(f"unreadable {RELOAD_REQUEST_NAME}: {payload}")
+            request = parse_reload_request(payload, self.control_dir)
+        except (ValueError, OSError) as e:
+            status = {"ok": False, "mode": self.router.mode, "error": str(e)}
+            bt.logging.error(f"Ignoring model reload request: {e}")
+            self.last_status = status
+        else:
+            status = self.reload(request)
+        (self.control_dir / RELOAD_STATUS_NAME).write_text(json.dumps(status, indent=2), encoding="utf-8")
+        return status
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.check_once()
+            except Exception as e:
+                bt.logging.warning(f"Model reload watcher failed: {e}")
+            self._stop.wait(self.poll_sec)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="model-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
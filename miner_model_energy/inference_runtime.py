@@ -1,20 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import timedelta
 from typing import Any, Optional
 
-from bittbridge.utils.iso_ne_api import fetch_fiveminute_system_load
+import numpy as np
+
+from bittbridge.utils.iso_ne_api import fetch_day_load_async, fetch_fiveminute_system_load
+from bittbridge.utils.iso_ne_buffer import DEFAULT_MAX_AGE_SEC, LoadRingBuffer
 from bittbridge.utils.timestamp import get_now
 
 from .custom_plugin_runtime import CustomModelWrapper
 from .ml_config import ModelConfig
+from .live_features import LiveFeatureEngine
+from .sequence_kernels import StreamingSequenceState
 from .pipeline import (
+    CsvProbeIndex,
     TrainingResult,
+    live_probe_feature_matrices_for_custom,
+    live_probe_feature_matrices_for_custom_async,
     live_probe_feature_matrix_for_custom,
+    live_probe_feature_matrix_for_custom_async,
+    make_live_feature_engine,
+    make_streaming_state,
     predict_for_timestamp_with_context,
+    predict_for_timestamp_with_context_async,
+    predict_for_timestamps_with_context,
+    predict_for_timestamps_with_context_async,
     predict_single_test_row_with_context,
+    without_training_frames,
 )
+from .supabase_io import create_supabase_async_data_client, get_supabase_data_client
 
 
 def _get_latest_load_values(n_steps: int) -> Optional[list]:
@@ -30,19 +51,65 @@ def _get_latest_load_values(n_steps: int) -> Optional[list]:
     return load_values[-n_steps:] if len(load_values) >= n_steps else None
 
 
+async def _get_latest_load_values_async(n_steps: int) -> Optional[list]:
+    """Same as :func:`_get_latest_load_values` through the pooled asyncio ISO-NE client."""
+    now = get_now()
+    days = [now.strftime("%Y%m%d")]
+    if now.hour < 1 and now.minute < 30:
+        days.insert(0, (now - timedelta(days=1)).strftime("%Y%m%d"))
+    loaded = await asyncio.gather(*(fetch_day_load_async(day, use_cache=False) for day in days))
+    parts = [day_load.valid_values() for day_load in loaded if day_load is not None]
+    if not parts:
+        return None
+    load_values = np.concatenate(parts).tolist()
+    return load_values[-n_steps:] if len(load_values) >= n_steps else None
+
+
 class BaselineMovingAveragePredictor:
-    def __init__(self, n_steps: int = 12):
+    """
+    Moving average of the last ``n_steps`` five-minute loads.
+
+    With a ``load_buffer`` kept fresh by a :class:`~bittbridge.utils.iso_ne_buffer.LoadBufferPoller`,
+    values are read from memory; when the buffer is missing, stale or short, ISO-NE is queried.
+    """
+
+    def __init__(
+        self,
+        n_steps: int = 12,
+        load_buffer: Optional[LoadRingBuffer] = None,
+        max_buffer_age_sec: float = DEFAULT_MAX_AGE_SEC,
+    ):
         self.n_steps = n_steps
+        self.load_buffer = load_buffer
+        self.max_buffer_age_sec = max_buffer_age_sec
         self.last_prediction_context: dict[str, Any] = {}
 
+    def _buffered_values(self) -> Optional[list]:
+        if self.load_buffer is None or not self.load_buffer.is_fresh(self.max_buffer_age_sec):
+            return None
+        values = self.load_buffer.latest(self.n_steps)
+        return None if values is None else values.tolist()
+
     def predict(self, timestamp: str) -> Optional[float]:
         del timestamp
-        values = _get_latest_load_values(self.n_steps)
+        values = self._buffered_values()
+        if values is not None:
+            return self._from_values(values, source="iso_ne_buffer")
+        return self._from_values(_get_latest_load_values(self.n_steps))
+
+    async def predict_async(self, timestamp: str) -> Optional[float]:
+        del timestamp
+        values = self._buffered_values()
+        if values is not None:
+            return self._from_values(values, source="iso_ne_buffer")
+        return self._from_values(await _get_latest_load_values_async(self.n_steps))
+
+    def _from_values(self, values: Optional[list], source: str = "iso_ne_api") -> Optional[float]:
         if not values:
             self.last_prediction_context = {}
             return None
         self.last_prediction_context = {
-            "source": "iso_ne_api",
+            "source": source,
             "n_steps": self.n_steps,
             "model_input_row": {"recent_load_values": values},
         }
@@ -51,27 +118,121 @@ class BaselineMovingAveragePredictor:
 
 @dataclass
 class AdvancedModelPredictor:
+    """
+    Built-in model answering from the fixed CSV test row. The input window is built and scored
+    once at construction; requests return the memoized prediction and context, and only a
+    frame-less copy of ``result`` is kept.
+    """
+
     result: TrainingResult
     last_prediction_context: dict[str, Any] = None
+    _memo: tuple[float, dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self._memo = predict_single_test_row_with_context(self.result)
+        self.result = without_training_frames(self.result)
 
     def predict(self, timestamp: str) -> Optional[float]:
         del timestamp
-        pred, ctx = predict_single_test_row_with_context(self.result)
-        self.last_prediction_context = ctx
+        pred, ctx = self._memo
+        self.last_prediction_context = dict(ctx)
         return pred
 
+    def predict_batch(self, timestamps: list[str]) -> list[tuple[Optional[float], dict[str, Any]]]:
+        pred, ctx = self._memo
+        return [(pred, dict(ctx)) for _ in timestamps]
+
+
+def _is_supabase_source(config: ModelConfig) -> bool:
+    return config.data.get("source", "csv") in {"supabase", "supabase_storage"}
+
+
+class LiveSupabaseClients:
+    """
+    Long-lived Supabase clients owned by one live predictor: the shared blocking client and an
+    AsyncClient for the axon event loop, both created on first use and reused for every request.
+    """
+
+    def __init__(self, config: ModelConfig):
+        self._url = config.data.get("supabase_url")
+        self._key = config.data.get("supabase_key")
+        self._async_client = None
+        self._async_unavailable = False
+
+    def sync(self):
+        return get_supabase_data_client(self._url, self._key)
+
+    async def async_client(self):
+        """AsyncClient, or None when the installed supabase package has no async support."""
+        if self._async_client is None and not self._async_unavailable:
+            try:
+                self._async_client = await create_supabase_async_data_client(self._url, self._key)
+            except RuntimeError:
+                self._async_unavailable = True
+        return self._async_client
+
 
 @dataclass
 class SupabaseLiveAdvancedPredictor:
     result: TrainingResult
     config: ModelConfig
     last_prediction_context: dict[str, Any] = None
+    clients: LiveSupabaseClients = field(default=None, repr=False)
+    feature_engine: LiveFeatureEngine = field(default=None, repr=False)
+    streaming: StreamingSequenceState = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.clients is None:
+            self.clients = LiveSupabaseClients(self.config)
+        if self.feature_engine is None and self.result is not None:
+            self.feature_engine = make_live_feature_engine(self.result, self.config)
+        if self.streaming is None and self.result is not None:
+            self.streaming = make_streaming_state(self.result, self.config)
 
     def predict(self, timestamp: str) -> Optional[float]:
-        pred, ctx = predict_for_timestamp_with_context(self.result, self.config, timestamp)
+        pred, ctx = predict_for_timestamp_with_context(
+            self.result,
+            self.config,
+            timestamp,
+            client=self.clients.sync(),
+            engine=self.feature_engine,
+            streaming=self.streaming,
+        )
         self.last_prediction_context = ctx
         return pred
 
+    async def predict_async(self, timestamp: str) -> Optional[float]:
+        client = await self.clients.async_client()
+        if client is None:
+            return await asyncio.to_thread(self.predict, timestamp)
+        pred, ctx = await predict_for_timestamp_with_context_async(
+            self.result, self.config, timestamp, client, engine=self.feature_engine, streaming=self.streaming
+        )
+        self.last_prediction_context = ctx
+        return pred
+
+    def predict_batch(self, timestamps: list[str]) -> list[tuple[Optional[float], dict[str, Any]]]:
+        """
+        Predictions for several timestamps: one history fetch, the forecast rows concurrently and a
+        single stacked model call. A timestamp without inputs gets ``(None, {"error": ...})``.
+        """
+        return predict_for_timestamps_with_context(
+            self.result,
+            self.config,
+            timestamps,
+            client=self.clients.sync(),
+            engine=self.feature_engine,
+            streaming=self.streaming,
+        )
+
+    async def predict_batch_async(self, timestamps: list[str]) -> list[tuple[Optional[float], dict[str, Any]]]:
+        client = await self.clients.async_client()
+        if client is None:
+            return await asyncio.to_thread(self.predict_batch, timestamps)
+        return await predict_for_timestamps_with_context_async(
+            self.result, self.config, timestamps, client, engine=self.feature_engine, streaming=self.streaming
+        )
+
 
 @dataclass
 class CustomModelPredictor:
@@ -84,6 +245,21 @@ class CustomModelPredictor:
     features: list[str]
     sequence_n_steps: int | None = None
     last_prediction_context: dict[str, Any] = None
+    clients: LiveSupabaseClients = field(default=None, repr=False)
+    feature_engine: LiveFeatureEngine = field(default=None, repr=False)
+    csv_index: CsvProbeIndex = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if _is_supabase_source(self.config):
+            if self.clients is None:
+                self.clients = LiveSupabaseClients(self.config)
+            if self.feature_engine is None:
+                self.feature_engine = LiveFeatureEngine(
+                    self.config.features, self.features, n_steps=int(self.sequence_n_steps or 1)
+                )
+        elif self.csv_index is None:
+            # CSV frames are prepared once here; each request is then a lookup plus one model call.
+            self.csv_index = CsvProbeIndex.build(self.config, self.features, self.sequence_n_steps)
 
     def predict(self, timestamp: str) -> Optional[float]:
         X, ctx = live_probe_feature_matrix_for_custom(
@@ -91,7 +267,71 @@ class CustomModelPredictor:
             timestamp,
             self.features,
             self.sequence_n_steps,
+            client=self.clients.sync() if self.clients is not None else None,
+            engine=self.feature_engine,
+            csv_index=self.csv_index,
+        )
+        return self._predict_matrix(X, ctx)
+
+    async def predict_async(self, timestamp: str) -> Optional[float]:
+        client = await self.clients.async_client() if self.clients is not None else None
+        if client is None:
+            return await asyncio.to_thread(self.predict, timestamp)
+        X, ctx = await live_probe_feature_matrix_for_custom_async(
+            self.config, timestamp, self.features, self.sequence_n_steps, client, engine=self.feature_engine
         )
+        return await asyncio.to_thread(self._predict_matrix, X, ctx)
+
+    def predict_batch(self, timestamps: list[str]) -> list[tuple[Optional[float], dict[str, Any]]]:
+        """
+        Predictions for several timestamps with one stacked model call. A timestamp whose
+        features cannot be built gets ``(None, {"error": ...})``; the others are still scored.
+        """
+        built = live_probe_feature_matrices_for_custom(
+            self.config,
+            timestamps,
+            self.features,
+            self.sequence_n_steps,
+            client=self.clients.sync() if self.clients is not None else None,
+            engine=self.feature_engine,
+            csv_index=self.csv_index,
+        )
+        return self._score_batch(built)
+
+    async def predict_batch_async(self, timestamps: list[str]) -> list[tuple[Optional[float], dict[str, Any]]]:
+        client = await self.clients.async_client() if self.clients is not None else None
+        if client is None:
+            return await asyncio.to_thread(self.predict_batch, timestamps)
+        built = await live_probe_feature_matrices_for_custom_async(
+            self.config, timestamps, self.features, self.sequence_n_steps, client, engine=self.feature_engine
+        )
+        return await asyncio.to_thread(self._score_batch, built)
+
+    def _score_batch(self, built: list) -> list[tuple[Optional[float], dict[str, Any]]]:
+        """One model call on the built ``(X, ctx)`` inputs; an exception in ``built`` becomes that slot's error."""
+        out: list[tuple[Optional[float], dict[str, Any]]] = [(None, {})] * len(built)
+        ok = []
+        for i, item in enumerate(built):
+            if isinstance(item, Exception):
+                out[i] = (None, {"error": f"{type(item).__name__}: {item}"})
+            else:
+                ok.append((i, *item))
+        if ok:
+            vals = self.wrapper.predict_values(np.concatenate([X for _, X, _ in ok], axis=0)).ravel()
+            for (i, X, ctx), val in zip(ok, vals):
+                out[i] = (
+                    float(val),
+                    {
+                        **ctx,
+                        "custom_model_input_shape": list(X.shape),
+                        "custom_model_kind": self.wrapper.kind,
+                        "batch_size": len(ok),
+                    },
+                )
+            self.last_prediction_context = out[ok[-1][0]][1]
+        return out
+
+    def _predict_matrix(self, X: np.ndarray, ctx: dict[str, Any]) -> float:
         vals = self.wrapper.predict_values(X)
         pred = float(vals.ravel()[0])
         self.last_prediction_context = {
@@ -102,19 +342,321 @@ class CustomModelPredictor:
         return pred
 
 
+DEFAULT_PREDICT_WORKERS = 4
+DEFAULT_PREDICT_TIMEOUT_SEC = 10.0
+# Share of the request deadline the first tier may use before the next tier starts.
+DEFAULT_PRIMARY_BUDGET_SHARE = 0.6
+# A previous prediction older than this is not served as the last-resort answer.
+DEFAULT_LAST_GOOD_MAX_AGE_SEC = 1800.0
+LAST_GOOD_TIER = "last_good"
+# How long the micro-batcher collects concurrent requests before one model call; 0 disables it.
+DEFAULT_BATCH_WINDOW_SEC = 0.0
+
+
+def predict_with_context(predictor, timestamp: str) -> tuple[Optional[float], dict[str, Any]]:
+    # Context is read right after predict() in the same worker; concurrent calls on one predictor
+    # can at worst swap the logged context, never the prediction.
+    pred = predictor.predict(timestamp)
+    return pred, dict(getattr(predictor, "last_prediction_context", {}) or {})
+
+
+def is_valid_prediction(pred) -> bool:
+    try:
+        return pred is not None and math.isfinite(float(pred))
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass
+class TierStats:
+    calls: int = 0
+    wins: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    total_latency_sec: float = 0.0
+    max_latency_sec: float = 0.0
+
+    def record(self, latency_sec: float, outcome: str) -> None:
+        self.calls += 1
+        self.total_latency_sec += latency_sec
+        self.max_latency_sec = max(self.max_latency_sec, latency_sec)
+        if outcome == "win":
+            self.wins += 1
+        elif outcome == "timeout":
+            self.timeouts += 1
+        else:
+            self.errors += 1
+
+    def as_dict(self, prefix: str = "") -> dict[str, float]:
+        out = {f"{prefix}{k}": v for k, v in asdict(self).items()}
+        out[f"{prefix}mean_latency_sec"] = self.total_latency_sec / self.calls if self.calls else 0.0
+        return out
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent requests to the same predictor on one event loop.
+
+    The first request opens a batch that collects for ``window_sec``. Requests for a timestamp
+    already in the batch share its result. The batch then runs once: predictors with
+    ``predict_batch_async(timestamps)`` are awaited, those with ``predict_batch(timestamps)``
+    score all distinct timestamps in a single call on ``executor``, others are run once per
+    distinct timestamp through ``run_one``. Each caller gets its own
+    copy of the context, with ``batch_requests`` (callers served by the batch) added; a
+    failure is answered as ``(None, {"error": ...})`` for the timestamps it affects.
+    """
+
+    def __init__(self, window_sec: float, executor: ThreadPoolExecutor, run_one):
+        self.window_sec = window_sec
+        self.batches = 0
+        self.requests = 0
+        self._executor = executor
+        self._run_one = run_one
+        # (loop id, predictor id) -> (predictor, {timestamp: future}, request count holder)
+        self._open: dict[tuple[int, int], tuple[Any, dict[str, asyncio.Future], list[int]]] = {}
+        # The loop only keeps weak references to tasks; a collected flush would strand its callers.
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(self, predictor, timestamp: str) -> tuple[Optional[float], dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        key = (id(loop), id(predictor))
+        batch = self._open.get(key)
+        if batch is None:
+            batch = (predictor, {}, [0])
+            self._open[key] = batch
+            flush = loop.create_task(self._flush_after(key))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+        _, futures, count = batch
+        count[0] += 1
+        self.requests += 1
+        future = futures.get(timestamp)
+        if future is None:
+            future = futures[timestamp] = loop.create_future()
+        # Shielded: one caller timing out must not cancel the answer other callers share.
+        pred, context = await asyncio.shield(future)
+        return pred, {**context, "batch_requests": count[0]}
+
+    async def _flush_after(self, key: tuple[int, int]) -> None:
+        await asyncio.sleep(self.window_sec)
+        predictor, futures, _ = self._open.pop(key)
+        self.batches += 1
+        timestamps = list(futures)
+        try:
+            predict_batch_async = getattr(predictor, "predict_batch_async", None)
+            predict_batch = getattr(predictor, "predict_batch", None)
+            if predict_batch_async is not None:
+                results = await predict_batch_async(timestamps)
+            elif predict_batch is not None:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(self._executor, predict_batch, timestamps)
+            else:
+                results = await asyncio.gather(
+                    *(self._run_one(predictor, t) for t in timestamps), return_exceptions=True
+                )
+        except Exception as e:
+            results = [e] * len(timestamps)
+        for timestamp, result in zip(timestamps, results):
+            future = futures[timestamp]
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                # As a value, not an exception: a future whose callers all timed out would log it unretrieved.
+                result = (None, {"error": f"{type(result).__name__}: {result}"})
+            future.set_result(result)
+
+
 class PredictorRouter:
-    def __init__(self, predictor):
+    """
+    Holds the active predictor and serves it to the axon.
+
+    :meth:`predict_async` never runs predictor code on the event loop: predictors with a
+    ``predict_async`` (the I/O-bound baseline) are awaited, all others run in a bounded thread
+    pool of ``max_workers``.
+
+    Requests walk a fallback chain: the active predictor, then ``fallbacks`` in order (e.g. the
+    baseline moving average), then the last good value if it is at most ``last_good_max_age_sec``
+    old. The request deadline is ``timeout_sec`` (None = no limit), shortened by the caller's
+    ``deadline_sec``. The first tier may use ``primary_share`` of it and each later tier an
+    equal share of what is left. A tier that raises, returns no finite value or runs out of
+    budget hands over to the next; a timed-out worker finishes in the background. Per-tier
+    latency and outcomes are kept in :attr:`tier_stats`.
+
+    With ``batch_window_sec`` > 0, predictor calls go through a :class:`MicroBatcher`, so
+    requests arriving within that window share one model invocation.
+
+    Predictors with ``accepts_deadline = True`` (the model-server client) are awaited directly
+    with their tier budget as ``predict_async(timestamp, deadline_sec=...)``, bypassing the
+    batcher, so the answering process can fit its own fallbacks inside it.
+    """
+
+    def __init__(
+        self,
+        predictor,
+        max_workers: int = DEFAULT_PREDICT_WORKERS,
+        timeout_sec: Optional[float] = DEFAULT_PREDICT_TIMEOUT_SEC,
+        fallbacks: Optional[list[tuple[str, Any]]] = None,
+        primary_share: float = DEFAULT_PRIMARY_BUDGET_SHARE,
+        last_good_max_age_sec: Optional[float] = DEFAULT_LAST_GOOD_MAX_AGE_SEC,
+        batch_window_sec: float = DEFAULT_BATCH_WINDOW_SEC,
+    ):
         self._predictor = predictor
         self.mode = "baseline"
         self.last_prediction_context: dict[str, Any] = {}
+        self.timeout_sec = timeout_sec
+        self.timeouts = 0
+        self.primary_share = primary_share
+        self.last_good_max_age_sec = last_good_max_age_sec
+        self.fallbacks_used = 0
+        self.tier_stats: dict[str, TierStats] = {}
+        self._fallbacks: list[tuple[str, Any]] = list(fallbacks or [])
+        # (prediction, requested timestamp, monotonic time it was produced)
+        self._last_good: Optional[tuple[float, str, float]] = None
+        # Bumped on every set_predictor so caches can tell which predictor produced a result.
+        self.generation = 0
+        self._swap_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="predictor")
+        self.batcher = (
+            MicroBatcher(batch_window_sec, self._executor, self._call_predictor) if batch_window_sec > 0 else None
+        )
 
-    def set_predictor(self, predictor, mode: str):
-        self._predictor = predictor
-        self.mode = mode
-        self.last_prediction_context = {}
+    @property
+    def predictor(self):
+        return self._predictor
+
+    def set_predictor(self, predictor, mode: str) -> tuple[Any, str]:
+        """Swap in ``predictor`` atomically for new requests; returns the previous ``(predictor, mode)``."""
+        with self._swap_lock:
+            previous = (self._predictor, self.mode)
+            self._predictor = predictor
+            self.mode = mode
+            self.last_prediction_context = {}
+            self.generation += 1
+        return previous
+
+    def set_fallbacks(self, fallbacks: list[tuple[str, Any]]) -> None:
+        """Replace the ordered ``(name, predictor)`` tiers tried after the active predictor."""
+        self._fallbacks = list(fallbacks)
+
+    def chain(self) -> list[tuple[str, Any]]:
+        """Active predictor first, then fallbacks that are not the active predictor itself."""
+        with self._swap_lock:
+            active = (self.mode, self._predictor)
+        return [active] + [
+            (name, predictor) for name, predictor in self._fallbacks if predictor is not active[1]
+        ]
+
+    def stats(self) -> dict[str, float]:
+        out: dict[str, float] = {"fallbacks_used": self.fallbacks_used, "timeouts": self.timeouts}
+        if self.batcher is not None:
+            out.update(batches=self.batcher.batches, batched_requests=self.batcher.requests)
+        for name, tier in self.tier_stats.items():
+            out.update(tier.as_dict(prefix=f"tier_{name}_"))
+        return out
 
     def predict(self, timestamp: str) -> Optional[float]:
         pred = self._predictor.predict(timestamp)
         self.last_prediction_context = getattr(self._predictor, "last_prediction_context", {}) or {}
         return pred
 
+    async def _run_predictor(
+        self, predictor, timestamp: str, deadline_sec: Optional[float] = None
+    ) -> tuple[Optional[float], dict[str, Any]]:
+        if getattr(predictor, "accepts_deadline", False):
+            pred = await predictor.predict_async(timestamp, deadline_sec=deadline_sec)
+            return pred, dict(getattr(predictor, "last_prediction_context", {}) or {})
+        if self.batcher is not None:
+            return await self.batcher.submit(predictor, timestamp)
+        return await self._call_predictor(predictor, timestamp)
+
+    async def _call_predictor(self, predictor, timestamp: str) -> tuple[Optional[float], dict[str, Any]]:
+        predict_async = getattr(predictor, "predict_async", None)
+        if predict_async is not None:
+            pred = await predict_async(timestamp)
+            return pred, dict(getattr(predictor, "last_prediction_context", {}) or {})
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, predict_with_context, predictor, timestamp)
+
+    def _tier_budget(self, index: int, tiers_left: int, remaining: Optional[float]) -> Optional[float]:
+        if remaining is None or tiers_left == 1:
+            return remaining
+        if index == 0:
+            return remaining * self.primary_share
+        return remaining / tiers_left
+
+    def _last_good_answer(self, errors: list[str]) -> Optional[tuple[float, dict[str, Any]]]:
+        if self._last_good is None:
+            return None
+        value, timestamp, produced_at = self._last_good
+        age = time.monotonic() - produced_at
+        if self.last_good_max_age_sec is not None and age > self.last_good_max_age_sec:
+            return None
+        stats = self.tier_stats.setdefault(LAST_GOOD_TIER, TierStats())
+        stats.record(0.0, "win")
+        self.fallbacks_used += 1
+        return value, {
+            "tier": LAST_GOOD_TIER,
+            "mode": self.mode,
+            "last_good_timestamp": timestamp,
+            "last_good_age_sec": round(age, 3),
+            "fallback_errors": errors,
+        }
+
+    async def predict_with_context_async(
+        self, timestamp: str, deadline_sec: Optional[float] = None
+    ) -> tuple[Optional[float], dict[str, Any]]:
+        """
+        Prediction and its input context for one request. Safe to call concurrently: the context
+        belongs to this call, unlike :attr:`last_prediction_context` which the latest call overwrites.
+        ``deadline_sec`` (e.g. derived from the synapse timeout) caps ``timeout_sec``.
+        """
+        total = self.timeout_sec
+        if deadline_sec is not None:
+            total = deadline_sec if total is None else min(total, deadline_sec)
+        started = time.monotonic()
+        chain = self.chain()
+        errors: list[str] = []
+        for index, (name, predictor) in enumerate(chain):
+            remaining = None if total is None else total - (time.monotonic() - started)
+            if remaining is not None and remaining <= 0:
+                errors.append(f"{name}: skipped, request deadline reached")
+                break
+            budget = self._tier_budget(index, len(chain) - index, remaining)
+            stats = self.tier_stats.setdefault(name, TierStats())
+            tier_started = time.monotonic()
+            try:
+                pred, context = await asyncio.wait_for(self._run_predictor(predictor, timestamp, budget), budget)
+            except asyncio.TimeoutError:
+                stats.record(time.monotonic() - tier_started, "timeout")
+                self.timeouts += 1
+                errors.append(f"{name}: prediction timed out after {budget:g}s")
+                continue
+            except Exception as e:
+                stats.record(time.monotonic() - tier_started, "error")
+                errors.append(f"{name}: {type(e).__name__}: {e}")
+                continue
+            if not is_valid_prediction(pred):
+                stats.record(time.monotonic() - tier_started, "error")
+                errors.append(f"{name}: {context.get('error') or f'invalid prediction {pred!r}'}")
+                continue
+            stats.record(time.monotonic() - tier_started, "win")
+            pred = float(pred)
+            self._last_good = (pred, timestamp, time.monotonic())
+            context = {**context, "tier": name}
+            if index > 0:
+                self.fallbacks_used += 1
+                context["fallback_errors"] = errors
+            return pred, context
+        answer = self._last_good_answer(errors)
+        if answer is not None:
+            return answer
+        return None, {"error": "; ".join(errors) or "no predictor produced a value", "mode": self.mode}
+
+    async def predict_async(self, timestamp: str, deadline_sec: Optional[float] = None) -> Optional[float]:
+        pred, context = await self.predict_with_context_async(timestamp, deadline_sec)
+        self.last_prediction_context = context
+        return pred
+
+    def close(self) -> None:
+        """Stop accepting work; running predictions finish in their threads."""
+        self._executor.shutdown(wait=False)
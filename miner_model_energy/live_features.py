@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .data_io import TARGET_COLUMN, TIMESTAMP_COLUMN
+from .features import DEFAULT_LAGS, DEFAULT_ROLLING_WINDOWS, KNOWN_WEATHER_SUFFIXES
+
+# Forecast-row columns dropped by normalize_supabase_test_frame before feature engineering.
+_FORECAST_META_COLUMNS = frozenset({TIMESTAMP_COLUMN, "horizon_min", "fetched_at"})
+
+
+def _to_utc_naive(value: Any) -> datetime:
+    """Same convention as supabase_io._normalize_dt_column: UTC wall clock, no tzinfo."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    elif isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _as_float(value: Any) -> float:
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _nan_stats(values: List[float]) -> tuple[float, float, float, float]:
+    """mean, population std (0.0 for fewer than two columns), min, max; NaNs skipped like pandas."""
+    finite = [v for v in values if not math.isnan(v)]
+    if not finite:
+        return math.nan, math.nan if len(values) >= 2 else 0.0, math.nan, math.nan
+    mean = sum(finite) / len(finite)
+    if len(values) < 2:
+        std = 0.0
+    else:
+        std = math.sqrt(sum((v - mean) ** 2 for v in finite) / len(finite))
+    return mean, std, min(finite), max(finite)
+
+
+class LiveFeatureEngine:
+    """
+    Incremental counterpart of ``add_engineered_features`` + ``add_test_load_features_from_history``
+    for live inference.
+
+    History rows are ingested once as they appear (rows not newer than the last one held are
+    skipped). Recent loads sit in a fixed-size ring sized for the largest lag / rolling window /
+    delta, and the engineered feature vectors of the last ``n_steps - 1`` complete history rows
+    are kept for sequence models. :meth:`features_for` then builds the forecast row's vector with
+    plain Python / NumPy on a handful of values instead of re-engineering the whole history tail
+    with pandas. Published history rows are treated as immutable.
+    """
+
+    def __init__(self, feature_cfg: Dict, features: Sequence[str], n_steps: int = 1):
+        self.feature_cfg = dict(feature_cfg)
+        self.features = list(features)
+        self.n_steps = max(1, int(n_steps))
+        cfg = self.feature_cfg
+        self._lags = [int(v) for v in cfg.get("load_lag_steps", DEFAULT_LAGS)] if cfg.get("use_load_lags") else []
+        self._windows = (
+            [int(v) for v in cfg.get("rolling_load_windows", DEFAULT_ROLLING_WINDOWS)]
+            if cfg.get("use_load_rolling")
+            else []
+        )
+        if cfg.get("use_load_rolling"):
+            self._deltas = [1, 3, 12]
+        elif cfg.get("use_load_delta"):
+            self._deltas = [1, 12]
+        else:
+            self._deltas = []
+        depth = max(self._lags + self._windows + [d + 1 for d in self._deltas] + [1])
+        self._allowed_suffixes = frozenset(
+            str(s).strip().lower() for s in (cfg.get("include_weather_suffix_groups") or []) if str(s).strip()
+        )
+        unknown = self._allowed_suffixes - KNOWN_WEATHER_SUFFIXES
+        if unknown:
+            raise ValueError(
+                f"Unknown weather column suffix(es): {sorted(unknown)}. "
+                f"Allowed: {sorted(KNOWN_WEATHER_SUFFIXES)}."
+            )
+        self._loads: deque = deque(maxlen=depth)
+        self._prior_rows: deque = deque(maxlen=max(1, self.n_steps - 1))
+        self._newest_dt: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    @property
+    def newest_dt(self) -> Optional[datetime]:
+        return self._newest_dt
+
+    def reset(self) -> None:
+        with self._lock:
+            self._loads.clear()
+            self._prior_rows.clear()
+            self._newest_dt = None
+
+    def _keep_column(self, name: str) -> bool:
+        if "-" not in name:
+            return True
+        suffix = name.rsplit("-", 1)[-1].lower()
+        return suffix not in KNOWN_WEATHER_SUFFIXES or suffix in self._allowed_suffixes
+
+    def _row_features(self, dt: datetime, raw: Dict[str, Any]) -> Dict[str, float]:
+        """Engineered features of one row; load features come from the loads ingested before it."""
+        cfg = self.feature_cfg
+        out: Dict[str, Any] = {k: v for k, v in raw.items() if self._keep_column(str(k))}
+
+        if cfg.get("use_time_features"):
+            out.update(hour=dt.hour, minute=dt.minute, dayofweek=dt.weekday(), month=dt.month)
+        if cfg.get("use_cyclical_features"):
+            minute_of_day = dt.hour * 60 + dt.minute
+            out["hour_sin"] = math.sin(2 * math.pi * dt.hour / 24.0)
+            out["hour_cos"] = math.cos(2 * math.pi * dt.hour / 24.0)
+            out["minute_of_day_sin"] = math.sin(2 * math.pi * minute_of_day / 1440.0)
+            out["minute_of_day_cos"] = math.cos(2 * math.pi * minute_of_day / 1440.0)
+
+        tmpf = {str(k).split("-")[0]: _as_float(v) for k, v in out.items() if str(k).endswith("-tmpf")}
+        if cfg.get("use_station_agg_features"):
+            for suffix, names in (
+                ("tmpf", ("mean", "std", "min", "max")),
+                ("relh", ("mean", "std")),
+                ("sped", ("mean", "std", "max")),
+            ):
+                values = [_as_float(v) for k, v in out.items() if str(k).endswith(f"-{suffix}")]
+                if values:
+                    stats = dict(zip(("mean", "std", "min", "max"), _nan_stats(values)))
+                    for name in names:
+                        out[f"{suffix}_{name}"] = stats[name]
+        if cfg.get("use_temp_dew_gap") and tmpf:
+            dwpf = {str(k).split("-")[0]: _as_float(v) for k, v in out.items() if str(k).endswith("-dwpf")}
+            gaps = []
+            for station in sorted(tmpf):
+                if station in dwpf:
+                    gap = tmpf[station] - dwpf[station]
+                    out[f"{station}_temp_dew_gap"] = gap
+                    gaps.append(gap)
+            if gaps:
+                mean, std, _, _ = _nan_stats(gaps)
+                out["temp_dew_gap_mean"] = mean
+                out["temp_dew_gap_std"] = std
+
+        loads = self._loads
+        n = len(loads)
+        for lag in self._lags:
+            out[f"load_lag_{lag}"] = loads[-lag] if n >= lag else math.nan
+        if self._windows:
+            recent = np.fromiter(loads, dtype=np.float64, count=n)
+            for w in self._windows:
+                if n >= w:
+                    window = recent[-w:]
+                    out[f"load_roll_mean_{w}"] = float(window.mean())
+                    out[f"load_roll_std_{w}"] = float(window.std(ddof=1)) if w > 1 else math.nan
+                    out[f"load_roll_min_{w}"] = float(window.min())
+                    out[f"load_roll_max_{w}"] = float(window.max())
+                else:
+                    for stat in ("mean", "std", "min", "max"):
+                        out[f"load_roll_{stat}_{w}"] = math.nan
+        for d in self._deltas:
+            out[f"load_delta_{d}"] = loads[-1] - loads[-1 - d] if n > d else math.nan
+        return out
+
+    def _vector(self, row: Dict[str, Any], what: str) -> np.ndarray:
+        missing = [c for c in self.features if c not in row]
+        if missing:
+            raise ValueError(
+                f"Live {what} is missing trained feature columns: "
+                + ", ".join(missing[:20])
+                + (" ..." if len(missing) > 20 else "")
+            )
+        return np.array([_as_float(row[c]) for c in self.features], dtype=np.float64)
+
+    def ingest(self, history: pd.DataFrame) -> int:
+        """
+        Add history rows (normalized train tail, sorted by ``dt``) newer than the last one held;
+        returns how many were added. A tail that does not reach back to the rows already held
+        (the engine fell behind) replaces the state.
+        """
+        if history.empty:
+            return 0
+        stamps = [_to_utc_naive(v) for v in history[TIMESTAMP_COLUMN].tolist()]
+        with self._lock:
+            if self._newest_dt is not None and stamps[0] > self._newest_dt:
+                self._loads.clear()
+                self._prior_rows.clear()
+                self._newest_dt = None
+            start = 0
+            if self._newest_dt is not None:
+                start = next((i for i, dt in enumerate(stamps) if dt > self._newest_dt), len(stamps))
+            if start == len(stamps):
+                return 0
+            new_rows = history.iloc[start:]
+            loads = new_rows[TARGET_COLUMN].to_numpy(dtype=np.float64)
+            columns = [c for c in history.columns if c != TIMESTAMP_COLUMN]
+            records = new_rows[columns].to_dict("records") if self.n_steps > 1 else [{}] * len(new_rows)
+            added = 0
+            for dt, load, raw in zip(stamps[start:], loads, records):
+                if self.n_steps > 1:
+                    vector = self._vector(self._row_features(dt, raw), "history rows")
+                    # Same as dropna() on the batch history features: incomplete rows are skipped.
+                    if not np.isnan(vector).any():
+                        self._prior_rows.append(vector)
+                self._loads.append(float(load))
+                self._newest_dt = dt
+                added += 1
+            return added
+
+    def features_for(self, forecast_row: Dict[str, Any]) -> tuple[np.ndarray, Optional[np.ndarray], Dict[str, float]]:
+        """
+        Feature vector for a forecast row (as returned by Supabase), the ``(n_steps, n_features)``
+        sequence ending with it when ``n_steps > 1`` (else None), and the row as a dict for logs.
+        """
+        dt = _to_utc_naive(forecast_row[TIMESTAMP_COLUMN])
+        raw = {k: v for k, v in forecast_row.items() if k not in _FORECAST_META_COLUMNS}
+        with self._lock:
+            if len(self._loads) < self._loads.maxlen and (self._lags or self._windows or self._deltas):
+                raise ValueError(
+                    f"Live feature state holds {len(self._loads)} loads; "
+                    f"{self._loads.maxlen} are needed for lag / rolling / delta features."
+                )
+            row = self._row_features(dt, raw)
+            vector = self._vector(row, "forecast row")
+            sequence = None
+            if self.n_steps > 1:
+                need_prior = self.n_steps - 1
+                if len(self._prior_rows) < need_prior:
+                    raise ValueError(
+                        f"Live sequence inference requires {need_prior} prior feature rows, "
+                        f"got {len(self._prior_rows)}."
+                    )
+                sequence = np.vstack(list(self._prior_rows) + [vector])
+        return vector, sequence, {c: row[c] for c in self.features}
@@ -105,6 +105,12 @@ def _normalize_keras_sequence_model(models: Dict[str, Any], yaml_key: str) -> No
         raise ValueError(f"`models.{yaml_key}.fit_verbose` must be 0, 1, or 2 (Keras fit verbosity).")
     cfg["fit_verbose"] = fit_verbose
     cfg["standardize_inputs"] = bool(cfg.get("standardize_inputs", False))
+    cfg["numpy_inference"] = bool(cfg.get("numpy_inference", True))
+    cfg["streaming_resync_steps"] = int(cfg.get("streaming_resync_steps", 0))
+    if cfg["streaming_resync_steps"] < 0:
+        raise ValueError(
+            f"`models.{yaml_key}.streaming_resync_steps` must be >= 0 (0 re-runs the full window per request)."
+        )
     cfg["learning_rate"] = float(cfg.get("learning_rate", 0.001))
     cfg["dense_units"] = int(cfg.get("dense_units", 16))
     if cfg["dense_units"] < 0:
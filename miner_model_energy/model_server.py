@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import bittensor as bt
+
+DEFAULT_MODEL_SERVER_TIMEOUT_SEC = 10.0
+# Share of the caller's budget forwarded as the server's deadline; the rest covers the socket round trip.
+REMOTE_DEADLINE_SHARE = 0.9
+# Largest request / response line accepted (contexts carry a feature row, so allow some room).
+_LINE_LIMIT = 4 * 1024 * 1024
+
+Answer = Callable[[str, Optional[float]], Awaitable[tuple[Optional[float], dict[str, Any]]]]
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return (json.dumps(message, default=str, ensure_ascii=True) + "\n").encode("ascii")
+
+
+class ModelServer:
+    """
+    Serves predictions to local miner processes over a Unix socket, so one process holds the
+    models, TensorFlow, the ISO-NE buffer and the Supabase clients for every hotkey on a host.
+
+    The protocol is newline-delimited JSON. A client may send several requests on one
+    connection, and connections are served concurrently:
+
+        {"timestamp": "<ISO>", "deadline_sec": 8.0}   -> {"prediction": 123.4 | null, "context": {...}}
+        {"op": "stats"}                               -> {"stats": {...}}
+
+    A request that cannot be handled is answered with ``{"error": "..."}``.
+    """
+
+    def __init__(
+        self,
+        answer: Answer,
+        socket_path: str | Path,
+        stats: Optional[Callable[[], dict[str, Any]]] = None,
+    ):
+        self.answer = answer
+        self.socket_path = Path(socket_path)
+        self.stats = stats
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def _respond(self, line: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            if request.get("op") == "stats":
+                return {"stats": self.stats() if self.stats is not None else {}}
+            timestamp = request.get("timestamp")
+            if not isinstance(timestamp, str) or not timestamp:
+                raise ValueError("request needs a timestamp string")
+            self.requests += 1
+            deadline = request.get("deadline_sec")
+            prediction, context = await self.answer(timestamp, float(deadline) if deadline is not None else None)
+            return {"prediction": prediction, "context": context}
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(_encode(await self._respond(line)))
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError) as e:
+            bt.logging.debug(f"Model server connection closed: {e}")
+        finally:
+            writer.close()
+
+    async def start(self) -> None:
+        # A socket file left by a previous run would make bind() fail.
+        if self.socket_path.is_socket():
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path), limit=_LINE_LIMIT)
+        # Miner processes of the same user / group only.
+        os.chmod(self.socket_path, 0o660)
+        bt.logging.success(f"Model server listening on {self.socket_path}")
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.socket_path.is_socket():
+            self.socket_path.unlink()
+
+
+class RemoteModelPredictor:
+    """
+    Predictor answering from a :class:`ModelServer`. Holds no model, so a miner process using
+    it stays small; the server's own fallbacks (baseline, last good value) apply on its side.
+
+    ``deadline_sec`` (the budget the caller's router gives this tier) is forwarded, shortened by
+    :data:`REMOTE_DEADLINE_SHARE`, so the server's fallback chain answers before the caller gives up.
+    """
+
+    # Tells PredictorRouter to pass its per-tier budget as ``deadline_sec``.
+    accepts_deadline = True
+
+    def __init__(self, socket_path: str | Path, timeout_sec: float = DEFAULT_MODEL_SERVER_TIMEOUT_SEC):
+        self.socket_path = str(socket_path)
+        self.timeout_sec = timeout_sec
+        self.last_prediction_context: dict[str, Any] = {}
+
+    def _answer(self, line: bytes) -> Optional[float]:
+        if not line:
+            raise ConnectionError(f"model server at {self.socket_path} closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(f"model server: {response['error']}")
+        self.last_prediction_context = {**(response.get("context") or {}), "model_server": self.socket_path}
+        return response.get("prediction")
+
+    @staticmethod
+    def _request(timestamp: str, deadline_sec: Optional[float]) -> bytes:
+        request: dict[str, Any] = {"timestamp": timestamp}
+        if deadline_sec is not None:
+            request["deadline_sec"] = deadline_sec * REMOTE_DEADLINE_SHARE
+        return _encode(request)
+
+    def predict(self, timestamp: str, deadline_sec: Optional[float] = None) -> Optional[float]:
+        timeout = self.timeout_sec if deadline_sec is None else min(self.timeout_sec, deadline_sec)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(self.socket_path)
+            conn.sendall(self._request(timestamp, deadline_sec))
+            with conn.makefile("rb") as stream:
+                return self._answer(stream.readline(_LINE_LIMIT))
+
+    async def predict_async(self, timestamp: str, deadline_sec: Optional[float] = None) -> Optional[float]:
+        reader, writer = await asyncio.open_unix_connection(self.socket_path, limit=_LINE_LIMIT)
+        try:
+            writer.write(self._request(timestamp, deadline_sec))
+            await writer.drain()
+            line = await reader.readline()
+        finally:
+            writer.close()
+        return self._answer(line)
+
+    def stats(self) -> dict[str, Any]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(self.timeout_sec)
+            conn.connect(self.socket_path)
+            conn.sendall(_encode({"op": "stats"}))
+            with conn.makefile("rb") as stream:
+                return json.loads(stream.readline(_LINE_LIMIT)).get("stats", {})
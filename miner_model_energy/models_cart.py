@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import joblib
 import numpy as np
-from sklearn.tree import DecisionTreeRegressor
+
+from .compiled_models import CompiledTree, compile_tree, load_compiled_tree, save_compiled_tree
+
+if TYPE_CHECKING:
+    from sklearn.tree import DecisionTreeRegressor
 
 
 @dataclass
 class CartBundle:
-    model: DecisionTreeRegressor
+    model: Optional[DecisionTreeRegressor]
     features: List[str]
+    compiled: Optional[CompiledTree] = None  # flat node arrays; used for inference when present
 
 
 def train_cart(X_train: np.ndarray, y_train: np.ndarray, features: List[str], cfg: Dict) -> CartBundle:
+    from sklearn.tree import DecisionTreeRegressor
+
     model = DecisionTreeRegressor(
         max_depth=cfg.get("max_depth", 6),
         min_samples_split=cfg.get("min_samples_split", 10),
@@ -22,20 +30,34 @@ def train_cart(X_train: np.ndarray, y_train: np.ndarray, features: List[str], cf
         random_state=int(cfg.get("random_state", 42)),
     )
     model.fit(X_train, y_train)
-    return CartBundle(model=model, features=features)
+    return CartBundle(model=model, features=features, compiled=compile_tree(model))
 
 
 def predict_cart(bundle: CartBundle, X: np.ndarray) -> np.ndarray:
+    if bundle.compiled is not None:
+        return bundle.compiled.predict(X)
     return bundle.model.predict(X)
 
 
+CART_COMPILED_FILENAME = "model_cart_compiled.npz"
+
+
 def save_cart(bundle: CartBundle, out_path: str) -> str:
+    if bundle.model is None:
+        raise ValueError("CART bundle was loaded from its compiled form only; there is no sklearn model to save.")
     payload = {"model": bundle.model, "features": bundle.features}
     joblib.dump(payload, out_path)
+    compiled = bundle.compiled or compile_tree(bundle.model)
+    save_compiled_tree(compiled, str(Path(out_path).parent / CART_COMPILED_FILENAME))
     return out_path
 
 
-def load_cart(path: str) -> CartBundle:
+def load_cart(path: str, compiled_path: str | None = None, features: List[str] | None = None) -> CartBundle:
+    """
+    With ``compiled_path`` pointing at the saved node arrays (and ``features`` from the
+    manifest), the joblib payload is not unpickled, so sklearn is never imported.
+    """
+    if compiled_path is not None and features is not None and Path(compiled_path).is_file():
+        return CartBundle(model=None, features=list(features), compiled=load_compiled_tree(compiled_path))
     payload = joblib.load(path)
-    return CartBundle(model=payload["model"], features=payload["features"])
-
+    return CartBundle(model=payload["model"], features=payload["features"], compiled=compile_tree(payload["model"]))
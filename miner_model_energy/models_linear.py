@@ -1,46 +1,77 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import joblib
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
+
+from .compiled_models import CompiledLinear, compile_linear, load_compiled_linear, save_compiled_linear
+
+if TYPE_CHECKING:
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import StandardScaler
 
 
 @dataclass
 class LinearBundle:
-    model: LinearRegression
-    scaler: StandardScaler
+    model: Optional[LinearRegression]
+    scaler: Optional[StandardScaler]
     features: List[str]
+    compiled: Optional[CompiledLinear] = None  # scaler folded into weights; used for inference when present
 
 
 def train_linear(X_train: np.ndarray, y_train: np.ndarray, features: List[str], cfg: Dict) -> LinearBundle:
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import StandardScaler
+
     scaler = StandardScaler()
     X_scaled = scaler.fit_transform(X_train)
     model = LinearRegression(fit_intercept=bool(cfg.get("fit_intercept", True)))
     model.fit(X_scaled, y_train)
-    return LinearBundle(model=model, scaler=scaler, features=features)
+    return LinearBundle(model=model, scaler=scaler, features=features, compiled=compile_linear(model, scaler))
 
 
 def predict_linear(bundle: LinearBundle, X: np.ndarray) -> np.ndarray:
+    if bundle.compiled is not None:
+        return bundle.compiled.predict(X)
     return bundle.model.predict(bundle.scaler.transform(X))
 
 
+LINEAR_COMPILED_FILENAME = "model_linear_compiled.npz"
+
+
 def save_linear(bundle: LinearBundle, out_path: str) -> str:
+    if bundle.model is None:
+        raise ValueError("Linear bundle was loaded from its compiled form only; there is no sklearn model to save.")
     payload = {
         "model": bundle.model,
         "scaler": bundle.scaler,
         "features": bundle.features,
     }
     joblib.dump(payload, out_path)
+    compiled = bundle.compiled or compile_linear(bundle.model, bundle.scaler)
+    save_compiled_linear(compiled, str(Path(out_path).parent / LINEAR_COMPILED_FILENAME))
     return out_path
 
 
-def load_linear(path: str) -> LinearBundle:
+def load_linear(path: str, compiled_path: str | None = None, features: List[str] | None = None) -> LinearBundle:
+    """
+    With ``compiled_path`` pointing at the saved compiled form (and ``features`` from the
+    manifest), the joblib payload is not unpickled, so sklearn is never imported.
+    """
+    if compiled_path is not None and features is not None and Path(compiled_path).is_file():
+        return LinearBundle(
+            model=None,
+            scaler=None,
+            features=list(features),
+            compiled=load_compiled_linear(compiled_path),
+        )
     payload = joblib.load(path)
     return LinearBundle(
-        model=payload["model"], scaler=payload["scaler"], features=payload["features"]
+        model=payload["model"],
+        scaler=payload["scaler"],
+        features=payload["features"],
+        compiled=compile_linear(payload["model"], payload["scaler"]),
     )
-
@@ -7,6 +7,8 @@ from typing import Dict, List, Optional, Tuple
 import joblib
 import numpy as np
 
+from .sequence_kernels import SequenceKernel, export_sequence_kernel, load_sequence_kernel, save_sequence_kernel
+
 
 @dataclass
 class LstmBundle:
@@ -14,6 +16,7 @@ class LstmBundle:
     features: List[str]
     n_steps: int
     scaler: Optional[object] = None  # sklearn StandardScaler when standardize_inputs is enabled
+    kernel: Optional[SequenceKernel] = None  # NumPy forward pass used for inference when present
 
 
 def _require_keras():
@@ -133,7 +136,13 @@ def train_lstm(
         fit_kwargs["callbacks"] = callbacks
 
     model.fit(X_seq, y_seq, **fit_kwargs)
-    return LstmBundle(model=model, features=features, n_steps=n_steps, scaler=scaler)
+    kernel: Optional[SequenceKernel] = None
+    if bool(cfg.get("numpy_inference", True)):
+        try:
+            kernel = export_sequence_kernel(model, scaler)
+        except ValueError:
+            kernel = None
+    return LstmBundle(model=model, features=features, n_steps=n_steps, scaler=scaler, kernel=kernel)
 
 
 def _apply_input_scaler(bundle: LstmBundle, X: np.ndarray) -> np.ndarray:
@@ -152,27 +161,41 @@ def _apply_input_scaler(bundle: LstmBundle, X: np.ndarray) -> np.ndarray:
     return np.asarray(out, dtype=np.float32)
 
 
+def _last_window(bundle: LstmBundle, X: np.ndarray) -> np.ndarray:
+    if len(X) < bundle.n_steps:
+        raise ValueError(
+            "Need at least n_steps rows to build LSTM inference sequence. "
+            "For a single test row, build a window from train history + test row."
+        )
+    return X[-bundle.n_steps :][np.newaxis, :, :]
+
+
 def predict_lstm(bundle: LstmBundle, X: np.ndarray) -> np.ndarray:
     """X is (n_steps, n_features) or longer 2D; or already (1, n_steps, n_features)."""
+    if bundle.kernel is not None:
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 2:
+            X = _last_window(bundle, X)
+        return bundle.kernel.predict(X)
     X = _apply_input_scaler(bundle, X)
     if X.ndim == 2:
-        if len(X) < bundle.n_steps:
-            raise ValueError(
-                "Need at least n_steps rows to build LSTM inference sequence. "
-                "For a single test row, build a window from train history + test row."
-            )
-        X = X[-bundle.n_steps :][np.newaxis, :, :]
+        X = _last_window(bundle, X)
     preds = bundle.model.predict(X, verbose=0)
     return preds.reshape(-1)
 
 
 LSTM_SCALER_FILENAME = "lstm_input_scaler.joblib"
+LSTM_KERNEL_FILENAME = "model_lstm_kernel.npz"
 
 
 def save_lstm(bundle: LstmBundle, out_path: str) -> str:
+    if bundle.model is None:
+        raise ValueError("LSTM bundle was loaded from its NumPy kernel only; there is no Keras model to save.")
     bundle.model.save(out_path)
     if bundle.scaler is not None:
         joblib.dump(bundle.scaler, Path(out_path).parent / LSTM_SCALER_FILENAME)
+    if bundle.kernel is not None:
+        save_sequence_kernel(bundle.kernel, str(Path(out_path).parent / LSTM_KERNEL_FILENAME))
     return out_path
 
 
@@ -181,17 +204,35 @@ def load_lstm(
     features: List[str],
     n_steps: int,
     scaler_path: str | None = None,
+    kernel_path: str | None = None,
+    numpy_inference: bool = True,
 ) -> LstmBundle:
-    try:
-        from tensorflow.keras.models import load_model
-    except Exception as exc:
-        raise RuntimeError("TensorFlow/Keras is required to load saved LSTM model.") from exc
-    model = load_model(path)
+    """
+    With ``kernel_path`` pointing at an exported NumPy kernel, the Keras model is not loaded
+    (``model`` is None) and TensorFlow is never imported; the input scaler is only loaded when the
+    kernel does not carry it. Otherwise the Keras model is loaded and, unless ``numpy_inference``
+    is False (``models.lstm.numpy_inference: false``), a kernel is exported from it when possible.
+    """
+    kernel: Optional[SequenceKernel] = None
+    model = None
+    if numpy_inference and kernel_path is not None and Path(kernel_path).is_file():
+        kernel = load_sequence_kernel(kernel_path)
     scaler = None
-    if scaler_path is not None:
+    if scaler_path is not None and (kernel is None or kernel.scaler_mean is None):
         sp = Path(scaler_path)
         if not sp.is_file():
             raise FileNotFoundError(f"LSTM input scaler missing at {scaler_path}")
         scaler = joblib.load(sp)
-    return LstmBundle(model=model, features=features, n_steps=n_steps, scaler=scaler)
+    if kernel is None:
+        try:
+            from tensorflow.keras.models import load_model
+        except Exception as exc:
+            raise RuntimeError("TensorFlow/Keras is required to load saved LSTM model.") from exc
+        model = load_model(path)
+        if numpy_inference:
+            try:
+                kernel = export_sequence_kernel(model, scaler)
+            except ValueError:
+                kernel = None
+    return LstmBundle(model=model, features=features, n_steps=n_steps, scaler=scaler, kernel=kernel)
 
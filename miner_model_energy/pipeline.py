@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+from dataclasses import dataclass, field, replace
 import json
 import time
 import warnings
@@ -10,7 +11,6 @@ from typing import Any, Dict, List, Tuple
 import bittensor as bt
 import numpy as np
 import pandas as pd
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
 from .artifacts import (
     feature_signature,
@@ -26,19 +26,23 @@ from .features import (
     build_feature_columns,
     filter_weather_suffix_columns,
 )
+from .live_features import LiveFeatureEngine
 from .ml_config import ModelConfig
-from .models_cart import predict_cart, save_cart, train_cart
+from .models_cart import CART_COMPILED_FILENAME, predict_cart, save_cart, train_cart
 from .models_cart import load_cart
-from .models_linear import LinearBundle, load_linear, predict_linear, save_linear, train_linear
-from .models_lstm import LSTM_SCALER_FILENAME, load_lstm, make_sequences, predict_lstm, save_lstm, train_lstm
-from .models_rnn import RNN_SCALER_FILENAME, load_rnn, predict_rnn, save_rnn, train_rnn
+from .models_linear import LINEAR_COMPILED_FILENAME, LinearBundle, load_linear, predict_linear, save_linear, train_linear
+from .models_lstm import LSTM_KERNEL_FILENAME, LSTM_SCALER_FILENAME, load_lstm, make_sequences, predict_lstm, save_lstm, train_lstm
+from .models_rnn import RNN_KERNEL_FILENAME, RNN_SCALER_FILENAME, load_rnn, predict_rnn, save_rnn, train_rnn
+from .sequence_kernels import StreamingSequenceState
 from .split import temporal_train_val_split
 from .supabase_io import (
     create_supabase_data_client,
-    fetch_supabase_test_row,
-    fetch_supabase_test_row_for_probe,
+    fetch_live_inputs,
+    fetch_live_inputs_async,
+    fetch_live_inputs_batch,
+    fetch_live_inputs_batch_async,
     fetch_supabase_train_all,
-    fetch_supabase_train_tail,
+    get_supabase_data_client,
     normalize_supabase_test_frame,
 )
 from .storage_train_io import load_train_from_storage_parts
@@ -60,6 +64,22 @@ class TrainingResult:
     durations_sec: Dict[str, float] = field(default_factory=dict)
 
 
+def without_training_frames(result: TrainingResult) -> TrainingResult:
+    """
+    Copy of ``result`` for serving: train/test frames emptied (columns kept) and the
+    train/validation arrays dropped, so a long-running miner does not hold the training data.
+    """
+    return replace(
+        result,
+        train_frame=result.train_frame.iloc[0:0].copy(),
+        test_frame=result.test_frame.iloc[0:0].copy(),
+        y_train=np.array([]),
+        train_pred=np.array([]),
+        y_val=np.array([]),
+        val_pred=np.array([]),
+    )
+
+
 def _as_numpy(frame: pd.DataFrame, features: List[str]) -> np.ndarray:
     return frame[features].astype(float).to_numpy()
 
@@ -159,6 +179,9 @@ def _fmt_sec(seconds: float) -> str:
 
 
 def _metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    # Imported here so serving compiled / kernel bundles never loads sklearn.
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
     rmse = float(np.sqrt(mean_squared_error(y_true, y_pred)))
     mae = float(mean_absolute_error(y_true, y_pred))
     mape = float(np.mean(np.abs((y_true - y_pred) / np.clip(np.abs(y_true), 1e-6, None))) * 100.0)
@@ -540,19 +563,20 @@ def build_sequence_inference_matrix(result: TrainingResult) -> np.ndarray:
     bundle = result.model_bundle
     n_steps = int(bundle.n_steps)
     feats = result.features
-    train_x = result.train_frame[feats].astype(float).to_numpy()
     test_x = result.test_frame[feats].astype(float).to_numpy()
 
     if test_x.shape[0] >= n_steps:
         return test_x[-n_steps:]
 
     need_prior = n_steps - test_x.shape[0]
-    if train_x.shape[0] < need_prior:
+    n_train = len(result.train_frame)
+    if n_train < need_prior:
         raise ValueError(
             f"Sequence model inference needs {need_prior} prior timestep(s) from training history; "
-            f"train_frame has only {train_x.shape[0]} row(s)."
+            f"train_frame has only {n_train} row(s)."
         )
-    prior = train_x[-need_prior:]
+    # Only the tail is converted; the rest of the train frame is never needed here.
+    prior = result.train_frame[feats].iloc[-need_prior:].astype(float).to_numpy()
     return np.vstack([prior, test_x])
 
 
@@ -567,7 +591,8 @@ def predict_single_test_row(result: TrainingResult) -> float:
 
 
 def predict_single_test_row_with_context(result: TrainingResult) -> tuple[float, Dict[str, Any]]:
-    X_test = result.test_frame[result.features].astype(float).to_numpy()
+    # Linear / CART answer for the first test row; only that row is converted.
+    X_test = result.test_frame[result.features].iloc[:1].astype(float).to_numpy()
     if result.model_type == "linear":
         pred = predict_linear(result.model_bundle, X_test)[0]
     elif result.model_type == "cart":
@@ -645,6 +670,47 @@ def required_history_rows_for_probe(config: ModelConfig, sequence_n_steps: int |
     return int(needed)
 
 
+def _live_feature_frames(
+    config: ModelConfig, history: pd.DataFrame, forecast_row: Dict[str, Any]
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Batch feature engineering of a live history tail and forecast row (history, test)."""
+    forecast_frame = normalize_supabase_test_frame(pd.DataFrame([forecast_row]))
+    suffix_whitelist = config.features.get("include_weather_suffix_groups")
+    history_filtered = filter_weather_suffix_columns(history, suffix_whitelist)
+    forecast_filtered = filter_weather_suffix_columns(forecast_frame, suffix_whitelist)
+
+    history_features = add_engineered_features(history_filtered, config.features)
+    test_features = add_engineered_features(forecast_filtered, config.features)
+    feats_cfg = config.features
+    if (
+        feats_cfg.get("use_load_lags", False)
+        or feats_cfg.get("use_load_rolling", False)
+        or feats_cfg.get("use_load_delta", False)
+    ):
+        test_features = add_test_load_features_from_history(test_features, history_filtered, feats_cfg)
+    return history_features, test_features
+
+
+def make_live_feature_engine(result: TrainingResult, config: ModelConfig) -> LiveFeatureEngine:
+    """Incremental feature state matching ``result``'s features (and sequence length for LSTM/RNN)."""
+    n_steps = int(getattr(result.model_bundle, "n_steps", 12)) if result.model_type in {"lstm", "rnn"} else 1
+    return LiveFeatureEngine(config.features, result.features, n_steps=n_steps)
+
+
+def make_streaming_state(result: TrainingResult, config: ModelConfig) -> StreamingSequenceState | None:
+    """
+    Streaming recurrent state for a live LSTM / RNN served by its NumPy kernel when
+    ``models.<type>.streaming_resync_steps`` is > 0; None otherwise (full window per request).
+    """
+    if result.model_type not in {"lstm", "rnn"}:
+        return None
+    kernel = getattr(result.model_bundle, "kernel", None)
+    resync_steps = int(config.models.get(result.model_type, {}).get("streaming_resync_steps", 0))
+    if kernel is None or resync_steps <= 0:
+        return None
+    return StreamingSequenceState(kernel, resync_steps)
+
+
 def _build_live_sequence_matrix(
     history_features: pd.DataFrame,
     test_row: pd.DataFrame,
@@ -661,20 +727,40 @@ def _build_live_sequence_matrix(
     return np.vstack([prior[-need_prior:], x_test])
 
 
-def live_probe_feature_matrix_for_custom(
-    config: ModelConfig,
-    timestamp_str: str,
-    feature_list: List[str],
-    sequence_n_steps: int | None,
-    *,
-    use_resilient_forecast_fetch: bool = False,
-) -> tuple[np.ndarray, Dict[str, Any]]:
+class CsvProbeIndex:
     """
-    Build the same engineered feature matrix used at inference time for a custom plugin model.
-    Returns X with shape (1, n_features) for dense / sklearn models, or (1, n_steps, n_features) for sequence Keras.
+    CSV-mode inference inputs for a custom plugin, prepared once at deploy.
+
+    :func:`prepare_training_data` runs in :meth:`build`; only the test rows' feature matrix
+    (sorted by ``dt``, indexed by timestamp) and, for sequence models, the last ``n_steps - 1``
+    complete train rows are kept. :meth:`matrix_for` is then a dictionary lookup (nearest test
+    row when the timestamp is not exact) instead of re-reading the CSVs per request.
     """
-    source = config.data.get("source", "csv")
-    if source not in {"supabase", "supabase_storage"}:
+
+    def __init__(
+        self,
+        features: List[str],
+        stamps_ns: np.ndarray,
+        rows: np.ndarray,
+        prior: np.ndarray | None,
+        fallback_pos: int,
+        source: str = "csv",
+    ):
+        self.features = list(features)
+        self.source = source
+        self._stamps_ns = stamps_ns
+        self._rows = rows
+        self._rows32 = rows.astype(np.float32)
+        self._prior32 = None if prior is None else prior.astype(np.float32)
+        self._fallback_pos = fallback_pos
+        self._by_stamp: Dict[int, int] = {}
+        for pos, ns in enumerate(stamps_ns.tolist()):
+            self._by_stamp.setdefault(ns, pos)
+
+    @classmethod
+    def build(
+        cls, config: ModelConfig, feature_list: List[str], sequence_n_steps: int | None
+    ) -> "CsvProbeIndex":
         train_model, test, _ = prepare_training_data(config, show_progress=False)
         if test.empty:
             raise ValueError("CSV probe: test frame is empty.")
@@ -683,122 +769,306 @@ def live_probe_feature_matrix_for_custom(
             raise ValueError(
                 "CSV probe: test frame missing feature columns: " + ", ".join(missing[:30])
             )
-        ts = pd.to_datetime(timestamp_str, errors="coerce")
-        if pd.isna(ts):
-            row_df = test.iloc[[-1]]
-        else:
-            test_sorted = test.sort_values(TIMESTAMP_COLUMN)
-            dt_series = test_sorted[TIMESTAMP_COLUMN]
-            pos = int((dt_series - ts).abs().values.argmin())
-            row_df = test_sorted.iloc[[pos]]
         missing_hist = [c for c in feature_list if c not in train_model.columns]
         if missing_hist:
             raise ValueError(
                 "CSV probe: train frame missing feature columns: " + ", ".join(missing_hist[:30])
             )
+        stamps = pd.to_datetime(test[TIMESTAMP_COLUMN]).to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        order = np.argsort(stamps, kind="stable")
+        rows = test[feature_list].astype(float).to_numpy()[order]
+        prior = None
         n_seq = int(sequence_n_steps or 0)
         if n_seq > 1:
-            seq = _build_live_sequence_matrix(train_model, row_df, feature_list, n_seq)
-            X = np.asarray(seq[np.newaxis, :, :], dtype=np.float32)
+            complete = train_model[feature_list].dropna().astype(float).to_numpy()
+            need_prior = n_seq - 1
+            if complete.shape[0] < need_prior:
+                raise ValueError(
+                    f"Live sequence inference requires {need_prior} prior feature rows, got {complete.shape[0]}."
+                )
+            prior = complete[-need_prior:]
+        # An unparseable request timestamp falls back to the last test row in file order.
+        fallback_pos = int(np.flatnonzero(order == len(test) - 1)[0])
+        return cls(feature_list, stamps[order], rows, prior, fallback_pos, config.data.get("source", "csv"))
+
+    def _position(self, timestamp_str: str) -> int:
+        ts = pd.to_datetime(timestamp_str, errors="coerce")
+        if pd.isna(ts):
+            return self._fallback_pos
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        ns = int(ts.value)
+        pos = self._by_stamp.get(ns)
+        if pos is not None:
+            return pos
+        # Nearest test row; ties go to the earlier row, like argmin over |dt - ts|.
+        right = int(np.searchsorted(self._stamps_ns, ns))
+        if right == 0:
+            return 0
+        if right == len(self._stamps_ns):
+            return right - 1
+        left = right - 1
+        return left if ns - self._stamps_ns[left] <= self._stamps_ns[right] - ns else right
+
+    def matrix_for(self, timestamp_str: str) -> tuple[np.ndarray, Dict[str, Any]]:
+        pos = self._position(timestamp_str)
+        row32 = self._rows32[pos]
+        if self._prior32 is not None:
+            X = np.vstack([self._prior32, row32])[np.newaxis, :, :]
         else:
-            X = row_df[feature_list].astype(float).to_numpy(dtype=np.float32)
-            if X.ndim == 1:
-                X = X[np.newaxis, :]
+            X = row32[np.newaxis, :]
         ctx: Dict[str, Any] = {
-            "source": source,
+            "source": self.source,
             "requested_timestamp": timestamp_str,
-            "model_input_row": row_df[feature_list].iloc[0].to_dict(),
+            "model_input_row": dict(zip(self.features, self._rows[pos].tolist())),
         }
         return X, ctx
 
+
+def live_probe_feature_matrix_for_custom(
+    config: ModelConfig,
+    timestamp_str: str,
+    feature_list: List[str],
+    sequence_n_steps: int | None,
+    *,
+    use_resilient_forecast_fetch: bool = False,
+    client=None,
+    engine: LiveFeatureEngine | None = None,
+    csv_index: CsvProbeIndex | None = None,
+) -> tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Build the same engineered feature matrix used at inference time for a custom plugin model.
+    Returns X with shape (1, n_features) for dense / sklearn models, or (1, n_steps, n_features) for sequence Keras.
+    Supabase sources use ``client`` when given, else the shared client for the configured project,
+    and build features incrementally when an ``engine`` is given. CSV sources answer from
+    ``csv_index`` when given; otherwise the CSVs are prepared for this one call.
+    """
+    source = config.data.get("source", "csv")
+    if source not in {"supabase", "supabase_storage"}:
+        index = csv_index or CsvProbeIndex.build(config, feature_list, sequence_n_steps)
+        return index.matrix_for(timestamp_str)
+
     data_cfg = config.data
-    schema = data_cfg["supabase_schema"]
-    train_table = data_cfg["supabase_train_table"]
-    test_table = data_cfg["supabase_test_table"]
-    horizon = int(data_cfg.get("forecast_horizon_min", 5))
-    page_size = int(data_cfg.get("supabase_page_size", 1000))
     needed_rows = required_history_rows_for_probe(config, sequence_n_steps)
-
     try:
-        client = create_supabase_data_client(data_cfg["supabase_url"], data_cfg["supabase_key"])
-        history = fetch_supabase_train_tail(client, schema=schema, table=train_table, n_rows=needed_rows)
-        if use_resilient_forecast_fetch:
-            forecast_row = fetch_supabase_test_row_for_probe(
-                client,
-                schema=schema,
-                table=test_table,
-                dt_target=timestamp_str,
-                horizon_min=horizon,
-            )
-        else:
-            forecast_row = fetch_supabase_test_row(
-                client,
-                schema=schema,
-                table=test_table,
-                dt_target=timestamp_str,
-                horizon_min=horizon,
-                nearest_fallback_minutes=5,
-            )
+        client = client or get_supabase_data_client(data_cfg["supabase_url"], data_cfg["supabase_key"])
+        history, forecast_row = fetch_live_inputs(
+            client,
+            data_cfg["supabase_schema"],
+            data_cfg["supabase_train_table"],
+            data_cfg["supabase_test_table"],
+            needed_rows,
+            timestamp_str,
+            int(data_cfg.get("forecast_horizon_min", 5)),
+            nearest_fallback_minutes=5,
+            resilient=use_resilient_forecast_fetch,
+        )
     except Exception as exc:
-        raise ValueError(
-            "Supabase live probe failed while fetching data "
-            f"(schema={schema}, train_table={train_table}, test_table={test_table}, "
-            f"timestamp={timestamp_str}, horizon_min={horizon}, page_size={page_size}): {exc}"
-        ) from exc
+        raise _live_fetch_error("probe", config, timestamp_str, exc) from exc
+    return custom_feature_matrix_from_live_inputs(
+        config, timestamp_str, feature_list, sequence_n_steps, history, forecast_row, engine
+    )
 
-    if forecast_row is None:
-        raise ValueError(
-            "Supabase live probe found no forecast row "
-            f"(schema={schema}, table={test_table}, timestamp={timestamp_str}, horizon_min={horizon})."
+
+async def live_probe_feature_matrix_for_custom_async(
+    config: ModelConfig,
+    timestamp_str: str,
+    feature_list: List[str],
+    sequence_n_steps: int | None,
+    client,
+    engine: LiveFeatureEngine | None = None,
+) -> tuple[np.ndarray, Dict[str, Any]]:
+    """
+    :func:`live_probe_feature_matrix_for_custom` for Supabase sources with a supabase AsyncClient:
+    queries run concurrently on the event loop, feature engineering in a worker thread.
+    """
+    data_cfg = config.data
+    needed_rows = required_history_rows_for_probe(config, sequence_n_steps)
+    try:
+        history, forecast_row = await fetch_live_inputs_async(
+            client,
+            data_cfg["supabase_schema"],
+            data_cfg["supabase_train_table"],
+            data_cfg["supabase_test_table"],
+            needed_rows,
+            timestamp_str,
+            int(data_cfg.get("forecast_horizon_min", 5)),
+            nearest_fallback_minutes=5,
         )
+    except Exception as exc:
+        raise _live_fetch_error("probe", config, timestamp_str, exc) from exc
+    return await asyncio.to_thread(
+        custom_feature_matrix_from_live_inputs,
+        config,
+        timestamp_str,
+        feature_list,
+        sequence_n_steps,
+        history,
+        forecast_row,
+        engine,
+    )
 
-    forecast_frame = normalize_supabase_test_frame(pd.DataFrame([forecast_row]))
-    suffix_whitelist = config.features.get("include_weather_suffix_groups")
-    history_filtered = filter_weather_suffix_columns(history, suffix_whitelist)
-    forecast_filtered = filter_weather_suffix_columns(forecast_frame, suffix_whitelist)
 
-    history_features = add_engineered_features(history_filtered, config.features)
-    test_features = add_engineered_features(forecast_filtered, config.features)
-    feats_cfg = config.features
-    if (
-        feats_cfg.get("use_load_lags", False)
-        or feats_cfg.get("use_load_rolling", False)
-        or feats_cfg.get("use_load_delta", False)
-    ):
-        test_features = add_test_load_features_from_history(test_features, history_filtered, feats_cfg)
+def _custom_batch_fetch_args(config: ModelConfig, timestamps: List[str], sequence_n_steps: int | None) -> tuple:
+    data_cfg = config.data
+    return (
+        data_cfg["supabase_schema"],
+        data_cfg["supabase_train_table"],
+        data_cfg["supabase_test_table"],
+        required_history_rows_for_probe(config, sequence_n_steps),
+        timestamps,
+        int(data_cfg.get("forecast_horizon_min", 5)),
+    )
 
-    missing = [c for c in feature_list if c not in test_features.columns]
-    if missing:
-        raise ValueError(
-            "Live probe: forecast row missing feature columns: " + ", ".join(missing[:20])
-            + (" ..." if len(missing) > 20 else "")
+
+def _custom_matrices_from_batch_inputs(
+    config: ModelConfig,
+    timestamps: List[str],
+    feature_list: List[str],
+    sequence_n_steps: int | None,
+    history: pd.DataFrame,
+    forecast_rows: List[Dict[str, Any] | None | Exception],
+    engine: LiveFeatureEngine | None,
+) -> List[tuple[np.ndarray, Dict[str, Any]] | Exception]:
+    out: List[tuple[np.ndarray, Dict[str, Any]] | Exception] = []
+    for timestamp_str, forecast_row in zip(timestamps, forecast_rows):
+        try:
+            if isinstance(forecast_row, Exception):
+                raise _live_fetch_error("probe", config, timestamp_str, forecast_row)
+            out.append(
+                custom_feature_matrix_from_live_inputs(
+                    config, timestamp_str, feature_list, sequence_n_steps, history, forecast_row, engine
+                )
+            )
+        except Exception as exc:
+            out.append(exc)
+    return out
+
+
+def live_probe_feature_matrices_for_custom(
+    config: ModelConfig,
+    timestamps: List[str],
+    feature_list: List[str],
+    sequence_n_steps: int | None,
+    *,
+    client=None,
+    engine: LiveFeatureEngine | None = None,
+    csv_index: CsvProbeIndex | None = None,
+) -> List[tuple[np.ndarray, Dict[str, Any]] | Exception]:
+    """
+    :func:`live_probe_feature_matrix_for_custom` for several timestamps; a timestamp whose inputs
+    cannot be built gets its exception in place of ``(X, ctx)``. Supabase sources fetch the
+    shared history once and the forecast rows concurrently.
+    """
+    source = config.data.get("source", "csv")
+    if source not in {"supabase", "supabase_storage"}:
+        index = csv_index or CsvProbeIndex.build(config, feature_list, sequence_n_steps)
+        out: List[tuple[np.ndarray, Dict[str, Any]] | Exception] = []
+        for timestamp_str in timestamps:
+            try:
+                out.append(index.matrix_for(timestamp_str))
+            except Exception as exc:
+                out.append(exc)
+        return out
+
+    data_cfg = config.data
+    try:
+        client = client or get_supabase_data_client(data_cfg["supabase_url"], data_cfg["supabase_key"])
+        history, forecast_rows = fetch_live_inputs_batch(
+            client, *_custom_batch_fetch_args(config, timestamps, sequence_n_steps)
+        )
+    except Exception as exc:
+        raise _live_fetch_error("probe", config, ", ".join(timestamps), exc) from exc
+    return _custom_matrices_from_batch_inputs(
+        config, timestamps, feature_list, sequence_n_steps, history, forecast_rows, engine
+    )
+
+
+async def live_probe_feature_matrices_for_custom_async(
+    config: ModelConfig,
+    timestamps: List[str],
+    feature_list: List[str],
+    sequence_n_steps: int | None,
+    client,
+    engine: LiveFeatureEngine | None = None,
+) -> List[tuple[np.ndarray, Dict[str, Any]] | Exception]:
+    """:func:`live_probe_feature_matrices_for_custom` for Supabase sources with a supabase AsyncClient."""
+    try:
+        history, forecast_rows = await fetch_live_inputs_batch_async(
+            client, *_custom_batch_fetch_args(config, timestamps, sequence_n_steps)
         )
-    missing_history = [c for c in feature_list if c not in history_features.columns]
-    if missing_history:
+    except Exception as exc:
+        raise _live_fetch_error("probe", config, ", ".join(timestamps), exc) from exc
+    return await asyncio.to_thread(
+        _custom_matrices_from_batch_inputs,
+        config,
+        timestamps,
+        feature_list,
+        sequence_n_steps,
+        history,
+        forecast_rows,
+        engine,
+    )
+
+
+def custom_feature_matrix_from_live_inputs(
+    config: ModelConfig,
+    timestamp_str: str,
+    feature_list: List[str],
+    sequence_n_steps: int | None,
+    history: pd.DataFrame,
+    forecast_row: Dict[str, Any] | None,
+    engine: LiveFeatureEngine | None = None,
+) -> tuple[np.ndarray, Dict[str, Any]]:
+    """Custom-model feature matrix from already fetched Supabase history and forecast row."""
+    source = config.data.get("source", "csv")
+    schema = config.data["supabase_schema"]
+    test_table = config.data["supabase_test_table"]
+    horizon = int(config.data.get("forecast_horizon_min", 5))
+    if forecast_row is None:
         raise ValueError(
-            "Live probe: history rows missing feature columns: " + ", ".join(missing_history[:20])
-            + (" ..." if len(missing_history) > 20 else "")
+            "Supabase live probe found no forecast row "
+            f"(schema={schema}, table={test_table}, timestamp={timestamp_str}, horizon_min={horizon})."
         )
 
     n_seq = int(sequence_n_steps or 0)
-    if n_seq > 1:
-        seq = _build_live_sequence_matrix(
-            history_features=history_features,
-            test_row=test_features,
-            features=feature_list,
-            n_steps=n_seq,
-        )
-        X = np.asarray(seq[np.newaxis, :, :], dtype=np.float32)
+    if engine is not None:
+        engine.ingest(history)
+        x_row, seq, model_input_row = engine.features_for(forecast_row)
+        X = np.asarray(seq[np.newaxis, :, :] if n_seq > 1 else x_row[np.newaxis, :], dtype=np.float32)
     else:
-        X = test_features[feature_list].astype(float).to_numpy(dtype=np.float32)
-        if X.ndim == 1:
-            X = X[np.newaxis, :]
+        history_features, test_features = _live_feature_frames(config, history, forecast_row)
+        missing = [c for c in feature_list if c not in test_features.columns]
+        if missing:
+            raise ValueError(
+                "Live probe: forecast row missing feature columns: " + ", ".join(missing[:20])
+                + (" ..." if len(missing) > 20 else "")
+            )
+        missing_history = [c for c in feature_list if c not in history_features.columns]
+        if missing_history:
+            raise ValueError(
+                "Live probe: history rows missing feature columns: " + ", ".join(missing_history[:20])
+                + (" ..." if len(missing_history) > 20 else "")
+            )
 
-    model_input_row = (
-        test_features[feature_list].iloc[0].to_dict()
-        if not test_features.empty
-        else {}
-    )
+        if n_seq > 1:
+            seq = _build_live_sequence_matrix(
+                history_features=history_features,
+                test_row=test_features,
+                features=feature_list,
+                n_steps=n_seq,
+            )
+            X = np.asarray(seq[np.newaxis, :, :], dtype=np.float32)
+        else:
+            X = test_features[feature_list].astype(float).to_numpy(dtype=np.float32)
+            if X.ndim == 1:
+                X = X[np.newaxis, :]
+
+        model_input_row = (
+            test_features[feature_list].iloc[0].to_dict()
+            if not test_features.empty
+            else {}
+        )
     latest_train_row = history.iloc[-1].to_dict() if not history.empty else {}
     ctx = {
         "source": source,
@@ -815,39 +1085,95 @@ def predict_for_timestamp(result: TrainingResult, config: ModelConfig, timestamp
     return pred
 
 
+def _live_fetch_error(label: str, config: ModelConfig, timestamp_str: str, exc: Exception) -> ValueError:
+    data_cfg = config.data
+    return ValueError(
+        f"Supabase live {label} failed while fetching data "
+        f"(schema={data_cfg['supabase_schema']}, train_table={data_cfg['supabase_train_table']}, "
+        f"test_table={data_cfg['supabase_test_table']}, timestamp={timestamp_str}, "
+        f"horizon_min={int(data_cfg.get('forecast_horizon_min', 5))}, "
+        f"page_size={int(data_cfg.get('supabase_page_size', 1000))}): {exc}"
+    )
+
+
 def predict_for_timestamp_with_context(
-    result: TrainingResult, config: ModelConfig, timestamp_str: str
+    result: TrainingResult,
+    config: ModelConfig,
+    timestamp_str: str,
+    client=None,
+    engine: LiveFeatureEngine | None = None,
+    streaming: StreamingSequenceState | None = None,
 ) -> tuple[float, Dict[str, Any]]:
+    """
+    Live prediction for ``timestamp_str``. Supabase sources fetch the recent history and the
+    forecast row in parallel through ``client`` (default: the shared client for the project).
+    """
     source = config.data.get("source", "csv")
     if source not in {"supabase", "supabase_storage"}:
         return predict_single_test_row_with_context(result)
 
     data_cfg = config.data
-    schema = data_cfg["supabase_schema"]
-    train_table = data_cfg["supabase_train_table"]
-    test_table = data_cfg["supabase_test_table"]
-    horizon = int(data_cfg.get("forecast_horizon_min", 5))
-    page_size = int(data_cfg.get("supabase_page_size", 1000))
+    try:
+        client = client or get_supabase_data_client(data_cfg["supabase_url"], data_cfg["supabase_key"])
+        history, forecast_row = fetch_live_inputs(
+            client,
+            data_cfg["supabase_schema"],
+            data_cfg["supabase_train_table"],
+            data_cfg["supabase_test_table"],
+            _required_history_rows_for_live(result, config),
+            timestamp_str,
+            int(data_cfg.get("forecast_horizon_min", 5)),
+            nearest_fallback_minutes=5,
+        )
+    except Exception as exc:
+        raise _live_fetch_error("inference", config, timestamp_str, exc) from exc
+    return predict_from_live_inputs(result, config, timestamp_str, history, forecast_row, engine, streaming)
+
 
+async def predict_for_timestamp_with_context_async(
+    result: TrainingResult,
+    config: ModelConfig,
+    timestamp_str: str,
+    client,
+    engine: LiveFeatureEngine | None = None,
+    streaming: StreamingSequenceState | None = None,
+) -> tuple[float, Dict[str, Any]]:
+    """
+    :func:`predict_for_timestamp_with_context` for Supabase sources with a supabase AsyncClient:
+    both queries run concurrently on the event loop, features and the model in a worker thread.
+    """
+    data_cfg = config.data
     try:
-        client = create_supabase_data_client(data_cfg["supabase_url"], data_cfg["supabase_key"])
-        needed_rows = _required_history_rows_for_live(result, config)
-        history = fetch_supabase_train_tail(client, schema=schema, table=train_table, n_rows=needed_rows)
-        forecast_row = fetch_supabase_test_row(
+        history, forecast_row = await fetch_live_inputs_async(
             client,
-            schema=schema,
-            table=test_table,
-            dt_target=timestamp_str,
-            horizon_min=horizon,
+            data_cfg["supabase_schema"],
+            data_cfg["supabase_train_table"],
+            data_cfg["supabase_test_table"],
+            _required_history_rows_for_live(result, config),
+            timestamp_str,
+            int(data_cfg.get("forecast_horizon_min", 5)),
             nearest_fallback_minutes=5,
         )
     except Exception as exc:
-        raise ValueError(
-            "Supabase live inference failed while fetching data "
-            f"(schema={schema}, train_table={train_table}, test_table={test_table}, "
-            f"timestamp={timestamp_str}, horizon_min={horizon}, page_size={page_size}): {exc}"
-        ) from exc
+        raise _live_fetch_error("inference", config, timestamp_str, exc) from exc
+    return await asyncio.to_thread(
+        predict_from_live_inputs, result, config, timestamp_str, history, forecast_row, engine, streaming
+    )
 
+
+def _live_model_inputs(
+    result: TrainingResult,
+    config: ModelConfig,
+    timestamp_str: str,
+    history: pd.DataFrame,
+    forecast_row: Dict[str, Any] | None,
+    engine: LiveFeatureEngine | None = None,
+) -> tuple[np.ndarray, np.ndarray | None, Dict[str, Any]]:
+    """Model input row ``(1, n_features)``, sequence window (LSTM / RNN) and context for one request."""
+    source = config.data.get("source", "csv")
+    schema = config.data["supabase_schema"]
+    test_table = config.data["supabase_test_table"]
+    horizon = int(config.data.get("forecast_horizon_min", 5))
     if forecast_row is None:
         raise ValueError(
             "Supabase live inference found no forecast row "
@@ -861,66 +1187,42 @@ def predict_for_timestamp_with_context(
         f"selected_horizon_min={forecast_row.get('horizon_min')}"
     )
 
-    forecast_frame = normalize_supabase_test_frame(pd.DataFrame([forecast_row]))
-    suffix_whitelist = config.features.get("include_weather_suffix_groups")
-    history_filtered = filter_weather_suffix_columns(history, suffix_whitelist)
-    forecast_filtered = filter_weather_suffix_columns(forecast_frame, suffix_whitelist)
-
-    history_features = add_engineered_features(history_filtered, config.features)
-    test_features = add_engineered_features(forecast_filtered, config.features)
-    feats_cfg = config.features
-    if (
-        feats_cfg.get("use_load_lags", False)
-        or feats_cfg.get("use_load_rolling", False)
-        or feats_cfg.get("use_load_delta", False)
-    ):
-        test_features = add_test_load_features_from_history(test_features, history_filtered, feats_cfg)
-
-    missing = [c for c in result.features if c not in test_features.columns]
-    if missing:
-        raise ValueError(
-            "Live forecast row is missing trained feature columns: "
-            + ", ".join(missing[:20])
-            + (" ..." if len(missing) > 20 else "")
-        )
-    missing_history = [c for c in result.features if c not in history_features.columns]
-    if missing_history:
-        raise ValueError(
-            "Live history rows are missing trained feature columns: "
-            + ", ".join(missing_history[:20])
-            + (" ..." if len(missing_history) > 20 else "")
-        )
-
-    if result.model_type == "linear":
-        pred = predict_linear(result.model_bundle, test_features[result.features].astype(float).to_numpy())[0]
-    elif result.model_type == "cart":
-        pred = predict_cart(result.model_bundle, test_features[result.features].astype(float).to_numpy())[0]
-    elif result.model_type == "lstm":
-        n_steps = int(getattr(result.model_bundle, "n_steps", 12))
-        seq = _build_live_sequence_matrix(
-            history_features=history_features,
-            test_row=test_features,
-            features=result.features,
-            n_steps=n_steps,
-        )
-        pred = predict_lstm(result.model_bundle, seq)[0]
-    elif result.model_type == "rnn":
-        n_steps = int(getattr(result.model_bundle, "n_steps", 12))
-        seq = _build_live_sequence_matrix(
-            history_features=history_features,
-            test_row=test_features,
-            features=result.features,
-            n_steps=n_steps,
-        )
-        pred = predict_rnn(result.model_bundle, seq)[0]
+    sequence_model = result.model_type in {"lstm", "rnn"}
+    if engine is not None:
+        engine.ingest(history)
+        x_row, seq, model_input_row = engine.features_for(forecast_row)
+        x_test = x_row[np.newaxis, :]
     else:
-        raise ValueError(f"Unsupported model type: {result.model_type}")
+        history_features, test_features = _live_feature_frames(config, history, forecast_row)
+        missing = [c for c in result.features if c not in test_features.columns]
+        if missing:
+            raise ValueError(
+                "Live forecast row is missing trained feature columns: "
+                + ", ".join(missing[:20])
+                + (" ..." if len(missing) > 20 else "")
+            )
+        missing_history = [c for c in result.features if c not in history_features.columns]
+        if missing_history:
+            raise ValueError(
+                "Live history rows are missing trained feature columns: "
+                + ", ".join(missing_history[:20])
+                + (" ..." if len(missing_history) > 20 else "")
+            )
+        x_test = test_features[result.features].astype(float).to_numpy()
+        seq = None
+        if sequence_model:
+            seq = _build_live_sequence_matrix(
+                history_features=history_features,
+                test_row=test_features,
+                features=result.features,
+                n_steps=int(getattr(result.model_bundle, "n_steps", 12)),
+            )
+        model_input_row = (
+            test_features[result.features].iloc[0].to_dict()
+            if not test_features.empty
+            else {}
+        )
 
-    model_input_row = (
-        test_features[result.features].iloc[0].to_dict()
-        if not test_features.empty
-        else {}
-    )
     latest_train_row = history.iloc[-1].to_dict() if not history.empty else {}
     context: Dict[str, Any] = {
         "source": source,
@@ -930,9 +1232,145 @@ def predict_for_timestamp_with_context(
         "train_row_latest_raw": latest_train_row,
         "model_input_row": model_input_row,
     }
+    return x_test[:1], seq if sequence_model else None, context
+
+
+def _predict_built_in(
+    result: TrainingResult,
+    x_rows: np.ndarray,
+    seqs: np.ndarray | None,
+    streaming: StreamingSequenceState | None = None,
+) -> np.ndarray:
+    """One model call on stacked inputs: ``(batch, n_features)`` rows, or ``(batch, n_steps, n_features)`` windows."""
+    if result.model_type == "linear":
+        return predict_linear(result.model_bundle, x_rows)
+    if result.model_type == "cart":
+        return predict_cart(result.model_bundle, x_rows)
+    if result.model_type in {"lstm", "rnn"} and streaming is not None:
+        return streaming.predict_batch(seqs)
+    if result.model_type == "lstm":
+        return predict_lstm(result.model_bundle, seqs)
+    if result.model_type == "rnn":
+        return predict_rnn(result.model_bundle, seqs)
+    raise ValueError(f"Unsupported model type: {result.model_type}")
+
+
+def predict_from_live_inputs(
+    result: TrainingResult,
+    config: ModelConfig,
+    timestamp_str: str,
+    history: pd.DataFrame,
+    forecast_row: Dict[str, Any] | None,
+    engine: LiveFeatureEngine | None = None,
+    streaming: StreamingSequenceState | None = None,
+) -> tuple[float, Dict[str, Any]]:
+    """
+    Engineer features from fetched Supabase history + forecast row and run the trained model.
+    With a :class:`LiveFeatureEngine` only the new history rows are processed; otherwise the
+    whole tail is re-engineered with pandas. With a :class:`StreamingSequenceState` LSTM / RNN
+    advance their cached recurrent state instead of re-running the whole window.
+    """
+    x_test, seq, context = _live_model_inputs(result, config, timestamp_str, history, forecast_row, engine)
+    pred = _predict_built_in(result, x_test, None if seq is None else seq[np.newaxis], streaming)[0]
+    if streaming is not None and seq is not None:
+        context["sequence_state"] = streaming.last_update
     return float(pred), context
 
 
+def predict_from_live_inputs_batch(
+    result: TrainingResult,
+    config: ModelConfig,
+    timestamps: List[str],
+    history: pd.DataFrame,
+    forecast_rows: List[Dict[str, Any] | None | Exception],
+    engine: LiveFeatureEngine | None = None,
+    streaming: StreamingSequenceState | None = None,
+) -> List[tuple[float | None, Dict[str, Any]]]:
+    """
+    :func:`predict_from_live_inputs` for several timestamps sharing one history tail. Inputs are
+    built per timestamp and stacked into a single model call (one ``(batch, n_steps,
+    n_features)`` forward pass for LSTM / RNN). A timestamp whose forecast row is missing or
+    failed (an exception in ``forecast_rows``) gets ``(None, {"error": ...})``.
+    """
+    out: List[tuple[float | None, Dict[str, Any]]] = [(None, {})] * len(timestamps)
+    built = []
+    for i, (timestamp_str, forecast_row) in enumerate(zip(timestamps, forecast_rows)):
+        try:
+            if isinstance(forecast_row, Exception):
+                raise _live_fetch_error("inference", config, timestamp_str, forecast_row)
+            built.append((i, *_live_model_inputs(result, config, timestamp_str, history, forecast_row, engine)))
+        except Exception as exc:
+            out[i] = (None, {"error": f"{type(exc).__name__}: {exc}"})
+    if not built:
+        return out
+    seqs = None if built[0][2] is None else np.stack([seq for _, _, seq, _ in built])
+    preds = _predict_built_in(result, np.vstack([x for _, x, _, _ in built]), seqs, streaming)
+    for (i, _, seq, context), pred in zip(built, preds):
+        context["batch_size"] = len(built)
+        if streaming is not None and seq is not None:
+            context["sequence_state"] = streaming.last_update
+        out[i] = (float(pred), context)
+    return out
+
+
+def _live_batch_fetch_args(result: TrainingResult, config: ModelConfig, timestamps: List[str]) -> tuple:
+    data_cfg = config.data
+    return (
+        data_cfg["supabase_schema"],
+        data_cfg["supabase_train_table"],
+        data_cfg["supabase_test_table"],
+        _required_history_rows_for_live(result, config),
+        timestamps,
+        int(data_cfg.get("forecast_horizon_min", 5)),
+    )
+
+
+def predict_for_timestamps_with_context(
+    result: TrainingResult,
+    config: ModelConfig,
+    timestamps: List[str],
+    client=None,
+    engine: LiveFeatureEngine | None = None,
+    streaming: StreamingSequenceState | None = None,
+) -> List[tuple[float | None, Dict[str, Any]]]:
+    """
+    :func:`predict_for_timestamp_with_context` for several timestamps: Supabase sources fetch the
+    shared history once and the forecast rows concurrently, then score all rows in one model call.
+    """
+    source = config.data.get("source", "csv")
+    if source not in {"supabase", "supabase_storage"}:
+        pred, context = predict_single_test_row_with_context(result)
+        return [(pred, dict(context)) for _ in timestamps]
+
+    data_cfg = config.data
+    try:
+        client = client or get_supabase_data_client(data_cfg["supabase_url"], data_cfg["supabase_key"])
+        history, forecast_rows = fetch_live_inputs_batch(client, *_live_batch_fetch_args(result, config, timestamps))
+    except Exception as exc:
+        raise _live_fetch_error("inference", config, ", ".join(timestamps), exc) from exc
+    return predict_from_live_inputs_batch(result, config, timestamps, history, forecast_rows, engine, streaming)
+
+
+async def predict_for_timestamps_with_context_async(
+    result: TrainingResult,
+    config: ModelConfig,
+    timestamps: List[str],
+    client,
+    engine: LiveFeatureEngine | None = None,
+    streaming: StreamingSequenceState | None = None,
+) -> List[tuple[float | None, Dict[str, Any]]]:
+    """:func:`predict_for_timestamps_with_context` with a supabase AsyncClient (Supabase sources)."""
+    try:
+        history, forecast_rows = await fetch_live_inputs_batch_async(
+            client, *_live_batch_fetch_args(result, config, timestamps)
+        )
+    except Exception as exc:
+        raise _live_fetch_error("inference", config, ", ".join(timestamps), exc) from exc
+    return await asyncio.to_thread(
+        predict_from_live_inputs_batch, result, config, timestamps, history, forecast_rows, engine, streaming
+    )
+
+
 def persist_training_result(
     result: TrainingResult,
     config: ModelConfig,
@@ -1004,16 +1442,24 @@ def persist_training_result(
         if result.model_type == "rnn"
         else None,
     }
+    if result.model_type == "linear":
+        manifest["linear_compiled_path"] = LINEAR_COMPILED_FILENAME
+    if result.model_type == "cart":
+        manifest["cart_compiled_path"] = CART_COMPILED_FILENAME
     if result.model_type == "lstm":
         lstm_bundle = result.model_bundle
         lstm_std = lstm_bundle.scaler is not None
         manifest["lstm_standardize_inputs"] = lstm_std
         manifest["lstm_scaler_path"] = LSTM_SCALER_FILENAME if lstm_std else None
+        manifest["lstm_kernel_path"] = LSTM_KERNEL_FILENAME if lstm_bundle.kernel is not None else None
+        manifest["lstm_numpy_inference"] = bool(config.models.get("lstm", {}).get("numpy_inference", True))
     if result.model_type == "rnn":
         rnn_bundle = result.model_bundle
         rnn_std = rnn_bundle.scaler is not None
         manifest["rnn_standardize_inputs"] = rnn_std
         manifest["rnn_scaler_path"] = RNN_SCALER_FILENAME if rnn_std else None
+        manifest["rnn_kernel_path"] = RNN_KERNEL_FILENAME if rnn_bundle.kernel is not None else None
+        manifest["rnn_numpy_inference"] = bool(config.models.get("rnn", {}).get("numpy_inference", True))
     manifest_path = write_manifest(out_dir, manifest)
 
     return {
@@ -1032,22 +1478,48 @@ def load_training_bundle_from_manifest(manifest_path: str):
     features = manifest.get("features", [])
 
     if model_type == "linear":
-        return load_linear(model_path)
+        compiled_rel = manifest.get("linear_compiled_path")
+        return load_linear(
+            model_path,
+            compiled_path=str(artifact_dir / compiled_rel) if compiled_rel else None,
+            features=features,
+        )
     if model_type == "cart":
-        return load_cart(model_path)
+        compiled_rel_cart = manifest.get("cart_compiled_path")
+        return load_cart(
+            model_path,
+            compiled_path=str(artifact_dir / compiled_rel_cart) if compiled_rel_cart else None,
+            features=features,
+        )
     if model_type == "lstm":
         n_steps_lstm = int(manifest.get("lstm_n_steps", 12))
         scaler_path: str | None = None
         if manifest.get("lstm_standardize_inputs"):
             rel = manifest.get("lstm_scaler_path") or LSTM_SCALER_FILENAME
             scaler_path = str(artifact_dir / rel)
-        return load_lstm(model_path, features=features, n_steps=n_steps_lstm, scaler_path=scaler_path)
+        kernel_rel = manifest.get("lstm_kernel_path")
+        return load_lstm(
+            model_path,
+            features=features,
+            n_steps=n_steps_lstm,
+            scaler_path=scaler_path,
+            kernel_path=str(artifact_dir / kernel_rel) if kernel_rel else None,
+            numpy_inference=bool(manifest.get("lstm_numpy_inference", True)),
+        )
     if model_type == "rnn":
         n_steps_rnn = int(manifest.get("rnn_n_steps", 12))
         scaler_path_rnn: str | None = None
         if manifest.get("rnn_standardize_inputs"):
             rel = manifest.get("rnn_scaler_path") or RNN_SCALER_FILENAME
             scaler_path_rnn = str(artifact_dir / rel)
-        return load_rnn(model_path, features=features, n_steps=n_steps_rnn, scaler_path=scaler_path_rnn)
+        kernel_rel_rnn = manifest.get("rnn_kernel_path")
+        return load_rnn(
+            model_path,
+            features=features,
+            n_steps=n_steps_rnn,
+            scaler_path=scaler_path_rnn,
+            kernel_path=str(artifact_dir / kernel_rel_rnn) if kernel_rel_rnn else None,
+            numpy_inference=bool(manifest.get("rnn_numpy_inference", True)),
+        )
     raise ValueError(f"Unsupported model type in manifest: {model_type}")
 
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Optional
+
+import bittensor as bt
+
+from bittbridge.utils.timestamp import get_now, round_to_interval, to_datetime, to_str
+
+from .inference_runtime import PredictorRouter
+
+# Validators ask for round_to_interval(now, 5) + 6h (bittbridge/validator/forward.py).
+CHALLENGE_HORIZON = timedelta(hours=6)
+SLOT = timedelta(minutes=5)
+DEFAULT_PRECOMPUTE_SLOTS = 3
+DEFAULT_PRECOMPUTE_INTERVAL_SEC = 15.0
+DEFAULT_PRECOMPUTE_MAX_AGE_SEC = 60.0
+
+
+def _slot_key(timestamp: str) -> Optional[int]:
+    try:
+        return int(to_datetime(timestamp).timestamp())
+    except (ValueError, TypeError):
+        return None
+
+
+def upcoming_challenge_timestamps(n_slots: int, now=None) -> list[str]:
+    """Timestamps validators will ask for over the next ``n_slots`` five-minute boundaries."""
+    base = round_to_interval(now or get_now(), interval_minutes=5) + CHALLENGE_HORIZON
+    return [to_str(base + i * SLOT) for i in range(n_slots)]
+
+
+class PredictionCache:
+    """
+    Predictions by target slot, tagged with the router generation that produced them.
+
+    An entry is served only while the router still runs the same predictor (``set_predictor``
+    bumps the generation) and for ``max_age_sec`` after it was computed, so answers never come
+    from a swapped-out model or from load data much older than a live prediction would use.
+    """
+
+    def __init__(self, max_age_sec: float = DEFAULT_PRECOMPUTE_MAX_AGE_SEC):
+        self.max_age_sec = max_age_sec
+        self.hits = 0
+        self.misses = 0
+        # slot epoch -> (prediction, context, generation, computed_at monotonic)
+        self._entries: dict[int, tuple[float, dict[str, Any], int, float]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, timestamp: str, prediction: float, context: dict[str, Any], generation: int) -> None:
+        key = _slot_key(timestamp)
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = (prediction, context, generation, time.monotonic())
+
+    def _fresh_entry(self, timestamp: str, generation: int, max_age_sec: Optional[float] = None):
+        max_age_sec = self.max_age_sec if max_age_sec is None else max_age_sec
+        with self._lock:
+            entry = self._entries.get(_slot_key(timestamp))
+        if entry is None or entry[2] != generation or time.monotonic() - entry[3] > max_age_sec:
+            return None
+        return entry
+
+    def is_fresh(self, timestamp: str, generation: int, max_age_sec: Optional[float] = None) -> bool:
+        return self._fresh_entry(timestamp, generation, max_age_sec) is not None
+
+    def get(self, timestamp: str, generation: int) -> Optional[tuple[float, dict[str, Any]]]:
+        entry = self._fresh_entry(timestamp, generation)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def prune(self, keep_from_epoch: int, generation: int) -> None:
+        """Drop slots before ``keep_from_epoch`` and entries from earlier generations."""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if k < keep_from_epoch or e[2] != generation]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PredictionPrecomputer:
+    """
+    Daemon thread that keeps predictions for the next ``n_slots`` challenge timestamps in a
+    :class:`PredictionCache`, so ``Miner.forward`` answers from memory.
+
+    Every ``interval_sec`` it (re)computes the slots whose entry is missing, past half its
+    ``max_age_sec`` or from a previous predictor, so a served slot is always replaced before it
+    expires. Predictions go through the router's deadline-aware path with at most
+    ``interval_sec`` per slot, so a hung model cannot hold the thread; only answers from the
+    active predictor are stored, since a fallback or last good value is what ``forward`` would
+    compute live anyway.
+    """
+
+    def __init__(
+        self,
+        router: PredictorRouter,
+        cache: Optional[PredictionCache] = None,
+        n_slots: int = DEFAULT_PRECOMPUTE_SLOTS,
+        interval_sec: float = DEFAULT_PRECOMPUTE_INTERVAL_SEC,
+        upcoming: Callable[[int], list[str]] = upcoming_challenge_timestamps,
+    ):
+        self.router = router
+        self.cache = cache or PredictionCache()
+        self.n_slots = n_slots
+        self.interval_sec = interval_sec
+        self._upcoming = upcoming
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def lookup(self, timestamp: str) -> Optional[tuple[float, dict[str, Any]]]:
+        return self.cache.get(timestamp, self.router.generation)
+
+    async def refresh_async(self) -> int:
+        """Compute the upcoming slots that need it; returns how many were stored."""
+        timestamps = self._upcoming(self.n_slots)
+        if not timestamps:
+            return 0
+        generation, mode = self.router.generation, self.router.mode
+        self.cache.prune(_slot_key(timestamps[0]), generation)
+        stored = 0
+        for timestamp in timestamps:
+            if self._stop.is_set() or generation != self.router.generation:
+                break
+            if self.cache.is_fresh(timestamp, generation, self.cache.max_age_sec / 2):
+                continue
+            prediction, context = await self.router.predict_with_context_async(timestamp, self.interval_sec)
+            # A model swap during the call makes this result belong to the old predictor.
+            if prediction is None or context.get("tier") != mode or generation != self.router.generation:
+                continue
+            self.cache.put(timestamp, prediction, {**context, "precomputed": True}, generation)
+            stored += 1
+        return stored
+
+    def refresh(self) -> int:
+        """Blocking :meth:`refresh_async` for callers without an event loop."""
+        return asyncio.run(self.refresh_async())
+
+    def _run(self) -> None:
+        # One loop for the thread's lifetime, so async clients keep their pooled connections.
+        loop = asyncio.new_event_loop()
+        try:
+            while not self._stop.is_set():
+                try:
+                    loop.run_until_complete(self.refresh_async())
+                except Exception as e:
+                    bt.logging.warning(f"Prediction precompute failed: {e}")
+                self._stop.wait(self.interval_sec)
+        finally:
+            loop.close()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="prediction-precompute", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
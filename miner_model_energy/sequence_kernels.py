@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Keras layer class names the exporter understands; anything else keeps the Keras model serving.
+_RECURRENT_LAYERS = {"LSTM": "lstm", "SimpleRNN": "simple_rnn"}
+_SKIPPED_LAYERS = {"InputLayer", "Dropout"}
+
+RecurrentState = Tuple[np.ndarray, Optional[np.ndarray]]
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    # tanh form avoids exp overflow warnings for large |x|.
+    return 0.5 * (np.tanh(0.5 * x) + 1.0)
+
+
+_ACTIVATIONS = {
+    "linear": lambda x: x,
+    "tanh": np.tanh,
+    "sigmoid": _sigmoid,
+    "relu": lambda x: np.maximum(x, 0.0),
+}
+
+
+def _activation_name(value) -> str:
+    name = value if isinstance(value, str) else getattr(value, "__name__", str(value))
+    name = str(name or "linear").lower()
+    if name not in _ACTIVATIONS:
+        raise ValueError(f"Unsupported activation for NumPy sequence kernel: {name}")
+    return name
+
+
+@dataclass
+class SequenceKernel:
+    """
+    NumPy forward pass of the built-in sequence models: one ``LSTM`` or ``SimpleRNN`` layer
+    (last state only) followed by Dense layers, with the optional ``StandardScaler`` folded in.
+
+    Weights keep Keras' layout (``kernel`` is ``(n_features, gates * units)``, LSTM gate order
+    i, f, c, o) and are evaluated in float32 like Keras, so outputs match ``model.predict``
+    to float32 rounding without TensorFlow being imported.
+    """
+
+    cell: str  # "lstm" | "simple_rnn"
+    kernel: np.ndarray
+    recurrent_kernel: np.ndarray
+    bias: np.ndarray
+    activation: str = "tanh"
+    recurrent_activation: str = "sigmoid"
+    dense: List[Tuple[np.ndarray, np.ndarray, str]] = field(default_factory=list)
+    scaler_mean: Optional[np.ndarray] = None
+    scaler_scale: Optional[np.ndarray] = None
+
+    @property
+    def units(self) -> int:
+        return int(self.recurrent_kernel.shape[0])
+
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        if self.scaler_mean is None:
+            return np.asarray(X, dtype=np.float32)
+        # Same arithmetic as StandardScaler.transform (float64), then Keras' float32 input.
+        return ((np.asarray(X, dtype=float) - self.scaler_mean) / self.scaler_scale).astype(np.float32)
+
+    def run(self, X: np.ndarray, state: Optional[RecurrentState] = None) -> RecurrentState:
+        """
+        Advance the recurrent state over raw ``(batch, steps, n_features)`` inputs, starting from
+        ``state`` (zeros when None, as Keras does per window); returns ``(h, c)`` (``c`` is None
+        for SimpleRNN).
+        """
+        X = self._scale(X)
+        batch, n_steps, _ = X.shape
+        act = _ACTIVATIONS[self.activation]
+        rec_act = _ACTIVATIONS[self.recurrent_activation]
+        units = self.units
+        # Input projections for every step in one matmul; only the recurrent part is sequential.
+        x_proj = X @ self.kernel + self.bias
+        if state is None:
+            h = np.zeros((batch, units), dtype=np.float32)
+            c = np.zeros((batch, units), dtype=np.float32) if self.cell == "lstm" else None
+        else:
+            h, c = state
+        for t in range(n_steps):
+            z = x_proj[:, t, :] + h @ self.recurrent_kernel
+            if self.cell == "lstm":
+                i = rec_act(z[:, :units])
+                f = rec_act(z[:, units : 2 * units])
+                g = act(z[:, 2 * units : 3 * units])
+                o = rec_act(z[:, 3 * units :])
+                c = f * c + i * g
+                h = o * act(c)
+            else:
+                h = act(z)
+        return h, c
+
+    def head(self, h: np.ndarray) -> np.ndarray:
+        """Dense layers on the last hidden state; returns ``(batch,)``."""
+        out = h
+        for W, b, name in self.dense:
+            out = _ACTIVATIONS[name](out @ W + b)
+        return out.reshape(-1)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """X is raw (unscaled) ``(batch, n_steps, n_features)``; returns ``(batch,)``."""
+        h, _ = self.run(X)
+        return self.head(h)
+
+
+class StreamingSequenceState:
+    """
+    Recurrent state carried across consecutive live windows of one :class:`SequenceKernel`.
+
+    Successive slots' windows share all but the newest history rows. :meth:`predict` finds how
+    far the window slid since the last call, advances the cached state over only the new rows
+    and runs the forecast row as a single step, so a request costs O(1) recurrent steps instead
+    of ``n_steps``. The carried state has also seen rows older than the window (Keras starts
+    each window from zeros), so it is rebuilt from the window itself once more than
+    ``resync_steps`` rows were streamed, and whenever the new window does not continue the old
+    one. Right after a resync the result equals :meth:`SequenceKernel.predict`.
+    """
+
+    def __init__(self, kernel: SequenceKernel, resync_steps: int):
+        self.kernel = kernel
+        self.resync_steps = max(1, int(resync_steps))
+        self.resyncs = 0
+        self.streamed_rows = 0
+        self.last_update: Optional[str] = None  # "resync" | "advance" | "reuse"
+        self._prior: Optional[np.ndarray] = None
+        self._state: Optional[RecurrentState] = None
+        self._since_resync = 0
+        self._lock = threading.Lock()
+
+    def _new_rows(self, prior: np.ndarray) -> Optional[np.ndarray]:
+        """Rows appended to the held window to get ``prior``; None when it does not continue it."""
+        held = self._prior
+        if held is None or held.shape != prior.shape:
+            return None
+        n = len(prior)
+        for slid in range(n):
+            if np.array_equal(held[slid:], prior[: n - slid]):
+                return prior[n - slid :]
+        return None
+
+    def _advance(self, prior: np.ndarray) -> RecurrentState:
+        """Bring the held state up to ``prior`` (the window rows before the forecast row)."""
+        with self._lock:
+            new = self._new_rows(prior)
+            if new is None or self._since_resync + len(new) > self.resync_steps:
+                self._state = self.kernel.run(prior[np.newaxis])
+                self._since_resync = 0
+                self.resyncs += 1
+                self.last_update = "resync"
+            elif len(new):
+                self._state = self.kernel.run(new[np.newaxis], self._state)
+                self._since_resync += len(new)
+                self.streamed_rows += len(new)
+                self.last_update = "advance"
+            else:
+                self.last_update = "reuse"
+            self._prior = prior.copy()
+            return self._state
+
+    def predict(self, window: np.ndarray) -> float:
+        """``window`` is the raw ``(n_steps, n_features)`` sequence ending with the forecast row."""
+        return float(self.predict_batch(np.asarray(window)[np.newaxis])[0])
+
+    def predict_batch(self, windows: np.ndarray) -> np.ndarray:
+        """
+        :meth:`predict` for raw ``(batch, n_steps, n_features)`` windows. Windows sharing their
+        prior rows (one history tail, several forecast rows) advance the state once and run all
+        forecast rows as one batched step; otherwise it is one stacked full-window pass and the
+        held state is left as it was.
+        """
+        windows = np.asarray(windows, dtype=float)
+        prior = windows[0, :-1]
+        if any(not np.array_equal(prior, w[:-1]) for w in windows[1:]):
+            return self.kernel.predict(windows)
+        state = self._advance(prior)
+        h, _ = self.kernel.run(windows[:, -1:], state)
+        return self.kernel.head(h)
+
+
+def export_sequence_kernel(model, scaler: Optional[object] = None) -> SequenceKernel:
+    """
+    Copy weights out of a trained Keras ``Sequential`` (recurrent layer → Dropout → Dense…).
+    Raises ``ValueError`` for layer stacks the kernel cannot reproduce.
+    """
+    recurrent = None
+    dense: List[Tuple[np.ndarray, np.ndarray, str]] = []
+    for layer in model.layers:
+        kind = type(layer).__name__
+        if kind in _SKIPPED_LAYERS:
+            continue
+        cfg = layer.get_config()
+        weights = [np.asarray(w, dtype=np.float32) for w in layer.get_weights()]
+        if kind in _RECURRENT_LAYERS:
+            if recurrent is not None or dense:
+                raise ValueError("NumPy sequence kernel supports a single leading recurrent layer.")
+            if cfg.get("return_sequences") or cfg.get("go_backwards") or cfg.get("stateful"):
+                raise ValueError(f"Unsupported {kind} options for NumPy sequence kernel.")
+            kernel, recurrent_kernel = weights[0], weights[1]
+            gates = kernel.shape[1]
+            bias = weights[2] if len(weights) > 2 else np.zeros(gates, dtype=np.float32)
+            recurrent = SequenceKernel(
+                cell=_RECURRENT_LAYERS[kind],
+                kernel=kernel,
+                recurrent_kernel=recurrent_kernel,
+                bias=bias,
+                activation=_activation_name(cfg.get("activation", "tanh")),
+                recurrent_activation=_activation_name(cfg.get("recurrent_activation", "sigmoid")),
+            )
+        elif kind == "Dense":
+            if recurrent is None:
+                raise ValueError("NumPy sequence kernel expects Dense layers after the recurrent layer.")
+            W = weights[0]
+            b = weights[1] if len(weights) > 1 else np.zeros(W.shape[1], dtype=np.float32)
+            dense.append((W, b, _activation_name(cfg.get("activation", "linear"))))
+        else:
+            raise ValueError(f"Unsupported Keras layer for NumPy sequence kernel: {kind}")
+    if recurrent is None:
+        raise ValueError("Keras model has no LSTM / SimpleRNN layer to export.")
+    recurrent.dense = dense
+    if scaler is not None:
+        n_features = recurrent.kernel.shape[0]
+        mean = getattr(scaler, "mean_", None) if getattr(scaler, "with_mean", True) else None
+        scale = getattr(scaler, "scale_", None) if getattr(scaler, "with_std", True) else None
+        recurrent.scaler_mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=float)
+        recurrent.scaler_scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=float)
+    return recurrent
+
+
+def save_sequence_kernel(kernel: SequenceKernel, out_path: str) -> str:
+    arrays = {
+        "kernel": kernel.kernel,
+        "recurrent_kernel": kernel.recurrent_kernel,
+        "bias": kernel.bias,
+        "meta": np.array([kernel.cell, kernel.activation, kernel.recurrent_activation]),
+        "dense_activations": np.array([name for _, _, name in kernel.dense], dtype=str),
+    }
+    for idx, (W, b, _) in enumerate(kernel.dense):
+        arrays[f"dense_{idx}_W"] = W
+        arrays[f"dense_{idx}_b"] = b
+    if kernel.scaler_mean is not None:
+        arrays["scaler_mean"] = kernel.scaler_mean
+        arrays["scaler_scale"] = kernel.scaler_scale
+    with Path(out_path).open("wb") as handle:
+        np.savez(handle, **arrays)
+    return out_path
+
+
+def load_sequence_kernel(path: str) -> SequenceKernel:
+    with np.load(path, allow_pickle=False) as data:
+        cell, activation, recurrent_activation = (str(v) for v in data["meta"])
+        dense = [
+            (data[f"dense_{idx}_W"], data[f"dense_{idx}_b"], _activation_name(str(name)))
+            for idx, name in enumerate(data["dense_activations"])
+        ]
+        return SequenceKernel(
+            cell=cell,
+            kernel=data["kernel"],
+            recurrent_kernel=data["recurrent_kernel"],
+            bias=data["bias"],
+            activation=_activation_name(activation),
+            recurrent_activation=_activation_name(recurrent_activation),
+            dense=dense,
+            scaler_mean=data["scaler_mean"] if "scaler_mean" in data.files else None,
+            scaler_scale=data["scaler_scale"] if "scaler_scale" in data.files else None,
+        )
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .ml_config import ModelConfig
+from .pipeline import TrainingResult
+
+SEQUENCE_MODEL_TYPES = {"lstm", "rnn"}
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process from ``/proc/self/statm``; None where unavailable."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _frame_nbytes(frame: pd.DataFrame) -> int:
+    return int(frame.memory_usage(index=True, deep=True).sum()) if frame is not None else 0
+
+
+def training_result_nbytes(result: TrainingResult) -> int:
+    """Approximate bytes held by the frames and train/validation arrays of ``result``."""
+    arrays = (result.y_train, result.train_pred, result.y_val, result.val_pred)
+    return (
+        _frame_nbytes(result.train_frame)
+        + _frame_nbytes(result.test_frame)
+        + sum(int(np.asarray(a).nbytes) for a in arrays if a is not None)
+    )
+
+
+def _kept_test_rows(result: TrainingResult, features: List[str], live: bool) -> pd.DataFrame:
+    # Live predictors fetch their forecast row per request. CSV predictors answer from (and log)
+    # the first test row; sequence models also window over the last n_steps test rows.
+    if live or result.test_frame.empty:
+        return pd.DataFrame(columns=features)
+    test = result.test_frame[features]
+    if result.model_type not in SEQUENCE_MODEL_TYPES:
+        return test.iloc[:1].copy()
+    n_steps = int(getattr(result.model_bundle, "n_steps", 12))
+    if len(test) <= n_steps + 1:
+        return test.copy()
+    return test.iloc[[0, *range(len(test) - n_steps, len(test))]].copy()
+
+
+def _history_rows_needed(result: TrainingResult, live: bool) -> int:
+    # Live (Supabase) predictors fetch their history tail per request; CSV sequence models
+    # prepend the train rows missing from an n_steps window of test rows.
+    if live or result.model_type not in SEQUENCE_MODEL_TYPES:
+        return 0
+    return max(0, int(getattr(result.model_bundle, "n_steps", 12)) - len(result.test_frame))
+
+
+@dataclass
+class ServingBundle:
+    """
+    What a deployed built-in model needs to answer requests: the model, the trained feature
+    list, the short train feature tail sequence windows are built from (CSV mode), the CSV test
+    rows the answer is built from (the first row; for sequence models also the last ``n_steps``),
+    and run metadata. Built from the preflight :class:`TrainingResult` so the miner can drop the
+    training frames and arrays.
+    """
+
+    model_type: str
+    model_bundle: Any
+    features: List[str]
+    history_tail: pd.DataFrame
+    test_rows: pd.DataFrame
+    metrics: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    shapes: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+    durations_sec: Dict[str, float] = field(default_factory=dict)
+    released_nbytes: int = 0
+
+    @classmethod
+    def from_training_result(cls, result: TrainingResult, config: Optional[ModelConfig] = None) -> "ServingBundle":
+        live = config is not None and config.data.get("source", "csv") in {"supabase", "supabase_storage"}
+        features = list(result.features)
+        tail_rows = _history_rows_needed(result, live)
+        history_tail = (
+            result.train_frame[features].iloc[len(result.train_frame) - tail_rows :].copy()
+            if tail_rows and not result.train_frame.empty
+            else pd.DataFrame(columns=features)
+        )
+        test_rows = _kept_test_rows(result, features, live)
+        kept = _frame_nbytes(history_tail) + _frame_nbytes(test_rows)
+        return cls(
+            model_type=result.model_type,
+            model_bundle=result.model_bundle,
+            features=features,
+            history_tail=history_tail,
+            test_rows=test_rows,
+            metrics=dict(result.metrics or {}),
+            shapes=dict(result.shapes or {}),
+            durations_sec=dict(result.durations_sec or {}),
+            released_nbytes=max(0, training_result_nbytes(result) - kept),
+        )
+
+    def as_training_result(self) -> TrainingResult:
+        """A :class:`TrainingResult` view for the predictors; frames hold only the kept rows."""
+        return TrainingResult(
+            model_type=self.model_type,
+            model_bundle=self.model_bundle,
+            metrics=self.metrics,
+            features=self.features,
+            train_frame=self.history_tail,
+            test_frame=self.test_rows,
+            shapes=self.shapes,
+            durations_sec=self.durations_sec,
+        )
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 
@@ -12,6 +15,17 @@ try:
 except Exception:  # pragma: no cover - handled at runtime
     create_client = None
 
+try:
+    from supabase import acreate_client
+except Exception:  # pragma: no cover - handled at runtime
+    acreate_client = None
+
+# Live inference issues the history and forecast queries side by side on these threads.
+_LIVE_QUERY_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="supabase-live")
+
+_shared_clients: Dict[Tuple[str, str], Any] = {}
+_shared_clients_lock = threading.Lock()
+
 
 def create_supabase_data_client(url: str, key: str):
     if create_client is None:
@@ -21,6 +35,27 @@ def create_supabase_data_client(url: str, key: str):
     return create_client(url, key)
 
 
+def get_supabase_data_client(url: str, key: str):
+    """
+    Process-wide client for (url, key), created on first use. Reusing it keeps the underlying
+    HTTP connection pool (and TLS sessions) alive across validator requests.
+    """
+    with _shared_clients_lock:
+        client = _shared_clients.get((url, key))
+        if client is None:
+            client = create_supabase_data_client(url, key)
+            _shared_clients[(url, key)] = client
+        return client
+
+
+async def create_supabase_async_data_client(url: str, key: str):
+    if acreate_client is None:
+        raise RuntimeError(
+            "supabase package with async support is not installed. Install dependencies from requirements.txt first."
+        )
+    return await acreate_client(url, key)
+
+
 def _normalize_dt_column(frame: pd.DataFrame) -> pd.DataFrame:
     if TIMESTAMP_COLUMN not in frame.columns:
         raise ValueError(f"Missing `{TIMESTAMP_COLUMN}` column in Supabase payload.")
@@ -188,6 +223,202 @@ def fetch_supabase_test_row(
     return None
 
 
+def fetch_live_inputs(
+    client,
+    schema: str,
+    train_table: str,
+    test_table: str,
+    n_rows: int,
+    dt_target: str,
+    horizon_min: int,
+    nearest_fallback_minutes: int | None = 5,
+    resilient: bool = False,
+) -> tuple[pd.DataFrame, Dict[str, Any] | None]:
+    """
+    Recent train tail and the forecast row for ``dt_target``, with both queries in flight at
+    once so a live prediction waits for one round-trip instead of several in series.
+    ``resilient`` uses :func:`fetch_supabase_test_row_for_probe` (deploy probes).
+    """
+    history_future = _LIVE_QUERY_POOL.submit(fetch_supabase_train_tail, client, schema, train_table, n_rows)
+    try:
+        if resilient:
+            forecast_row = fetch_supabase_test_row_for_probe(client, schema, test_table, dt_target, horizon_min)
+        else:
+            forecast_row = fetch_supabase_test_row(
+                client,
+                schema,
+                test_table,
+                dt_target,
+                horizon_min,
+                nearest_fallback_minutes=nearest_fallback_minutes,
+            )
+    except Exception:
+        history_future.cancel()
+        raise
+    return history_future.result(), forecast_row
+
+
+
+def fetch_live_inputs_batch(
+    client,
+    schema: str,
+    train_table: str,
+    test_table: str,
+    n_rows: int,
+    dt_targets: List[str],
+    horizon_min: int,
+    nearest_fallback_minutes: int | None = 5,
+) -> tuple[pd.DataFrame, List[Dict[str, Any] | None | Exception]]:
+    """
+    :func:`fetch_live_inputs` for several targets at once: the train tail they share is fetched
+    once and the forecast rows concurrently. A target whose row query fails gets the exception
+    in place of its row; a failed train tail query raises.
+    """
+    history_future = _LIVE_QUERY_POOL.submit(fetch_supabase_train_tail, client, schema, train_table, n_rows)
+    row_futures = [
+        _LIVE_QUERY_POOL.submit(
+            fetch_supabase_test_row,
+            client,
+            schema,
+            test_table,
+            dt_target,
+            horizon_min,
+            nearest_fallback_minutes=nearest_fallback_minutes,
+        )
+        for dt_target in dt_targets
+    ]
+    rows: List[Dict[str, Any] | None | Exception] = []
+    for future in row_futures:
+        try:
+            rows.append(future.result())
+        except Exception as exc:
+            rows.append(exc)
+    return history_future.result(), rows
+
+async def fetch_supabase_train_tail_async(client, schema: str, table: str, n_rows: int) -> pd.DataFrame:
+    """:func:`fetch_supabase_train_tail` on a supabase AsyncClient."""
+    response = await (
+        client.schema(schema)
+        .table(table)
+        .select("*")
+        .order(TIMESTAMP_COLUMN, desc=True)
+        .limit(int(n_rows))
+        .execute()
+    )
+    rows = response.data or []
+    if not rows:
+        raise ValueError(f"Supabase `{schema}.{table}` returned no rows for recent history.")
+    frame = normalize_supabase_train_frame(pd.DataFrame(rows))
+    return frame.tail(int(n_rows)).reset_index(drop=True)
+
+
+async def fetch_supabase_test_row_async(
+    client,
+    schema: str,
+    table: str,
+    dt_target: str,
+    horizon_min: int,
+    nearest_fallback_minutes: int | None = None,
+) -> Dict[str, Any] | None:
+    """
+    :func:`fetch_supabase_test_row` on a supabase AsyncClient. The exact-timestamp candidates are
+    queried concurrently; the window fallback only runs when none of them matches.
+    """
+    candidate_ts = timestamp_candidates_for_supabase(dt_target)
+    exact = await asyncio.gather(
+        *(
+            client.schema(schema)
+            .table(table)
+            .select("*")
+            .eq(TIMESTAMP_COLUMN, ts.strftime("%Y-%m-%d %H:%M:%S"))
+            .execute()
+            for ts in candidate_ts
+        )
+    )
+    for response in exact:
+        picked = pick_forecast_row_for_horizon(response.data or [], horizon_min)
+        if picked is not None:
+            return picked
+
+    if nearest_fallback_minutes is None or nearest_fallback_minutes <= 0:
+        return None
+
+    window = timedelta(minutes=int(nearest_fallback_minutes))
+    around = await asyncio.gather(
+        *(
+            client.schema(schema)
+            .table(table)
+            .select("*")
+            .gte(TIMESTAMP_COLUMN, (target - window).strftime("%Y-%m-%d %H:%M:%S"))
+            .lte(TIMESTAMP_COLUMN, (target + window).strftime("%Y-%m-%d %H:%M:%S"))
+            .order(TIMESTAMP_COLUMN, desc=False)
+            .execute()
+            for target in candidate_ts
+        )
+    )
+    for response in around:
+        picked = pick_forecast_row_for_horizon(response.data or [], horizon_min)
+        if picked is not None:
+            return picked
+    return None
+
+
+async def fetch_live_inputs_async(
+    client,
+    schema: str,
+    train_table: str,
+    test_table: str,
+    n_rows: int,
+    dt_target: str,
+    horizon_min: int,
+    nearest_fallback_minutes: int | None = 5,
+) -> tuple[pd.DataFrame, Dict[str, Any] | None]:
+    """:func:`fetch_live_inputs` on a supabase AsyncClient, without blocking the event loop."""
+    history, forecast_row = await asyncio.gather(
+        fetch_supabase_train_tail_async(client, schema, train_table, n_rows),
+        fetch_supabase_test_row_async(
+            client,
+            schema,
+            test_table,
+            dt_target,
+            horizon_min,
+            nearest_fallback_minutes=nearest_fallback_minutes,
+        ),
+    )
+    return history, forecast_row
+
+
+
+async def fetch_live_inputs_batch_async(
+    client,
+    schema: str,
+    train_table: str,
+    test_table: str,
+    n_rows: int,
+    dt_targets: List[str],
+    horizon_min: int,
+    nearest_fallback_minutes: int | None = 5,
+) -> tuple[pd.DataFrame, List[Dict[str, Any] | None | Exception]]:
+    """:func:`fetch_live_inputs_batch` on a supabase AsyncClient, without blocking the event loop."""
+    history, *rows = await asyncio.gather(
+        fetch_supabase_train_tail_async(client, schema, train_table, n_rows),
+        *(
+            fetch_supabase_test_row_async(
+                client,
+                schema,
+                test_table,
+                dt_target,
+                horizon_min,
+                nearest_fallback_minutes=nearest_fallback_minutes,
+            )
+            for dt_target in dt_targets
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(history, BaseException):
+        raise history
+    return history, rows
+
 def fetch_latest_forecast_row_matching_horizon(
     client,
     schema: str,
@@ -1,4 +1,6 @@
 import argparse
+import asyncio
+import gc
 import json
 import random
 import time
@@ -15,7 +17,9 @@ import bittbridge
 
 # import base miner class which takes care of most of the boilerplate
 from bittbridge.base.miner import BaseMinerNeuron
+from bittbridge.utils.iso_ne_buffer import LoadBufferPoller, LoadRingBuffer, max_age_from_env, poll_interval_from_env
 from bittbridge.utils.timestamp import get_now, round_minute_down, to_str
+from bittbridge.utils.uids import HotkeyIndex
 from miner_model_energy.custom_plugin_runtime import (
     CustomPluginDeployState,
     list_plugin_folders,
@@ -28,13 +32,31 @@ from miner_model_energy.custom_plugin_runtime import (
     write_plugin_export,
 )
 from miner_model_energy.inference_runtime import (
+    DEFAULT_BATCH_WINDOW_SEC,
+    DEFAULT_LAST_GOOD_MAX_AGE_SEC,
+    DEFAULT_PREDICT_TIMEOUT_SEC,
+    DEFAULT_PREDICT_WORKERS,
     AdvancedModelPredictor,
     BaselineMovingAveragePredictor,
     CustomModelPredictor,
     PredictorRouter,
     SupabaseLiveAdvancedPredictor,
 )
+from miner_model_energy.hot_reload import (
+    DEFAULT_RELOAD_POLL_SEC,
+    RELOAD_REQUEST_NAME,
+    TRAINABLE_MODEL_TYPES,
+    ModelReloader,
+    ReloadRequest,
+)
 from miner_model_energy.ml_config import load_model_config
+from miner_model_energy.model_server import ModelServer, RemoteModelPredictor
+from miner_model_energy.precompute import (
+    DEFAULT_PRECOMPUTE_MAX_AGE_SEC,
+    DEFAULT_PRECOMPUTE_SLOTS,
+    PredictionCache,
+    PredictionPrecomputer,
+)
 from miner_model_energy.pipeline import (
     TrainingResult,
     load_training_bundle_from_manifest,
@@ -43,6 +65,7 @@ from miner_model_energy.pipeline import (
     print_actual_vs_predicted_plotext,
     train_model,
 )
+from miner_model_energy.serving import ServingBundle, current_rss_bytes
 from miner_model_energy.storage_train_io import (
     storage_cache_exists,
     storage_cache_last_updated_label,
@@ -64,6 +87,8 @@ from miner_model_energy.storage_train_io import (
 N_STEPS = 12
 DEFAULT_PARAMS_PATH = "model_params.yaml"
 _SECTION_WIDTH = 72
+# Share of the validator's synapse timeout spent on predicting; the rest covers the response trip.
+_SYNAPSE_DEADLINE_SHARE = 0.8
 
 
 @dataclass
@@ -74,6 +99,94 @@ class PreflightResult:
     custom_plugin: CustomPluginDeployState | None = None
 
 
+def _release_training_result(preflight_result: PreflightResult) -> tuple[ServingBundle, dict[str, int]]:
+    """
+    Swap the preflight TrainingResult for a ServingBundle (model, features, history tail,
+    metadata) so the training frames and arrays can be freed, and log the RSS change. Also
+    returns the logged numbers (bytes released, RSS after) for :meth:`PredictionService.stats`.
+    """
+    rss_before = current_rss_bytes()
+    serving = ServingBundle.from_training_result(preflight_result.training_result, preflight_result.model_config)
+    preflight_result.training_result = None
+    gc.collect()
+    rss_after = current_rss_bytes()
+    mib = 1024 * 1024
+    rss = ""
+    if rss_before is not None and rss_after is not None:
+        rss = f"; RSS {rss_before / mib:.0f} MB -> {rss_after / mib:.0f} MB"
+    bt.logging.info(
+        f"Serving bundle: kept {len(serving.history_tail)} history row(s) and {len(serving.test_rows)} "
+        f"test row(s); released ~{serving.released_nbytes / mib:.1f} MB of training data{rss}"
+    )
+    release_stats = {"released_training_bytes": serving.released_nbytes}
+    if rss_after is not None:
+        release_stats["rss_after_release_bytes"] = rss_after
+    return serving, release_stats
+
+
+def _request_deadline_sec(synapse) -> Optional[float]:
+    timeout = getattr(synapse, "timeout", None)
+    if not timeout or timeout <= 0:
+        return None
+    return float(timeout) * _SYNAPSE_DEADLINE_SHARE
+
+
+def _deployed_predictor(preflight_result: PreflightResult):
+    """
+    Predictor serving a preflight deploy (custom plugin or trained / saved built-in model) and
+    the memory release numbers when a training result was released; (None, {}) for baseline.
+    The ServingBundle itself is not kept: the predictor holds what it needs.
+    """
+    if preflight_result.custom_plugin is not None:
+        cp = preflight_result.custom_plugin
+        if not preflight_result.model_config:
+            raise ValueError("custom_plugin requires model_config on PreflightResult")
+        predictor = CustomModelPredictor(
+            wrapper=cp.wrapper,
+            config=preflight_result.model_config,
+            features=cp.features,
+            sequence_n_steps=cp.sequence_n_steps,
+        )
+        return predictor, {}
+    if preflight_result.training_result is None:
+        return None, {}
+    serving_bundle, release_stats = _release_training_result(preflight_result)
+    serving_result = serving_bundle.as_training_result()
+    if preflight_result.model_config and preflight_result.model_config.data.get("source") in {
+        "supabase",
+        "supabase_storage",
+    }:
+        predictor = SupabaseLiveAdvancedPredictor(
+            result=serving_result,
+            config=preflight_result.model_config,
+        )
+    else:
+        predictor = AdvancedModelPredictor(result=serving_result)
+    return predictor, release_stats
+
+
+def _train_in_background(model_type: str, cfg) -> PreflightResult:
+    """Train and save a built-in model without prompts; progress goes to the log."""
+    bt.logging.info(f"[background train] Loading data and training {model_type} ...")
+    started = time.monotonic()
+    result = train_model(model_type, cfg)
+    validation = result.metrics.get("validation", {})
+    rmse = float(validation.get("rmse", float("nan")))
+    bt.logging.info(
+        f"[background train] {model_type} trained in {time.monotonic() - started:.1f}s; "
+        f"validation RMSE={rmse:.3f} MAE={float(validation.get('mae', float('nan'))):.3f}"
+    )
+    if not np.isfinite(rmse):
+        raise ValueError(f"{model_type} validation RMSE is not finite; not deploying it")
+    try:
+        paths = persist_training_result(result, cfg, run_id="miner")
+        bt.logging.info(f"[background train] Saved artifacts: {paths['artifact_dir']}")
+    except Exception as e:
+        bt.logging.warning(f"[background train] Could not save artifacts: {e}")
+    bt.logging.info(f"[background train] Warming up {model_type} before swapping it in")
+    return PreflightResult(mode=f"advanced:{model_type}", training_result=result, model_config=cfg)
+
+
 class PreflightExitRequested(Exception):
     """Raised when user requests to exit during preflight prompts."""
 
@@ -760,6 +873,183 @@ def run_preflight(model_params_path: str, non_interactive: bool) -> PreflightRes
     return PreflightResult(mode="baseline")
 
 
+class PredictionService:
+    """
+    Everything that answers prediction requests: the in-memory ISO-NE load buffer, the baseline,
+    the router with the deployed model and its fallbacks, the precomputer and the model reloader.
+
+    Owned by a :class:`Miner`, or by the shared model server (``--miner.serve_socket``) that
+    several miner processes on one host query. A miner started with ``--miner.model_server``
+    builds a thin service instead: the remote predictor first, a local baseline as fallback, and
+    no buffer poller, precomputer or reloader, since the server runs those once for everyone.
+    """
+
+    def __init__(self, miner_config, preflight_result: PreflightResult | None = None):
+        self.miner_config = miner_config
+        self.model_config = preflight_result.model_config if preflight_result else None
+        # Bytes released / RSS after swapping the preflight TrainingResult for a ServingBundle.
+        self.release_stats: dict[str, int] = {}
+        self.deployed_mode = "baseline"
+        remote_socket = getattr(miner_config, "model_server", None)
+        # Rolling 24h of ISO-NE load kept in memory so the baseline answers without an HTTP call.
+        self.load_buffer = LoadRingBuffer()
+        self.load_poller = None
+        poll_sec = poll_interval_from_env()
+        if poll_sec > 0 and not remote_socket:
+            self.load_poller = LoadBufferPoller(self.load_buffer, interval_sec=poll_sec)
+            self.load_poller.start()
+        self.baseline_predictor = BaselineMovingAveragePredictor(
+            N_STEPS,
+            load_buffer=self.load_buffer,
+            max_buffer_age_sec=max_age_from_env(),
+        )
+        # A deployed model that errors or overruns its share of the deadline falls back to the baseline.
+        self.predictor_router = PredictorRouter(
+            self.baseline_predictor,
+            max_workers=getattr(miner_config, "predict_workers", DEFAULT_PREDICT_WORKERS),
+            timeout_sec=getattr(miner_config, "predict_timeout", DEFAULT_PREDICT_TIMEOUT_SEC),
+            fallbacks=[("baseline", self.baseline_predictor)],
+            last_good_max_age_sec=getattr(miner_config, "last_good_max_age", DEFAULT_LAST_GOOD_MAX_AGE_SEC),
+            batch_window_sec=getattr(miner_config, "batch_window", DEFAULT_BATCH_WINDOW_SEC),
+        )
+        self.precomputer = None
+        self.model_reloader = None
+        if remote_socket:
+            self.deployed_mode = f"remote:{remote_socket}"
+            self.predictor_router.set_predictor(
+                RemoteModelPredictor(
+                    remote_socket,
+                    timeout_sec=getattr(miner_config, "predict_timeout", DEFAULT_PREDICT_TIMEOUT_SEC),
+                ),
+                mode=self.deployed_mode,
+            )
+            bt.logging.success(f"Answering from the shared model server at {remote_socket}")
+            return
+
+        predictor = None
+        if preflight_result:
+            predictor, self.release_stats = _deployed_predictor(preflight_result)
+            self.deployed_mode = preflight_result.mode or self.deployed_mode
+        if predictor is not None:
+            self.predictor_router.set_predictor(predictor, mode=preflight_result.mode)
+            bt.logging.success(f"Using preflight-deployed model mode: {preflight_result.mode}")
+
+        # Predictions for the next challenge slots are computed in the background and served from memory.
+        precompute_slots = getattr(miner_config, "precompute_slots", DEFAULT_PRECOMPUTE_SLOTS)
+        if precompute_slots > 0:
+            self.precomputer = PredictionPrecomputer(
+                self.predictor_router,
+                PredictionCache(
+                    max_age_sec=getattr(miner_config, "precompute_max_age", DEFAULT_PRECOMPUTE_MAX_AGE_SEC)
+                ),
+                n_slots=precompute_slots,
+            )
+            self.precomputer.start()
+
+        # New artifacts / plugin models (or a model trained after startup) are swapped in without restarting.
+        reload_poll = getattr(miner_config, "reload_poll", DEFAULT_RELOAD_POLL_SEC)
+        background_train = getattr(miner_config, "background_train", None)
+        if reload_poll > 0 or background_train:
+            try:
+                control_dir = Path(self._reload_model_config().persistence["artifact_dir"])
+            except Exception as e:
+                bt.logging.warning(f"Model hot reload / background training disabled; model config unavailable: {e}")
+            else:
+                self.model_reloader = ModelReloader(
+                    self.predictor_router,
+                    self._load_reload_candidate,
+                    control_dir,
+                    poll_sec=reload_poll,
+                )
+                if reload_poll > 0:
+                    self.model_reloader.start()
+                    bt.logging.info(f"Watching {control_dir / RELOAD_REQUEST_NAME} for model reload requests")
+                if background_train:
+                    bt.logging.info(
+                        f"Serving {self.predictor_router.mode} while {background_train} trains in the background"
+                    )
+                    self.model_reloader.reload_in_background(ReloadRequest(kind="train", model_type=background_train))
+
+    async def predict(
+        self, timestamp: str, deadline_sec: Optional[float] = None
+    ) -> Tuple[Optional[float], dict]:
+        """Precomputed answer when there is one, else the router's fallback chain."""
+        precomputed = self.precomputer.lookup(timestamp) if self.precomputer is not None else None
+        if precomputed is not None:
+            return precomputed
+        return await self.predictor_router.predict_with_context_async(timestamp, deadline_sec=deadline_sec)
+
+    def stats(self) -> dict:
+        out = {"mode": self.predictor_router.mode, **self.predictor_router.stats(), **self.release_stats}
+        if self.precomputer is not None:
+            out.update(precompute_hits=self.precomputer.cache.hits, precompute_misses=self.precomputer.cache.misses)
+        return out
+
+    def stop(self) -> None:
+        if self.load_poller is not None:
+            self.load_poller.stop()
+        if self.precomputer is not None:
+            self.precomputer.stop()
+        if self.model_reloader is not None:
+            self.model_reloader.stop()
+        self.predictor_router.close()
+
+    def _reload_model_config(self):
+        if self.model_config is None:
+            self.model_config = load_model_config(
+                getattr(self.miner_config, "model_params_path", DEFAULT_PARAMS_PATH)
+            )
+        return self.model_config
+
+    def _load_reload_candidate(self, request: ReloadRequest):
+        """Build the predictor a reload request asks for, the same way preflight deploys it."""
+        cfg = self._reload_model_config()
+        if request.kind == "train":
+            preflight = _train_in_background(request.model_type, cfg)
+        elif request.kind == "manifest":
+            result = _load_training_result_from_manifest_preflight(request.manifest_path, cfg)
+            preflight = PreflightResult(
+                mode=f"artifact:{result.model_type}:{request.manifest_path.parent.name}",
+                training_result=result,
+                model_config=cfg,
+            )
+        else:
+            probe_ts = to_str(round_minute_down(get_now(), 5))
+            wrapper, seq_steps, _x = run_deploy_compatibility_probe(
+                cfg, request.plugin_dir, request.model_path, probe_ts
+            )
+            preflight = PreflightResult(
+                mode="custom:deployed",
+                model_config=cfg,
+                custom_plugin=CustomPluginDeployState(
+                    plugin_dir=request.plugin_dir,
+                    model_path=request.model_path,
+                    wrapper=wrapper,
+                    features=list(read_feature_contract(request.plugin_dir)["features"]),
+                    sequence_n_steps=seq_steps,
+                ),
+            )
+        predictor, _release_stats = _deployed_predictor(preflight)
+        return predictor, preflight.mode
+
+
+def serve_model_socket(socket_path: str, preflight_result: PreflightResult) -> None:
+    """Run the shared model server: one PredictionService answering every local miner process."""
+    config = Miner.config()
+    bt.logging.set_config(config=config.logging)
+    service = PredictionService(config.miner, preflight_result)
+    server = ModelServer(service.predict, socket_path, stats=service.stats)
+    bt.logging.success(f"Model server ready. Active model mode: {service.deployed_mode}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        if Path(socket_path).is_socket():
+            Path(socket_path).unlink()
+
+
 class Miner(BaseMinerNeuron):
     """
     Miner neuron for New England energy demand (LoadMw) prediction.
@@ -787,48 +1077,90 @@ class Miner(BaseMinerNeuron):
             default=False,
             help="Disable terminal prompts and keep baseline MA model.",
         )
+        parser.add_argument(
+            "--miner.predict_workers",
+            type=int,
+            default=DEFAULT_PREDICT_WORKERS,
+            help="Threads running model predictions, so concurrent validator requests are served in parallel.",
+        )
+        parser.add_argument(
+            "--miner.predict_timeout",
+            type=float,
+            default=DEFAULT_PREDICT_TIMEOUT_SEC,
+            help="Seconds a single prediction may take before the request is answered without one.",
+        )
+        parser.add_argument(
+            "--miner.batch_window",
+            type=float,
+            default=DEFAULT_BATCH_WINDOW_SEC,
+            help=(
+                "Seconds concurrent validator requests are collected into one model call (e.g. 0.005, since "
+                "validators of one round query within milliseconds of each other); 0 disables micro-batching."
+            ),
+        )
+        parser.add_argument(
+            "--miner.last_good_max_age",
+            type=float,
+            default=DEFAULT_LAST_GOOD_MAX_AGE_SEC,
+            help="Seconds the last good prediction may be served when every predictor tier fails.",
+        )
+        parser.add_argument(
+            "--miner.background_train",
+            type=str,
+            choices=TRAINABLE_MODEL_TYPES,
+            default=None,
+            help="Skip preflight, serve the baseline at once and swap in this model type once it is trained and validated.",
+        )
+        parser.add_argument(
+            "--miner.serve_socket",
+            type=str,
+            default=None,
+            help="Run as the shared model server on this Unix socket (no wallet / axon) for miners started with --miner.model_server.",
+        )
+        parser.add_argument(
+            "--miner.model_server",
+            type=str,
+            default=None,
+            help="Unix socket of a shared model server; this miner then skips preflight and loads no model itself.",
+        )
+        parser.add_argument(
+            "--miner.reload_poll",
+            type=float,
+            default=DEFAULT_RELOAD_POLL_SEC,
+            help=f"Seconds between checks for {RELOAD_REQUEST_NAME} in the artifact dir (hot model swap); 0 disables.",
+        )
+        parser.add_argument(
+            "--miner.precompute_slots",
+            type=int,
+            default=DEFAULT_PRECOMPUTE_SLOTS,
+            help="Upcoming challenge timestamps (now + 6h, 5-minute steps) to predict ahead of time; 0 disables.",
+        )
+        parser.add_argument(
+            "--miner.precompute_max_age",
+            type=float,
+            default=DEFAULT_PRECOMPUTE_MAX_AGE_SEC,
+            help="Seconds a precomputed prediction may be served before it is recomputed.",
+        )
 
     def __init__(self, config=None, preflight_result: PreflightResult | None = None):
         super(Miner, self).__init__(config=config)
+        # blacklist / priority look callers up here instead of scanning metagraph.hotkeys.
+        self.hotkey_index = HotkeyIndex.from_metagraph(self.metagraph)
         self._add_test_noise = getattr(self.config, "test", False)
-        self.predictor_router = PredictorRouter(BaselineMovingAveragePredictor(N_STEPS))
-        deployed_mode = "baseline"
-        if preflight_result and preflight_result.custom_plugin is not None:
-            cp = preflight_result.custom_plugin
-            if not preflight_result.model_config:
-                raise ValueError("custom_plugin requires model_config on PreflightResult")
-            predictor = CustomModelPredictor(
-                wrapper=cp.wrapper,
-                config=preflight_result.model_config,
-                features=cp.features,
-                sequence_n_steps=cp.sequence_n_steps,
-            )
-            self.predictor_router.set_predictor(predictor, mode=preflight_result.mode)
-            bt.logging.success(f"Using preflight-deployed model mode: {preflight_result.mode}")
-            deployed_mode = preflight_result.mode
-        elif preflight_result and preflight_result.training_result is not None:
-            predictor = AdvancedModelPredictor(result=preflight_result.training_result)
-            if preflight_result.model_config and preflight_result.model_config.data.get("source") in {
-                "supabase",
-                "supabase_storage",
-            }:
-                predictor = SupabaseLiveAdvancedPredictor(
-                    result=preflight_result.training_result,
-                    config=preflight_result.model_config,
-                )
-            self.predictor_router.set_predictor(
-                predictor,
-                mode=preflight_result.mode,
-            )
-            bt.logging.success(f"Using preflight-deployed model mode: {preflight_result.mode}")
-            deployed_mode = preflight_result.mode
-        elif preflight_result and preflight_result.mode:
-            deployed_mode = preflight_result.mode
-
+        self.service = PredictionService(self.config.miner, preflight_result)
+        self.predictor_router = self.service.predictor_router
         bt.logging.success(
-            f"Miner deployed and ready to answer validator requests. Active model mode: {deployed_mode}"
+            f"Miner deployed and ready to answer validator requests. Active model mode: {self.service.deployed_mode}"
         )
 
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.service.stop()
+        super().__exit__(exc_type, exc_value, traceback)
+
+    def resync_metagraph(self):
+        super().resync_metagraph()
+        self.hotkey_index = HotkeyIndex.from_metagraph(self.metagraph)
+
     async def forward(self, synapse: bittbridge.protocol.Challenge) -> bittbridge.protocol.Challenge:
         """
         Responds to the Challenge synapse from the validator with a LoadMw point prediction
@@ -842,9 +1174,16 @@ class Miner(BaseMinerNeuron):
             f"timestamp={synapse.timestamp}, model_mode={self.predictor_router.mode}"
         )
 
-        prediction = self.predictor_router.predict(synapse.timestamp)
+        prediction, context = await self.service.predict(synapse.timestamp, _request_deadline_sec(synapse))
         if prediction is None:
+            if "error" in context:
+                bt.logging.warning(f"No prediction for timestamp={synapse.timestamp}: {context['error']}")
             return synapse
+        if context.get("fallback_errors"):
+            bt.logging.warning(
+                f"Answered timestamp={synapse.timestamp} from fallback tier {context.get('tier')}: "
+                + "; ".join(context["fallback_errors"])
+            )
 
         # Step 3: [Testing only] Add noise scaled to load
         if self._add_test_noise:
@@ -869,7 +1208,7 @@ class Miner(BaseMinerNeuron):
         )
         bt.logging.success(
             "Prediction model input context: "
-            + json.dumps(self.predictor_router.last_prediction_context, default=str, ensure_ascii=True)
+            + json.dumps(context, default=str, ensure_ascii=True)
         )
         return synapse
 
@@ -880,18 +1219,15 @@ class Miner(BaseMinerNeuron):
             )
             return True, "Missing dendrite or hotkey"
 
-        uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-        if (
-            not self.config.blacklist.allow_non_registered
-            and synapse.dendrite.hotkey not in self.metagraph.hotkeys
-        ):
+        uid = self.hotkey_index.uid(synapse.dendrite.hotkey)
+        if uid is None and not self.config.blacklist.allow_non_registered:
             bt.logging.trace(
                 f"Blacklisting un-registered hotkey {synapse.dendrite.hotkey}"
             )
             return True, "Unrecognized hotkey"
 
         if self.config.blacklist.force_validator_permit:
-            if not self.metagraph.validator_permit[uid]:
+            if uid is None or not self.hotkey_index.has_validator_permit(uid):
                 bt.logging.warning(
                     f"Blacklisting a request from non-validator hotkey {synapse.dendrite.hotkey}"
                 )
@@ -909,12 +1245,8 @@ class Miner(BaseMinerNeuron):
             )
             return 0.0
 
-        caller_uid = self.metagraph.hotkeys.index(
-            synapse.dendrite.hotkey
-        )
-        priority = float(
-            self.metagraph.S[caller_uid]
-        )
+        caller_uid = self.hotkey_index.uid(synapse.dendrite.hotkey)
+        priority = self.hotkey_index.stake_of(caller_uid) if caller_uid is not None else 0.0
         bt.logging.trace(
             f"Prioritizing {synapse.dendrite.hotkey} with value: {priority}"
         )
@@ -940,14 +1272,30 @@ if __name__ == "__main__":
         action="store_true",
         default=False,
     )
-    preflight_args, _ = preflight_arg_parser.parse_known_args()
-    preflight_result = run_preflight(
-        model_params_path=preflight_args.model_params_path,
-        non_interactive=preflight_args.non_interactive,
+    preflight_arg_parser.add_argument(
+        "--miner.background_train",
+        dest="background_train",
+        type=str,
+        default=None,
     )
+    preflight_arg_parser.add_argument("--miner.model_server", dest="model_server", type=str, default=None)
+    preflight_arg_parser.add_argument("--miner.serve_socket", dest="serve_socket", type=str, default=None)
+    preflight_args, _ = preflight_arg_parser.parse_known_args()
+    if preflight_args.background_train or preflight_args.model_server:
+        # The axon comes up on the baseline (or the shared server); no prompts here.
+        preflight_result = PreflightResult(mode="baseline")
+    else:
+        preflight_result = run_preflight(
+            model_params_path=preflight_args.model_params_path,
+            non_interactive=preflight_args.non_interactive,
+        )
     if preflight_result.mode == "exit":
         raise SystemExit(0)
 
+    if preflight_args.serve_socket:
+        serve_model_socket(preflight_args.serve_socket, preflight_result)
+        raise SystemExit(0)
+
     with Miner(preflight_result=preflight_result) as miner:
         while True:
             bt.logging.info(f"Miner running... {time.time()}")
@@ -28,7 +28,7 @@ from bittbridge.base.validator import BaseValidatorNeuron
 from bittbridge.validator import forward
 
 # Reward calculation utilities
-from bittbridge.validator.reward import get_actual_load_mw, get_incentive_mechanism_rewards
+from bittbridge.validator.reward import get_actual_load_mw_async, get_incentive_mechanism_rewards
 
 # Protocol imports
 from bittbridge.protocol import Challenge
@@ -46,6 +46,23 @@ from bittbridge.utils.timestamp import (
 
 # --- NEW: W&B helper imports (setup + logging) ---
 from bittbridge.utils.wandb import setup_wandb, log_wandb
+from bittbridge.utils.iso_ne_api import get_cache_stats, get_last_fetch_error
+from bittbridge.utils.iso_ne_ratelimit import get_rate_limiter
+
+
+def _iso_ne_throttle_metrics() -> dict:
+    """Host-wide ISO-NE rate limiter counters for this process (throttle wait time etc.)."""
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return {}
+    return limiter.stats.as_dict(prefix="iso_ne_ratelimit_")
+
+
+def _iso_ne_metrics() -> dict:
+    """ISO-NE rate limiter and day cache counters for W&B."""
+    metrics = _iso_ne_throttle_metrics()
+    metrics.update({f"iso_ne_cache_{k}": v for k, v in get_cache_stats().items()})
+    return metrics
 
 
 class Validator(BaseValidatorNeuron):
@@ -113,7 +130,7 @@ class Validator(BaseValidatorNeuron):
                 
                 # Process each timestamp group
                 for timestamp, predictions in timestamp_groups.items():
-                    actual = get_actual_load_mw(timestamp)
+                    actual = await get_actual_load_mw_async(timestamp)
                     if actual is not None:
                         # Convert predictions to Challenge objects for incentive mechanism scoring
                         responses = []
@@ -167,14 +184,26 @@ class Validator(BaseValidatorNeuron):
                             )
                         processed_preds.extend(predictions)
                     else:
+                        last_error = get_last_fetch_error()
                         bt.logging.info(
                             f"Actual load not yet available for timestamp={timestamp} - will retry"
+                            + (f" (last ISO-NE error: {last_error})" if last_error else "")
                         )
                 
                 # Remove only predictions that were actually evaluated
                 for pred in processed_preds:
                     self.prediction_queue.remove(pred)
             
+            throttle = _iso_ne_throttle_metrics()
+            if throttle and throttle["iso_ne_ratelimit_throttled"] != getattr(self, "_iso_ne_throttled_seen", 0):
+                self._iso_ne_throttled_seen = throttle["iso_ne_ratelimit_throttled"]
+                bt.logging.info(
+                    f"ISO-NE rate limiter: {throttle['iso_ne_ratelimit_throttled']} throttled requests, "
+                    f"{throttle['iso_ne_ratelimit_wait_sec_total']:.1f}s total wait "
+                    f"(max {throttle['iso_ne_ratelimit_wait_sec_max']:.1f}s), "
+                    f"{throttle['iso_ne_ratelimit_timeouts']} timeouts"
+                )
+
             # Log to W&B if we have data and W&B is available
             if getattr(self, "_wandb_ok", False) and wb_uids:
                 try:
@@ -194,6 +223,7 @@ class Validator(BaseValidatorNeuron):
                         hotkeys=getattr(self, "hotkeys", {}),
                         moving_average_scores=moving_avgs,
                         last_round_weights=last_w,
+                        extra_metrics=_iso_ne_metrics(),
                         ground_truth=actual,
                         timestamp=timestamp,
                         # ground_truth=wb_actuals,
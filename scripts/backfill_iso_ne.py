@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Backfill ISO-NE Five Minute System Load history into local partitioned files.
+
+Fetches every closed Eastern day in ``--start..--end`` concurrently (bounded by ``--concurrency``
+and ``--rate`` requests/second) and writes one parquet (or CSV without pyarrow) file per day under
+``--out`` (see ``bittbridge/utils/iso_ne_history.py`` for the layout). Days already on disk are
+skipped, so re-running after an interruption resumes where it stopped.
+
+``--base-url`` points the fetcher at another server, e.g. a local ISO-NE stand-in for testing;
+credentials come from .env (ISO_NE_USERNAME / ISO_NE_PASSWORD) as for the miner and validator.
+
+Usage (from repo root ``bittbridge/``):
+``python scripts/backfill_iso_ne.py --start 20250101 --end 20250331 --out data/iso_ne``
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+try:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+except ImportError:
+    pass
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from bittbridge.utils.iso_ne_client import IsoNeClientConfig
+from bittbridge.utils.iso_ne_day import EASTERN
+from bittbridge.utils.iso_ne_history import backfill, day_range
+
+DEFAULT_OUT = os.path.join("data", "iso_ne", "fiveminutesystemload")
+
+
+def _parse_day(value: str) -> str:
+    try:
+        return datetime.strptime(value.replace("-", ""), "%Y%m%d").strftime("%Y%m%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYYMMDD or YYYY-MM-DD, got {value!r}")
+
+
+def main():
+    yesterday = (datetime.now(EASTERN) - timedelta(days=1)).strftime("%Y%m%d")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", type=_parse_day, required=True, help="First day (YYYYMMDD)")
+    parser.add_argument("--end", type=_parse_day, default=yesterday, help="Last day, inclusive (default: yesterday)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"History root directory (default: {DEFAULT_OUT})")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight (default: 4)")
+    parser.add_argument("--rate", type=float, default=2.0, help="Max requests per second, 0 = unlimited (default: 2)")
+    parser.add_argument("--base-url", default=None, help="API base URL (default: ISO_NE_BASE_URL or the real API)")
+    parser.add_argument("--format", choices=("xml", "json"), default=None, help="Response format to request")
+    args = parser.parse_args()
+
+    if args.start > args.end:
+        parser.error("--start must not be after --end")
+
+    config = IsoNeClientConfig.from_env()
+    if args.base_url:
+        config = replace(config, base_url=args.base_url.rstrip("/"))
+    if args.format:
+        config = replace(config, response_format=args.format)
+    if not config.has_credentials and config.base_url == IsoNeClientConfig().base_url:
+        print("ERROR: ISO_NE_USERNAME and ISO_NE_PASSWORD must be set in .env")
+        sys.exit(1)
+
+    days = day_range(args.start, args.end)
+    print(f"Backfilling {len(days)} days ({args.start}..{args.end}) from {config.base_url} into {args.out}")
+
+    counter = {"n": 0}
+
+    def _progress(day: str, status: str) -> None:
+        counter["n"] += 1
+        if status != "skipped":
+            print(f"  [{counter['n']:>5}/{len(days)}] {day} {status}")
+
+    report = asyncio.run(
+        backfill(
+            args.out,
+            days,
+            config=config,
+            concurrency=args.concurrency,
+            rate_per_sec=args.rate,
+            on_day=_progress,
+        )
+    )
+    print(
+        f"Done: {len(report.written)} written, {len(report.incomplete)} with gaps, "
+        f"{len(report.skipped)} skipped (already on disk or not closed), {len(report.failed)} failed"
+    )
+    if report.incomplete:
+        print("Days with gaps (refetched on re-run): " + " ".join(report.incomplete))
+    if report.failed:
+        print("Failed days (re-run to retry):")
+        for day in report.failed:
+            print(f"  {day}: {report.errors.get(day, 'unknown error')}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
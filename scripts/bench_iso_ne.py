@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the ISO-NE helpers (no credentials or network needed).
+
+- ``lookup``: ground-truth lookup for every five-minute slot of a synthetic backlog of days,
+  comparing the legacy linear scan over ``(datetime, load_mw)`` tuples with the slot-indexed
+  :class:`DayLoad` used by ``get_load_mw_for_timestamp``.
+- ``parse``: parse cost of one full-day ``fiveminutesystemload/day`` payload, comparing the
+  legacy ElementTree + per-row ``fromisoformat`` parser with the NumPy parsers in
+  ``iso_ne_parse`` (XML and JSON). Pass ``--payload`` to time a recorded response (``.xml`` or
+  ``.json``); otherwise a full-day payload with the real ISO-NE row layout is synthesized.
+- ``fetch``: refreshes of the current day against the local ISO-NE stand-in (optional added
+  latency), full-day re-download vs incremental ``current`` refresh.
+
+Usage (from repo root ``bittbridge/``):
+``python scripts/bench_iso_ne.py lookup --days 7``
+``python scripts/bench_iso_ne.py parse --payload recorded_day.xml``
+``python scripts/bench_iso_ne.py fetch --latency-ms 40``
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from bittbridge.utils.iso_ne_day import EASTERN, UTC, DayLoad, day_bounds_utc, expected_slots
+from bittbridge.utils.iso_ne_mock import IsoNeStandIn, StandInConfig, day_rows, render_json, render_xml
+from bittbridge.utils.iso_ne_parse import parse_json_arrays, parse_xml_arrays
+
+
+def _synthetic_days(n_days: int, end_day: datetime) -> dict:
+    days = {}
+    for offset in range(n_days):
+        day = (end_day - timedelta(days=offset)).strftime("%Y%m%d")
+        start, _ = day_bounds_utc(day)
+        days[day] = [
+            (start + timedelta(minutes=5 * i), 12000.0 + (i % 97) * 3.5)
+            for i in range(expected_slots(day))
+        ]
+    return days
+
+
+def _legacy_scan(pairs, dt_rounded):
+    """Pre-DayLoad lookup from ``get_load_mw_for_timestamp``: normalize and compare every row."""
+    dt_rounded = dt_rounded.replace(second=0, microsecond=0)
+    for slot_dt, load_mw in pairs:
+        if slot_dt.replace(second=0, microsecond=0) == dt_rounded:
+            return load_mw
+    return None
+
+
+def _legacy_parse_xml(text):
+    """Pre-``iso_ne_parse`` XML parser: full tree, namespace fallbacks, fromisoformat per row."""
+    root = ET.fromstring(text)
+    ns = {"iso": "http://WEBSERV.iso-ne.com"}
+    elements = root.findall(".//iso:FiveMinSystemLoad", ns) or root.findall(".//FiveMinSystemLoad")
+    results = []
+    for elem in elements:
+        begin_date_elem = elem.find("iso:BeginDate", ns) or elem.find("BeginDate")
+        load_mw_elem = elem.find("iso:LoadMw", ns) or elem.find("LoadMw")
+        if begin_date_elem is None:
+            for child in elem:
+                if "BeginDate" in child.tag:
+                    begin_date_elem = child
+                    break
+        if load_mw_elem is None:
+            for child in elem:
+                if "LoadMw" in child.tag:
+                    load_mw_elem = child
+                    break
+        if begin_date_elem is None or load_mw_elem is None:
+            continue
+        dt = datetime.fromisoformat(begin_date_elem.text.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=UTC)
+        results.append((dt.astimezone(UTC), float(load_mw_elem.text)))
+    results.sort(key=lambda x: x[0])
+    return results
+
+
+def _synthetic_payloads(day: str) -> tuple:
+    """Full-day XML and JSON payloads rendered by the local ISO-NE stand-in."""
+    standin = IsoNeStandIn(now=lambda: float("inf"))
+    rows = day_rows(standin.published_day(day))
+    return render_xml(rows), render_json(rows)
+
+
+def _time_per_call(fn, payload, repeat: int) -> float:
+    fn(payload)  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(payload)
+    return (time.perf_counter() - t0) / repeat
+
+
+def bench_parse(payload_path: str, repeat: int) -> None:
+    day = (datetime.now(EASTERN) - timedelta(days=1)).strftime("%Y%m%d")
+    if payload_path:
+        with open(payload_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        is_json = payload_path.lower().endswith(".json")
+        xml_text, json_text = (None, text) if is_json else (text, None)
+        source = payload_path
+    else:
+        xml_text, json_text = _synthetic_payloads(day)
+        source = f"synthetic day {day}"
+
+    cases = []
+    if xml_text is not None:
+        n_rows = len(parse_xml_arrays(xml_text)[0])
+        cases.append(("legacy ElementTree + fromisoformat", _legacy_parse_xml, xml_text))
+        cases.append(("fixed-namespace XML -> NumPy", parse_xml_arrays, xml_text))
+    if json_text is not None:
+        n_rows = len(parse_json_arrays(json_text)[0])
+        cases.append(("JSON -> NumPy", parse_json_arrays, json_text))
+
+    print(f"Parse one full-day payload ({source}, {n_rows} rows, x{repeat}):")
+    timings = {}
+    for label, fn, payload in cases:
+        per_call = _time_per_call(fn, payload, repeat)
+        timings[label] = per_call
+        print(f"  {label:<36} {len(payload) / 1024:>8.1f} KiB  {per_call * 1e3:>9.3f} ms/payload")
+    legacy = timings.get("legacy ElementTree + fromisoformat")
+    fast = timings.get("fixed-namespace XML -> NumPy")
+    if legacy and fast:
+        print(f"  speedup (XML): {legacy / fast:.1f}x")
+
+
+def bench_fetch(n_requests: int, latency_ms: float) -> None:
+    from dataclasses import replace
+
+    from bittbridge.utils import iso_ne_api
+    from bittbridge.utils.iso_ne_client import IsoNeClientConfig, IsoNeSyncClient, set_clients
+    from bittbridge.utils.iso_ne_ratelimit import set_rate_limiter
+    from bittbridge.utils.iso_ne_store import set_day_store
+
+    set_day_store(None)
+    set_rate_limiter(None)
+    standin = IsoNeStandIn(StandInConfig(latency_sec=latency_ms / 1000.0))
+    base_url = standin.start_in_thread()
+    today = datetime.now(EASTERN).strftime("%Y%m%d")
+    config = IsoNeClientConfig(base_url=base_url, username="bench", password="bench")
+    n_published = standin.published_day(today).n_valid
+    print(
+        f"Refresh current day {today} ({n_published} intervals published) from local stand-in "
+        f"({latency_ms:g} ms latency, x{n_requests}):"
+    )
+    try:
+        for label, incremental in (("full-day re-download", False), ("incremental current", True)):
+            set_clients(sync_client=IsoNeSyncClient(replace(config, incremental=incremental)))
+            iso_ne_api.clear_cache()
+            iso_ne_api.fetch_day_load(today, use_cache=False)  # warm-up / prime
+            t0 = time.perf_counter()
+            for _ in range(n_requests):
+                iso_ne_api.fetch_day_load(today, use_cache=False)
+            _report(label, n_requests, time.perf_counter() - t0, unit="call")
+    finally:
+        set_clients()
+        standin.stop_thread()
+
+
+def _report(label: str, n_ops: int, elapsed: float, unit: str = "lookup") -> None:
+    per_op_us = elapsed / n_ops * 1e6 if n_ops else float("nan")
+    print(f"  {label:<28} {n_ops:>8} {unit}s  {elapsed * 1e3:>10.2f} ms  {per_op_us:>9.3f} us/{unit}")
+
+
+def bench_lookup(n_days: int, repeat: int) -> None:
+    days = _synthetic_days(n_days, datetime.now(EASTERN) - timedelta(days=1))
+    day_loads = {day: DayLoad.from_pairs(day, pairs) for day, pairs in days.items()}
+    targets = [(day, dt) for day, pairs in days.items() for dt, _ in pairs]
+    n_ops = len(targets) * repeat
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for day, dt in targets:
+            _legacy_scan(days[day], dt)
+    legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for day, dt in targets:
+            day_loads[day].get(dt.timestamp())
+    indexed = time.perf_counter() - t0
+
+    print(f"Ground-truth lookup over a {n_days}-day backlog ({len(targets)} slots, x{repeat}):")
+    _report("legacy tuple scan", n_ops, legacy)
+    _report("DayLoad slot index", n_ops, indexed)
+    if indexed > 0:
+        print(f"  speedup: {legacy / indexed:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="bench", required=True)
+    lookup = sub.add_parser("lookup", help="Slot-indexed vs linear-scan ground-truth lookup")
+    lookup.add_argument("--days", type=int, default=7, help="Days of backlog to look up (default: 7)")
+    lookup.add_argument("--repeat", type=int, default=3, help="Passes over the backlog (default: 3)")
+    parse = sub.add_parser("parse", help="Full-day payload parse cost (legacy vs NumPy parsers)")
+    parse.add_argument("--payload", default="", help="Recorded response (.xml or .json); default: synthesized")
+    parse.add_argument("--repeat", type=int, default=50, help="Parses per parser (default: 50)")
+    fetch = sub.add_parser("fetch", help="Current-day refresh against the local ISO-NE stand-in")
+    fetch.add_argument("--requests", type=int, default=50, help="Refreshes per mode (default: 50)")
+    fetch.add_argument("--latency-ms", type=float, default=0.0, help="Stand-in latency per request")
+    args = parser.parse_args()
+
+    if args.bench == "lookup":
+        bench_lookup(args.days, args.repeat)
+    elif args.bench == "parse":
+        bench_parse(args.payload, args.repeat)
+    elif args.bench == "fetch":
+        bench_fetch(args.requests, args.latency_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Run the local ISO-NE web-services stand-in (see ``bittbridge/utils/iso_ne_mock.py``).
+
+Serves ``fiveminutesystemload/day/{YYYYMMDD}`` and ``fiveminutesystemload/current`` in the real
+XML/JSON schema from a local backfilled history (``--history``) or synthetic data, with optional
+latency, injected 503/429 errors and late publication. Point a miner, validator, benchmark or
+backfill at it with ``ISO_NE_BASE_URL=http://127.0.0.1:<port>`` (any credentials are accepted).
+
+Usage (from repo root ``bittbridge/``):
+``python scripts/iso_ne_standin.py --port 8765 --latency-ms 80 --error-rate 0.05 --publish-lag 180``
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from bittbridge.utils.iso_ne_mock import IsoNeStandIn, StandInConfig
+
+
+async def _serve(standin: IsoNeStandIn, host: str, port: int) -> None:
+    base_url = await standin.start(host, port)
+    print(f"ISO-NE stand-in listening on {base_url}  (export ISO_NE_BASE_URL={base_url})")
+    try:
+        while True:
+            await asyncio.sleep(60)
+            served = sum(standin.requests.values())
+            print(f"  served {served} requests, injected errors: {dict(standin.injected) or 'none'}")
+    finally:
+        await standin.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--history", default=None, help="Backfilled history root to serve (default: synthetic)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--publish-lag", type=float, default=0.0, help="Seconds after an interval ends before it appears")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency/error randomness")
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        latency_sec=args.latency_ms / 1000.0,
+        latency_jitter_sec=args.jitter_ms / 1000.0,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        publish_lag_sec=args.publish_lag,
+        history_root=args.history,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(_serve(IsoNeStandIn(config), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,678 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from bittbridge.utils import iso_ne_api
+from bittbridge.utils.iso_ne_client import IsoNeAsyncClient, IsoNeClientConfig, set_clients
+from bittbridge.utils.iso_ne_day import EASTERN, UTC, DayLoad, day_bounds_utc, expected_slots
+from bittbridge.utils.iso_ne_ratelimit import HostRateLimiter, RateLimitTimeout, set_rate_limiter
+from bittbridge.utils.iso_ne_store import IsoNeDayStore, set_day_store
+
+
+def _day_xml(
+    day_yyyymmdd: str, n_rows: int | None = None, base_mw: float = 12000.0, first_row: int = 0
+) -> str:
+    start, _ = day_bounds_utc(day_yyyymmdd)
+    if n_rows is None:
+        n_rows = expected_slots(day_yyyymmdd)
+    rows = []
+    for i in range(first_row, first_row + n_rows):
+        begin = (start + timedelta(minutes=5 * i)).astimezone(EASTERN)
+        stamp = begin.isoformat(timespec="milliseconds")
+        rows.append(
+            "<FiveMinSystemLoad>"
+            f"<BeginDate>{stamp}</BeginDate>"
+            f"<LoadMw>{base_mw + i:.3f}</LoadMw>"
+            "</FiveMinSystemLoad>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<FiveMinSystemLoads xmlns="http://WEBSERV.iso-ne.com">' + "".join(rows) + "</FiveMinSystemLoads>"
+    )
+
+
+class _FakeHttpResponse:
+    def __init__(self, text: str, status_code: int = 200):
+        self.text = text
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeGet:
+    def __init__(self, payloads: dict[str, str]):
+        self.payloads = payloads
+        self.calls: list[str] = []
+
+    def __call__(self, url, **kwargs):
+        self.calls.append(url)
+        day = url.rstrip("/").rsplit("/", 1)[-1]
+        if day not in self.payloads:
+            return _FakeHttpResponse("", status_code=404)
+        return _FakeHttpResponse(self.payloads[day])
+
+
+@pytest.fixture(autouse=True)
+def _isolated_iso_ne(monkeypatch, tmp_path):
+    monkeypatch.setenv("ISO_NE_USERNAME", "user")
+    monkeypatch.setenv("ISO_NE_PASSWORD", "pass")
+    monkeypatch.setenv("ISO_NE_RETRY_BACKOFF_SEC", "0")
+    set_day_store(IsoNeDayStore(str(tmp_path / "store.sqlite3")))
+    set_rate_limiter(None)
+    set_clients()
+    iso_ne_api.clear_cache()
+    yield
+    iso_ne_api.clear_cache()
+    set_clients()
+    set_rate_limiter(None)
+    set_day_store(None)
+
+
+def _install_fake_get(monkeypatch, payloads: dict[str, str]) -> _FakeGet:
+    fake = _FakeGet(payloads)
+    client = iso_ne_api.get_sync_client()
+    monkeypatch.setattr(client._session, "get", fake)
+    return fake
+
+
+def test_closed_day_is_persisted_and_served_from_store_after_restart(monkeypatch):
+    day = "20260105"
+    fake = _install_fake_get(monkeypatch, {day: _day_xml(day)})
+
+    first = iso_ne_api.fetch_fiveminute_system_load(day, use_cache=False)
+    assert len(first) == 288
+    assert len(fake.calls) == 1
+
+    # Simulate a process restart: in-memory cache is gone, the on-disk store is not.
+    iso_ne_api.clear_cache()
+    second = iso_ne_api.fetch_fiveminute_system_load(day, use_cache=False)
+    assert second == first
+    assert len(fake.calls) == 1
+
+
+def test_incomplete_closed_day_is_not_persisted(monkeypatch):
+    day = "20260105"
+    fake = _install_fake_get(monkeypatch, {day: _day_xml(day, n_rows=200)})
+
+    iso_ne_api.fetch_fiveminute_system_load(day, use_cache=False)
+    iso_ne_api.clear_cache()
+    iso_ne_api.fetch_fiveminute_system_load(day, use_cache=False)
+    assert len(fake.calls) == 2
+
+
+def test_current_day_is_never_persisted(monkeypatch, tmp_path):
+    day = datetime.now(EASTERN).strftime("%Y%m%d")
+    _install_fake_get(monkeypatch, {day: _day_xml(day, n_rows=12)})
+    store = IsoNeDayStore(str(tmp_path / "today.sqlite3"))
+    set_day_store(store)
+
+    iso_ne_api.fetch_fiveminute_system_load(day, use_cache=False)
+    assert not store.has_day(day)
+
+
+def test_open_day_refresh_appends_current_interval_and_falls_back_on_gap(monkeypatch):
+    day = datetime.now(EASTERN).strftime("%Y%m%d")
+    payloads = {day: _day_xml(day, n_rows=12), "current": _day_xml(day, n_rows=1, first_row=12)}
+    fake = _install_fake_get(monkeypatch, payloads)
+
+    assert iso_ne_api.fetch_day_load(day, use_cache=False).n_valid == 12
+    refreshed = iso_ne_api.fetch_day_load(day, use_cache=False)
+    assert refreshed.n_valid == 13
+    assert refreshed.get(refreshed.start_epoch + 12 * 300) == 12012.0
+    assert [url.rsplit("/", 1)[-1] for url in fake.calls] == [day, "current"]
+
+    # Current interval two slots past the newest one held: re-download the whole day.
+    payloads["current"] = _day_xml(day, n_rows=1, first_row=14)
+    payloads[day] = _day_xml(day, n_rows=15)
+    assert iso_ne_api.fetch_day_load(day, use_cache=False).n_valid == 15
+    assert [url.rsplit("/", 1)[-1] for url in fake.calls] == [day, "current", "current", day]
+
+
+def test_day_cache_evicts_lru_closed_days_and_expires_open_day(monkeypatch):
+    monkeypatch.setenv("ISO_NE_CACHE_MAX_DAYS", "2")
+    monkeypatch.setenv("ISO_NE_CACHE_OPEN_DAY_TTL_SEC", "60")
+    set_day_store(None)
+    iso_ne_api.clear_cache()
+    today = datetime.now(EASTERN).strftime("%Y%m%d")
+    closed = ["20260105", "20260106", "20260107"]
+    payloads = {day: _day_xml(day) for day in closed}
+    payloads[today] = _day_xml(today, n_rows=12)
+    fake = _install_fake_get(monkeypatch, payloads)
+
+    for day in closed[:2]:
+        iso_ne_api.fetch_day_load(day)
+    iso_ne_api.fetch_day_load(closed[0])  # hit; closed[1] becomes least recently used
+    iso_ne_api.fetch_day_load(closed[2])  # evicts closed[1]
+    iso_ne_api.fetch_day_load(closed[0])
+    assert len(fake.calls) == 3
+    iso_ne_api.fetch_day_load(closed[1])
+    assert len(fake.calls) == 4
+    stats = iso_ne_api.get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["days"]) == (2, 4, 2, 2)
+    assert stats["nbytes"] == 2 * 288 * 9
+
+    now = [1000.0]
+    iso_ne_api._day_cache._clock = lambda: now[0]
+    iso_ne_api.fetch_day_load(today)
+    now[0] += 30
+    iso_ne_api.fetch_day_load(today)
+    assert len(fake.calls) == 5
+    now[0] += 31
+    iso_ne_api.fetch_day_load(today)
+    assert fake.calls[5:] and fake.calls[-1].endswith(today)
+    assert iso_ne_api.get_cache_stats()["expirations"] == 1
+
+
+def test_day_cache_keeps_open_day_past_max_days_until_its_ttl():
+    from bittbridge.utils.iso_ne_cache import DayCache
+
+    def day_load(day, n):
+        start = int(day_bounds_utc(day)[0].timestamp())
+        return DayLoad.from_arrays(day, [start + 300 * i for i in range(n)], [float(i) for i in range(n)])
+
+    now = [1000.0]
+    cache = DayCache(max_days=2, open_day_ttl_sec=60, clock=lambda: now[0])
+    today = datetime.now(EASTERN).strftime("%Y%m%d")
+    cache.put(day_load(today, 12))
+    for day in ["20260105", "20260106", "20260107"]:
+        cache.put(day_load(day, 288))  # the open day is least recently used every time
+
+    assert today in cache
+    assert "20260105" not in cache and "20260106" not in cache and "20260107" in cache
+    assert cache.stats.evictions == 2
+
+    now[0] += 61
+    cache.put(day_load("20260108", 288))
+    assert today not in cache
+    assert cache.stats.expirations == 1
+    assert (cache.stats.evictions, cache.stats.days) == (2, 2)
+
+
+def test_get_load_mw_for_timestamp_reads_closed_day_from_store(monkeypatch):
+    day = "20260105"
+    fake = _install_fake_get(monkeypatch, {day: _day_xml(day)})
+    iso_ne_api.fetch_fiveminute_system_load(day, use_cache=False)
+    iso_ne_api.clear_cache()
+
+    slot = EASTERN.localize(datetime(2026, 1, 5, 10, 30)).astimezone(UTC)
+    value = iso_ne_api.get_load_mw_for_timestamp(slot.isoformat())
+    assert value == pytest.approx(12000.0 + (10 * 60 + 30) // 5)
+    assert len(fake.calls) == 1
+
+
+def test_day_load_slot_lookup_handles_dst_fall_back_day():
+    day = "20261101"  # Eastern clocks repeat 01:00-02:00; the day has 300 intervals.
+    start, _ = day_bounds_utc(day)
+    epochs = [int(start.timestamp()) + 300 * i for i in range(expected_slots(day))]
+    day_load = DayLoad.from_arrays(day, epochs, [float(i) for i in range(len(epochs))])
+
+    assert day_load.values.size == 300
+    assert day_load.is_complete
+    # Second 01:30 (EST, after the fall-back) is 12 intervals after the first one (EDT).
+    first_0130 = EASTERN.localize(datetime(2026, 11, 1, 1, 30), is_dst=True)
+    second_0130 = EASTERN.localize(datetime(2026, 11, 1, 1, 30), is_dst=False)
+    assert day_load.get(second_0130.timestamp()) - day_load.get(first_0130.timestamp()) == 12.0
+    assert day_load.get(start.timestamp() - 1) is None
+
+
+def test_day_load_get_returns_none_for_unpublished_slot():
+    day = "20260105"
+    start, _ = day_bounds_utc(day)
+    day_load = DayLoad.from_arrays(day, [int(start.timestamp())], [12345.678])
+
+    assert day_load.get(start.timestamp()) == 12345.678
+    assert day_load.get(start.timestamp() + 300) is None
+    assert day_load.to_pairs() == [(start, 12345.678)]
+
+
+class _FlakyGet(_FakeGet):
+    """Answers 503 for the first ``failures`` calls, then serves the payloads."""
+
+    def __init__(self, payloads: dict[str, str], failures: int):
+        super().__init__(payloads)
+        self.failures = failures
+
+    def __call__(self, url, **kwargs):
+        if self.failures > 0:
+            self.failures -= 1
+            self.calls.append(url)
+            return _FakeHttpResponse("", status_code=503)
+        return super().__call__(url, **kwargs)
+
+
+def test_sync_client_retries_transient_errors(monkeypatch):
+    day = "20260105"
+    fake = _FlakyGet({day: _day_xml(day)}, failures=2)
+    monkeypatch.setattr(iso_ne_api.get_sync_client()._session, "get", fake)
+
+    day_load = iso_ne_api.fetch_day_load(day, use_cache=False)
+
+    assert day_load is not None and day_load.is_complete
+    assert len(fake.calls) == 3
+
+
+def test_concurrent_async_fetches_share_one_upstream_request(tmp_path):
+    import asyncio
+
+    from aiohttp import web
+
+    day = "20260105"
+    payload = _day_xml(day)
+    hits: list[str] = []
+
+    async def handler(request):
+        hits.append(request.path)
+        await asyncio.sleep(0.05)
+        return web.Response(text=payload, content_type="application/xml")
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/fiveminutesystemload/day/{day}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        client = IsoNeAsyncClient(
+            IsoNeClientConfig(base_url=f"http://127.0.0.1:{port}", username="user", password="pass")
+        )
+        set_clients(async_client=client)
+        try:
+            return await asyncio.gather(
+                *(iso_ne_api.fetch_day_load_async(day, use_cache=False) for _ in range(8))
+            )
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    results = asyncio.run(scenario())
+
+    assert len(hits) == 1
+    assert all(r is not None and r.is_complete for r in results)
+
+
+def test_async_client_closes_session_of_a_finished_loop():
+    import asyncio
+
+    from bittbridge.utils.iso_ne_mock import IsoNeStandIn, StandInConfig
+
+    standin = IsoNeStandIn(StandInConfig())
+    client = IsoNeAsyncClient(IsoNeClientConfig(base_url=standin.start_in_thread(), username="u", password="p"))
+
+    async def fetch():
+        await client.get_text("fiveminutesystemload/day/20260105")
+        return await client._get_session()
+
+    try:
+        first = asyncio.run(fetch())
+        second = asyncio.run(fetch())
+        assert first is not second
+        assert first.closed and not second.closed
+        assert list(client._sessions.values()) == [second]
+        asyncio.run(client.close())
+        assert second.closed and not client._sessions
+    finally:
+        standin.stop_thread()
+
+
+def test_parse_xml_and_json_agree_across_dst_fall_back():
+    import json
+
+    from bittbridge.utils.iso_ne_parse import parse_json_arrays, parse_xml_arrays
+
+    day = "20261101"
+    xml_text = _day_xml(day)
+    start, _ = day_bounds_utc(day)
+    rows = [
+        {
+            "BeginDate": (start + timedelta(minutes=5 * i)).astimezone(EASTERN).isoformat(timespec="milliseconds"),
+            "LoadMw": 12000.0 + i,
+            "NativeLoad": 12500.0 + i,
+        }
+        for i in range(expected_slots(day))
+    ]
+    json_text = json.dumps({"FiveMinSystemLoads": {"FiveMinSystemLoad": rows}})
+
+    xml_epochs, xml_loads = parse_xml_arrays(xml_text)
+    json_epochs, json_loads = parse_json_arrays(json_text)
+
+    expected = int(start.timestamp()) + 300 * np.arange(300)
+    assert (xml_epochs == expected).all()
+    assert (json_epochs == xml_epochs).all()
+    assert (json_loads == xml_loads).all()
+    assert DayLoad.from_arrays(day, xml_epochs, xml_loads).is_complete
+
+
+def test_parse_xml_skips_incomplete_and_malformed_rows():
+    from bittbridge.utils.iso_ne_parse import parse_xml_arrays
+
+    text = (
+        "<FiveMinSystemLoads>"
+        "<FiveMinSystemLoad><BeginDate>2026-01-05T00:00:00.000-05:00</BeginDate><LoadMw>1.5</LoadMw></FiveMinSystemLoad>"
+        "<FiveMinSystemLoad><BeginDate>2026-01-05T00:05:00.000-05:00</BeginDate></FiveMinSystemLoad>"
+        "<FiveMinSystemLoad><BeginDate>not-a-date</BeginDate><LoadMw>3.0</LoadMw></FiveMinSystemLoad>"
+        "<FiveMinSystemLoad><BeginDate>2026-01-05T05:10:00Z</BeginDate><LoadMw>2.5</LoadMw></FiveMinSystemLoad>"
+        "</FiveMinSystemLoads>"
+    )
+    epochs, loads = parse_xml_arrays(text)
+
+    start = int(day_bounds_utc("20260105")[0].timestamp())
+    assert epochs.tolist() == [start, start + 600]
+    assert loads.tolist() == [1.5, 2.5]
+
+
+def test_load_ring_buffer_latest_across_midnight_and_gaps():
+    from bittbridge.utils.iso_ne_buffer import LoadRingBuffer
+
+    buffer = LoadRingBuffer()
+    start = int(day_bounds_utc("20260106")[0].timestamp())
+    epochs = start + 300 * np.arange(-6, 6)  # last 30 min of 20260105, first 30 min of 20260106
+    buffer.extend(epochs, np.arange(12, dtype=np.float64))
+
+    assert buffer.latest(12).tolist() == list(range(12))
+    assert buffer.latest(13) is None
+    assert buffer.is_fresh(now=start + 6 * 300 + 60)
+    assert not buffer.is_fresh(now=start + 6 * 300 + 3600)
+
+    # A re-sent interval is not counted twice; a skipped interval is bridged over.
+    assert buffer.extend(epochs[-1:], np.array([11.0])) == 0
+    buffer.extend(np.array([start + 7 * 300]), np.array([99.0]))
+    assert buffer.latest(3).tolist() == [10.0, 11.0, 99.0]
+
+
+def test_load_buffer_poller_primes_then_fetches_only_when_interval_due():
+    from bittbridge.utils.iso_ne_buffer import LoadBufferPoller, LoadRingBuffer
+
+    days = {
+        d: DayLoad.from_arrays(
+            d,
+            [int(day_bounds_utc(d)[0].timestamp()) + 300 * i for i in range(n)],
+            [float(i) for i in range(n)],
+        )
+        for d, n in (("20260105", 288), ("20260106", 120))
+    }
+    calls: list[tuple[str, bool]] = []
+
+    def fetch(day, use_cache=True):
+        calls.append((day, use_cache))
+        return days.get(day)
+
+    buffer = LoadRingBuffer()
+    poller = LoadBufferPoller(buffer, fetch=fetch)
+    now = int(day_bounds_utc("20260106")[0].timestamp()) + 120 * 300 + 90  # interval 119 has ended
+
+    assert poller.refresh(now=now) == 288 + 120
+    assert calls == [("20260105", True), ("20260106", False)]
+    assert poller.refresh(now=now + 60) == 0  # next interval not due yet: no request
+    assert len(calls) == 2
+    assert buffer.latest(12).tolist() == [float(i) for i in range(108, 120)]
+
+
+def test_backfill_writes_partitions_and_resumes_after_failures(tmp_path):
+    import asyncio
+
+    from aiohttp import web
+
+    from bittbridge.utils.iso_ne_history import backfill, partition_path, read_history
+
+    days = ["20260103", "20260104", "20260105"]
+    broken = {"20260104"}
+    hits: list[str] = []
+
+    async def handler(request):
+        day = request.match_info["day"]
+        hits.append(day)
+        if day in broken:
+            return web.Response(status=500)
+        return web.Response(text=_day_xml(day), content_type="application/xml")
+
+    async def run_backfill():
+        app = web.Application()
+        app.router.add_get("/fiveminutesystemload/day/{day}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        config = IsoNeClientConfig(base_url=f"http://127.0.0.1:{port}", max_retries=0)
+        try:
+            return await backfill(str(tmp_path / "history"), days, config=config, concurrency=2, rate_per_sec=0)
+        finally:
+            await runner.cleanup()
+
+    first = asyncio.run(run_backfill())
+    assert first.written == ["20260103", "20260105"]
+    assert first.failed == ["20260104"]
+    assert list(first.errors) == ["20260104"] and "500" in first.errors["20260104"]
+    assert first.errors["20260104"].startswith("fetch: ")
+    assert partition_path(str(tmp_path / "history"), "20260104") is None
+
+    broken.clear()
+    hits.clear()
+    second = asyncio.run(run_backfill())
+    assert hits == ["20260104"]
+    assert second.written == ["20260104"]
+    assert second.skipped == ["20260103", "20260105"]
+
+    history = read_history(str(tmp_path / "history"), "20260103", "20260105")
+    assert len(history) == 3 * 288
+    assert history["begin_utc"].is_monotonic_increasing
+    assert history["begin_utc"].iloc[0] == day_bounds_utc("20260103")[0]
+
+
+def test_backfill_refetches_incomplete_days_and_reports_write_failures(tmp_path, monkeypatch):
+    import asyncio
+
+    from aiohttp import web
+
+    from bittbridge.utils import iso_ne_history
+    from bittbridge.utils.iso_ne_history import backfill, is_partition_incomplete, read_day_partition
+
+    root = str(tmp_path / "history")
+    days = ["20260103", "20260104"]
+    gapped = {"20260103"}
+    hits: list[str] = []
+
+    async def handler(request):
+        day = request.match_info["day"]
+        hits.append(day)
+        n_rows = 100 if day in gapped else None
+        return web.Response(text=_day_xml(day, n_rows=n_rows), content_type="application/xml")
+
+    async def run_backfill():
+        app = web.Application()
+        app.router.add_get("/fiveminutesystemload/day/{day}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        config = IsoNeClientConfig(base_url=f"http://127.0.0.1:{port}", max_retries=0)
+        try:
+            return await backfill(root, days, config=config, concurrency=2, rate_per_sec=0)
+        finally:
+            await runner.cleanup()
+
+    write = iso_ne_history.write_day_partition
+
+    def failing_write(root_dir, day_load):
+        if day_load.day == "20260104":
+            raise OSError("disk full")
+        return write(root_dir, day_load)
+
+    monkeypatch.setattr(iso_ne_history, "write_day_partition", failing_write)
+    first = asyncio.run(run_backfill())
+    assert first.incomplete == ["20260103"]
+    assert first.failed == ["20260104"]
+    assert first.errors == {"20260104": "write: OSError: disk full"}
+    assert is_partition_incomplete(root, "20260103")
+    assert read_day_partition(root, "20260103").n_valid == 100
+
+    monkeypatch.setattr(iso_ne_history, "write_day_partition", write)
+    gapped.clear()
+    hits.clear()
+    second = asyncio.run(run_backfill())
+    assert sorted(hits) == days
+    assert second.written == days and second.errors == {}
+    assert not is_partition_incomplete(root, "20260103")
+    assert read_day_partition(root, "20260103").is_complete
+
+    hits.clear()
+    third = asyncio.run(run_backfill())
+    assert hits == [] and third.skipped == days
+
+
+def test_rate_limiter_bucket_is_shared_through_the_state_file(tmp_path):
+    path = str(tmp_path / "ratelimit.state")
+    # Two instances with their own file handles stand in for two processes on one host.
+    first = HostRateLimiter(path, rate_per_sec=20.0, burst=2)
+    second = HostRateLimiter(path, rate_per_sec=20.0, burst=2)
+
+    assert first.acquire() == 0.0
+    assert second.acquire() == 0.0
+    waited = first.acquire()  # bucket drained by both: waits ~1/20 s for a refill
+
+    assert 0.02 < waited < 1.0
+    assert first.stats.acquired == 2 and first.stats.throttled == 1
+    assert first.stats.wait_sec_total == pytest.approx(waited)
+    assert second.stats.throttled == 0
+
+
+def test_async_acquire_waits_for_the_file_lock_off_the_event_loop(tmp_path):
+    import asyncio
+    import fcntl
+    import os
+    import threading
+
+    path = str(tmp_path / "ratelimit.state")
+    limiter = HostRateLimiter(path, rate_per_sec=20.0, burst=2)
+    other_process = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    fcntl.flock(other_process, fcntl.LOCK_EX)
+
+    async def scenario():
+        ticks = 0
+        acquire = asyncio.ensure_future(limiter.acquire_async())
+        while not acquire.done():  # the loop keeps running while the lock is held elsewhere
+            await asyncio.sleep(0.01)
+            ticks += 1
+        return acquire.result(), ticks
+
+    release = threading.Timer(0.2, fcntl.flock, (other_process, fcntl.LOCK_UN))
+    release.start()
+    try:
+        waited, ticks = asyncio.run(scenario())
+    finally:
+        release.join()
+        os.close(other_process)
+    assert waited == 0.0
+    assert ticks >= 5
+    assert limiter.stats.acquired == 1
+
+
+def test_rate_limit_timeout_is_surfaced_as_fetch_error(monkeypatch, tmp_path):
+    limiter = HostRateLimiter(str(tmp_path / "ratelimit.state"), rate_per_sec=0.1, burst=1, max_wait_sec=0.05)
+    limiter.acquire()
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire()
+    set_rate_limiter(limiter)
+    day = "20260105"
+    fake = _install_fake_get(monkeypatch, {day: _day_xml(day)})
+
+    assert iso_ne_api.fetch_fiveminute_system_load(day, use_cache=False) == []
+    assert fake.calls == []
+    assert "429" in iso_ne_api.get_last_fetch_error()
+    assert limiter.stats.timeouts == 2
+
+
+def test_standin_serves_day_end_to_end_with_late_publication(tmp_path):
+    from dataclasses import replace
+
+    from bittbridge.utils.iso_ne_client import IsoNeSyncClient
+    from bittbridge.utils.iso_ne_history import write_day_partition
+    from bittbridge.utils.iso_ne_mock import IsoNeStandIn, StandInConfig, synthetic_load_mw
+
+    day = "20260105"
+    start = int(day_bounds_utc(day)[0].timestamp())
+    recorded = DayLoad.from_arrays(day, start + 300 * np.arange(288), 15000.0 + np.arange(288))
+    write_day_partition(str(tmp_path / "history"), recorded)
+
+    clock = {"now": start + 100 * 300 + 30}  # interval 99 ended 30 s ago
+    standin = IsoNeStandIn(
+        StandInConfig(publish_lag_sec=60, history_root=str(tmp_path / "history")), now=lambda: clock["now"]
+    )
+    base_url = standin.start_in_thread()
+    try:
+        config = IsoNeClientConfig(base_url=base_url, username="user", password="pass")
+        set_clients(sync_client=IsoNeSyncClient(config))
+        partial = iso_ne_api.fetch_day_load(day, use_cache=False)
+        assert partial.n_valid == 99  # interval 99 is still inside the publication lag
+
+        clock["now"] += 60
+        set_clients(sync_client=IsoNeSyncClient(replace(config, response_format="json")))
+        refreshed = iso_ne_api.fetch_day_load(day, use_cache=False)
+        assert refreshed.n_valid == 100
+        assert refreshed.get(start + 99 * 300) == 15099.0
+        assert standin.requests[f"day/{day}"] == 2  # incomplete day was not persisted
+
+        # Days missing from the history fall back to the synthetic curve.
+        other = iso_ne_api.fetch_day_load("20251231", use_cache=False)
+        assert other.is_complete
+        assert other.values[:3].tolist() == synthetic_load_mw(other.valid_epochs()[:3]).tolist()
+    finally:
+        standin.stop_thread()
+
+
+def test_standin_thread_start_raises_when_the_port_is_taken():
+    import socket
+
+    from bittbridge.utils.iso_ne_mock import IsoNeStandIn
+
+    taken = socket.socket()
+    taken.bind(("127.0.0.1", 0))
+    taken.listen()
+    try:
+        standin = IsoNeStandIn()
+        with pytest.raises(OSError):
+            standin.start_in_thread(port=taken.getsockname()[1])
+        assert standin.base_url is None
+        standin.stop_thread()  # nothing to stop; must not hang either
+    finally:
+        taken.close()
+
+
+def test_standin_injected_errors_are_retried_and_reported():
+    import asyncio
+
+    from bittbridge.utils.iso_ne_mock import IsoNeStandIn, StandInConfig
+
+    async def scenario():
+        standin = IsoNeStandIn(StandInConfig(error_rate=1.0, seed=7))
+        base_url = await standin.start()
+        client = IsoNeAsyncClient(
+            IsoNeClientConfig(base_url=base_url, username="u", password="p", max_retries=2, retry_backoff_sec=0)
+        )
+        set_clients(async_client=client)
+        try:
+            return await iso_ne_api.fetch_day_load_async("20260105", use_cache=False), standin
+        finally:
+            await client.close()
+            await standin.stop()
+
+    day_load, standin = asyncio.run(scenario())
+    assert day_load is None
+    assert standin.requests["day/20260105"] == 3
+    assert standin.injected[503] == 3
+    assert "HTTP 503" in iso_ne_api.get_last_fetch_error()
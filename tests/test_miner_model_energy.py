@@ -17,9 +17,15 @@ import yaml
 from neurons import miner as miner_module
 from miner_model_energy.artifacts import load_manifest
 from miner_model_energy.features import KNOWN_WEATHER_SUFFIXES
-from miner_model_energy.inference_runtime import AdvancedModelPredictor, PredictorRouter
+from miner_model_energy import inference_runtime
+from miner_model_energy.inference_runtime import (
+    AdvancedModelPredictor,
+    BaselineMovingAveragePredictor,
+    PredictorRouter,
+)
 from miner_model_energy.ml_config import ModelConfig, load_model_config
-from miner_model_energy.models_lstm import LSTM_SCALER_FILENAME
+from miner_model_energy.models_lstm import LSTM_SCALER_FILENAME, predict_lstm
+from miner_model_energy.models_rnn import predict_rnn
 from miner_model_energy.data_io import TARGET_COLUMN, TARGET_COLUMN_HORIZON
 from miner_model_energy.pipeline import (
     TrainingResult,
@@ -178,6 +184,46 @@ def test_cart_feature_toggle_combinations(tmp_path, feature_patch):
     assert result.metrics["validation"]["mae"] >= 0.0
 
 
+@pytest.mark.parametrize("n_steps", [1, 4])
+@pytest.mark.parametrize("feature_patch", FEATURE_COMBOS)
+def test_live_feature_engine_matches_batch_features(feature_patch, n_steps):
+    import numpy as np
+
+    from miner_model_energy.features import build_feature_columns
+    from miner_model_energy.live_features import LiveFeatureEngine
+    from miner_model_energy.pipeline import _build_live_sequence_matrix, _live_feature_frames
+    from miner_model_energy.supabase_io import normalize_supabase_train_frame
+
+    features_cfg = {**_default_features(), **feature_patch}
+    cfg = ModelConfig(data={}, features=features_cfg, training={}, models={}, persistence={})
+    start = datetime(2025, 1, 1, 0, 0, 0)
+    rows = [_weather_row(i, start) for i in range(61)]
+    rows[59]["4B8-tmpf"] = None  # an incomplete history row is skipped for sequences, as by dropna()
+    for row in rows:
+        row["dt"] += "+00:00"
+    history = normalize_supabase_train_frame(pd.DataFrame(rows))
+    forecast_row = {**_weather_row(61, start), "horizon_min": 5}
+    del forecast_row["Total Load"]
+
+    history_features, test_features = _live_feature_frames(cfg, history, forecast_row)
+    features = build_feature_columns(history_features, test_features)
+    expected_row = test_features[features].astype(float).to_numpy()[0]
+
+    engine = LiveFeatureEngine(features_cfg, features, n_steps=n_steps)
+    assert engine.ingest(history.iloc[:40]) == 40
+    assert engine.ingest(history.iloc[30:]) == 21  # overlapping tail: only new rows are added
+    assert engine.ingest(history.iloc[55:]) == 0
+    vector, sequence, input_row = engine.features_for(forecast_row)
+
+    np.testing.assert_allclose(vector, expected_row, rtol=1e-9, equal_nan=True)
+    assert list(input_row) == features
+    if n_steps > 1:
+        expected_seq = _build_live_sequence_matrix(history_features, test_features, features, n_steps)
+        np.testing.assert_allclose(sequence, expected_seq, rtol=1e-9)
+    else:
+        assert sequence is None
+
+
 def test_linear_training_and_persistence(tmp_path):
     train_path, test_path = _write_dataset(tmp_path)
     cfg_path = _write_config(
@@ -294,6 +340,536 @@ def test_predictor_router_switch(tmp_path):
     assert isinstance(value, float)
 
 
+def test_advanced_predictor_memoizes_test_row_and_releases_frames(tmp_path, monkeypatch):
+    train_path, test_path = _write_dataset(tmp_path)
+    cfg_path = _write_config(tmp_path, train_path, test_path, {"use_load_lags": True})
+    cfg = load_model_config(str(cfg_path))
+    result = train_model("linear", cfg)
+    expected = predict_single_test_row(result)
+
+    calls = []
+    real = inference_runtime.predict_single_test_row_with_context
+    monkeypatch.setattr(
+        inference_runtime,
+        "predict_single_test_row_with_context",
+        lambda r: calls.append(1) or real(r),
+    )
+    predictor = AdvancedModelPredictor(result)
+    for ts in ("2025-01-01 12:00:00", "2025-01-01 12:05:00", "2025-01-01 12:10:00"):
+        assert predictor.predict(ts) == expected
+    assert len(calls) == 1
+    assert predictor.last_prediction_context["model_input_row"]
+    assert predictor.result.train_frame.empty and predictor.result.test_frame.empty
+    assert list(predictor.result.train_frame.columns) == list(result.train_frame.columns)
+    assert len(predictor.result.y_train) == 0
+    # The caller's result is untouched (persist_training_result still needs the frames).
+    assert not result.train_frame.empty and len(result.y_train) > 0
+
+
+@pytest.mark.parametrize("n_test_rows, kept_history, kept_test", [(1, 4, 1), (8, 0, 6)])
+def test_release_training_result_keeps_only_serving_inputs(tmp_path, n_test_rows, kept_history, kept_test):
+    import numpy as np
+
+    from miner_model_energy.models_lstm import LstmBundle
+    from miner_model_energy.sequence_kernels import SequenceKernel
+
+    train_path, test_path = _write_dataset(tmp_path)
+    cfg_path = _write_config(tmp_path, train_path, test_path, {"use_load_lags": True})
+    cfg = load_model_config(str(cfg_path))
+    result = train_model("linear", cfg)
+    n_features, units = len(result.features), 3
+    rng = np.random.default_rng(1)
+    result.model_type = "lstm"  # a NumPy-kernel LSTM serves without TensorFlow
+    result.model_bundle = LstmBundle(
+        model=None,
+        features=result.features,
+        n_steps=5,
+        kernel=SequenceKernel(
+            cell="lstm",
+            kernel=rng.normal(0, 0.01, (n_features, 4 * units)).astype(np.float32),
+            recurrent_kernel=rng.normal(0, 0.1, (units, 4 * units)).astype(np.float32),
+            bias=np.zeros(4 * units, np.float32),
+            dense=[(np.ones((units, 1), np.float32), np.zeros(1, np.float32), "linear")],
+        ),
+    )
+    test_frame = pd.concat([result.test_frame] * n_test_rows, ignore_index=True)
+    test_frame[result.features] = test_frame[result.features].astype(float) + 0.5 * np.arange(n_test_rows)[:, None]
+    result.test_frame = test_frame
+    expected = predict_single_test_row(result)
+
+    preflight = miner_module.PreflightResult(mode="advanced:lstm", training_result=result, model_config=cfg)
+    serving, release_stats = miner_module._release_training_result(preflight)
+    assert preflight.training_result is None
+    # The first test row (logged as the input row) and the last n_steps rows the window covers.
+    assert len(serving.history_tail) == kept_history and len(serving.test_rows) == kept_test
+    assert list(serving.history_tail.columns) == result.features
+    assert serving.released_nbytes > 0
+    assert release_stats["released_training_bytes"] == serving.released_nbytes
+    served = AdvancedModelPredictor(serving.as_training_result())
+    assert served.predict("2025-01-01 12:00:00") == pytest.approx(expected, rel=1e-6)
+    assert served.last_prediction_context["model_input_row"] == result.test_frame[result.features].iloc[0].to_dict()
+
+
+def test_baseline_reads_fresh_load_buffer_and_falls_back_when_stale(monkeypatch):
+    import time
+
+    import numpy as np
+
+    from bittbridge.utils.iso_ne_buffer import LoadRingBuffer
+
+    fetches: list[int] = []
+    monkeypatch.setattr(
+        inference_runtime, "_get_latest_load_values", lambda n: fetches.append(n) or [1.0] * n
+    )
+    buffer = LoadRingBuffer()
+    newest = int(time.time()) // 300 * 300 - 300
+    buffer.extend(newest - 300 * np.arange(12)[::-1], np.arange(12, dtype=np.float64))
+    predictor = BaselineMovingAveragePredictor(12, load_buffer=buffer)
+
+    assert predictor.predict("ignored") == pytest.approx(5.5)
+    assert predictor.last_prediction_context["source"] == "iso_ne_buffer"
+    assert fetches == []
+
+    predictor.max_buffer_age_sec = -1.0
+    assert predictor.predict("ignored") == 1.0
+    assert predictor.last_prediction_context["source"] == "iso_ne_api"
+    assert fetches == [12]
+
+
+def test_predictor_router_runs_sync_predictors_in_parallel_with_timeout():
+    import asyncio
+    import time
+
+    class _SlowPredictor:
+        def __init__(self, delay: float):
+            self.delay = delay
+            self.last_prediction_context = {}
+
+        def predict(self, timestamp: str):
+            time.sleep(self.delay)
+            self.last_prediction_context = {"timestamp": timestamp}
+            return 1.0
+
+    router = PredictorRouter(_SlowPredictor(0.2), max_workers=4, timeout_sec=1.0)
+
+    async def _burst():
+        ticks = []
+
+        async def _tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(_tick())
+        started = time.monotonic()
+        results = await asyncio.gather(*(router.predict_with_context_async(f"t{i}") for i in range(4)))
+        elapsed = time.monotonic() - started
+        ticker.cancel()
+        return results, elapsed, ticks
+
+    try:
+        results, elapsed, ticks = asyncio.run(_burst())
+        assert [pred for pred, _ in results] == [1.0] * 4
+        assert {ctx["timestamp"] for _, ctx in results} == {"t0", "t1", "t2", "t3"}
+        assert elapsed < 0.6
+        assert len(ticks) > 5  # event loop kept running while predictions were in flight
+
+        router.set_predictor(_SlowPredictor(0.5), mode="slow")
+        router.timeout_sec = 0.05
+        pred, ctx = asyncio.run(router.predict_with_context_async("late"))
+        assert pred == 1.0 and ctx["tier"] == "last_good"  # the previous answer beats forfeiting
+        assert "timed out" in ctx["fallback_errors"][0]
+        assert router.timeouts == 1
+
+        router.last_good_max_age_sec = 0.0
+        pred, ctx = asyncio.run(router.predict_with_context_async("late"))
+        assert pred is None
+        assert "timed out" in ctx["error"]
+        assert router.timeouts == 2
+    finally:
+        router.close()
+
+
+def test_predictor_router_falls_back_through_chain_within_deadline():
+    import asyncio
+    import time
+
+    class _Predictor:
+        def __init__(self, value=None, delay=0.0, exc=None):
+            self.value, self.delay, self.exc = value, delay, exc
+            self.last_prediction_context = {}
+
+        def predict(self, timestamp: str):
+            time.sleep(self.delay)
+            if self.exc is not None:
+                raise self.exc
+            self.last_prediction_context = {"timestamp": timestamp}
+            return self.value
+
+    class _AsyncBaseline:
+        last_prediction_context = {"source": "buffer"}
+
+        async def predict_async(self, timestamp: str):
+            return 42.0
+
+    baseline = _AsyncBaseline()
+    router = PredictorRouter(
+        _Predictor(value=1.0, delay=1.0),
+        timeout_sec=10.0,
+        fallbacks=[("advanced", _Predictor(exc=RuntimeError("cold model"))), ("baseline", baseline)],
+    )
+    router.mode = "custom"
+    try:
+        started = time.monotonic()
+        pred, ctx = asyncio.run(router.predict_with_context_async("t0", deadline_sec=0.2))
+        elapsed = time.monotonic() - started
+        assert pred == 42.0 and ctx["tier"] == "baseline" and ctx["source"] == "buffer"
+        assert "custom: prediction timed out" in ctx["fallback_errors"][0]
+        assert "advanced: RuntimeError: cold model" in ctx["fallback_errors"][1]
+        assert elapsed < 0.5  # the slow primary only had its share of the 0.2s deadline
+        stats = router.stats()
+        assert stats["fallbacks_used"] == 1 and stats["timeouts"] == 1
+        assert stats["tier_custom_timeouts"] == 1 and stats["tier_advanced_errors"] == 1
+        assert stats["tier_baseline_wins"] == 1
+        assert 0.1 <= stats["tier_custom_max_latency_sec"] < 0.2
+
+        # A NaN is not a valid answer either; the baseline as active predictor is not tried twice.
+        router.set_predictor(_Predictor(value=float("nan")), mode="nan")
+        assert asyncio.run(router.predict_with_context_async("t1"))[0] == 42.0
+        router.set_predictor(baseline, mode="baseline")
+        assert [name for name, _ in router.chain()] == ["baseline", "advanced"]
+    finally:
+        router.close()
+
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    import asyncio
+    import threading
+
+    class _BatchPredictor:
+        def __init__(self):
+            self.batches: list[list[str]] = []
+
+        def predict_batch(self, timestamps):
+            self.batches.append(list(timestamps))
+            if "bad" in timestamps:
+                raise RuntimeError("model exploded")
+            return [(float(len(t)), {"timestamp": t}) for t in timestamps]
+
+    class _SyncPredictor:
+        last_prediction_context = {}
+
+        def __init__(self):
+            self.calls: list[str] = []
+            self._lock = threading.Lock()
+
+        def predict(self, timestamp: str):
+            with self._lock:
+                self.calls.append(timestamp)
+            return 7.0
+
+    async def burst(router, timestamps):
+        return await asyncio.gather(*(router.predict_with_context_async(t) for t in timestamps))
+
+    batching = _BatchPredictor()
+    router = PredictorRouter(batching, batch_window_sec=0.02)
+    try:
+        results = asyncio.run(burst(router, ["t0", "t0", "t00", "t0", "t00"]))
+        assert batching.batches == [["t0", "t00"]]  # one model call, identical timestamps deduplicated
+        assert [pred for pred, _ in results] == [2.0, 2.0, 3.0, 2.0, 3.0]
+        assert all(ctx["batch_requests"] == 5 for _, ctx in results)
+        assert router.stats()["batches"] == 1 and router.stats()["batched_requests"] == 5
+        assert not router.batcher._flushes  # flush tasks are held until done, then released
+
+        # A failing batch answers its callers with the error, so the chain moves on (here to last good).
+        pred, ctx = asyncio.run(router.predict_with_context_async("bad"))
+        assert ctx["tier"] == "last_good"
+        assert "RuntimeError: model exploded" in ctx["fallback_errors"][0]
+
+        plain = _SyncPredictor()
+        router.set_predictor(plain, mode="plain")
+        results = asyncio.run(burst(router, ["a", "b", "a", "a"]))
+        assert sorted(plain.calls) == ["a", "b"]
+        assert [pred for pred, _ in results] == [7.0] * 4
+    finally:
+        router.close()
+
+
+def test_model_server_answers_remote_predictors_over_unix_socket(tmp_path):
+    import asyncio
+    import json
+
+    from miner_model_energy.model_server import REMOTE_DEADLINE_SHARE, ModelServer, RemoteModelPredictor
+
+    seen = []
+
+    async def answer(timestamp, deadline_sec):
+        seen.append((timestamp, deadline_sec))
+        if timestamp == "missing":
+            return None, {"error": "no forecast row"}
+        return 1234.5, {"tier": "linear", "requested_timestamp": timestamp}
+
+    socket_path = tmp_path / "model.sock"
+    server = ModelServer(answer, socket_path, stats=lambda: {"mode": "linear"})
+    remote = RemoteModelPredictor(socket_path, timeout_sec=2.0)
+
+    async def scenario():
+        await server.start()
+        try:
+            # Concurrent async clients (one miner's validators) and a blocking one (its precompute thread).
+            preds = await asyncio.gather(*(remote.predict_async(f"t{i}") for i in range(3)))
+            assert preds == [1234.5] * 3
+            assert await asyncio.to_thread(remote.predict, "t9") == 1234.5
+            assert remote.last_prediction_context == {
+                "tier": "linear",
+                "requested_timestamp": "t9",
+                "model_server": str(socket_path),
+            }
+            assert await remote.predict_async("missing") is None
+            assert remote.last_prediction_context["error"] == "no forecast row"
+            assert (await asyncio.to_thread(remote.stats)) == {"mode": "linear"}
+
+            # Malformed requests get an error line; the connection stays usable.
+            reader, writer = await asyncio.open_unix_connection(str(socket_path))
+            writer.write(b'{"deadline_sec": 1}\nnot json\n{"timestamp": "t5", "deadline_sec": 0.5}\n')
+            await writer.drain()
+            replies = [json.loads(await reader.readline()) for _ in range(3)]
+            writer.close()
+            assert "needs a timestamp" in replies[0]["error"] and "JSONDecodeError" in replies[1]["error"]
+            assert replies[2]["prediction"] == 1234.5
+
+            # Behind a router the remote tier forwards its budget, less the round-trip reserve.
+            router = PredictorRouter(remote, timeout_sec=1.0, batch_window_sec=0.01)
+            router.set_predictor(remote, mode="remote")
+            try:
+                pred, context = await router.predict_with_context_async("r1", deadline_sec=0.5)
+            finally:
+                router.close()
+            assert pred == 1234.5 and context["tier"] == "remote"
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
+    assert sorted(seen)[-1] == ("t9", None) and ("t5", 0.5) in seen
+    (forwarded,) = [deadline for timestamp, deadline in seen if timestamp == "r1"]
+    assert 0.4 < forwarded <= 0.5 * REMOTE_DEADLINE_SHARE
+    assert server.requests == 7
+    assert not socket_path.exists()
+    with pytest.raises((ConnectionError, FileNotFoundError)):
+        remote.predict("t0")  # server gone: the router's fallback chain takes over
+
+
+def test_precomputer_serves_upcoming_slots_and_invalidates_on_model_swap():
+    from miner_model_energy.precompute import PredictionCache, PredictionPrecomputer, upcoming_challenge_timestamps
+
+    class _CountingPredictor:
+        def __init__(self, value: float):
+            self.value = value
+            self.calls: list[str] = []
+            self.last_prediction_context = {}
+
+        def predict(self, timestamp: str):
+            self.calls.append(timestamp)
+            self.last_prediction_context = {"timestamp": timestamp}
+            return self.value
+
+    now = datetime.fromisoformat("2026-03-09T10:01:40-04:00")
+    slots = upcoming_challenge_timestamps(3, now=now)
+    assert [s[11:16] for s in slots] == ["16:00", "16:05", "16:10"]
+
+    first = _CountingPredictor(100.0)
+    router = PredictorRouter(first)
+    precomputer = PredictionPrecomputer(router, PredictionCache(max_age_sec=60), n_slots=3, upcoming=lambda n: slots)
+    try:
+        assert precomputer.refresh() == 3
+        assert precomputer.refresh() == 0  # still fresh: nothing recomputed
+        assert first.calls == slots
+        # Same instant written with a different offset still hits.
+        utc_form = datetime.fromisoformat(slots[1]).astimezone(tz=None).isoformat()
+        assert precomputer.lookup(utc_form) == (100.0, {"timestamp": slots[1], "tier": "baseline", "precomputed": True})
+        assert precomputer.lookup("2026-03-09T17:00:00-04:00") is None
+
+        router.set_predictor(_CountingPredictor(200.0), mode="linear")
+        assert precomputer.lookup(slots[0]) is None
+        assert precomputer.refresh() == 3
+        assert precomputer.lookup(slots[0])[0] == 200.0
+        assert (precomputer.cache.hits, precomputer.cache.misses) == (2, 2)
+    finally:
+        router.close()
+
+
+def test_precomputer_stores_only_active_tier_answers_within_its_interval():
+    import time
+
+    from miner_model_energy.precompute import PredictionCache, PredictionPrecomputer
+
+    class _HungPredictor:
+        def predict(self, timestamp: str):
+            time.sleep(1.0)
+            return 1.0
+
+    class _Fallback:
+        last_prediction_context = {}
+
+        def predict(self, timestamp: str):
+            return 50.0
+
+    slots = ["2026-03-09T16:00:00-04:00", "2026-03-09T16:05:00-04:00"]
+    router = PredictorRouter(_HungPredictor(), fallbacks=[("baseline", _Fallback())])
+    router.set_predictor(router.predictor, mode="linear")
+    precomputer = PredictionPrecomputer(
+        router, PredictionCache(), n_slots=2, interval_sec=0.2, upcoming=lambda n: slots
+    )
+    try:
+        started = time.monotonic()
+        assert precomputer.refresh() == 0  # the baseline answered, not the model: nothing cached
+        assert time.monotonic() - started < 0.9
+        assert len(precomputer.cache) == 0
+        assert router.tier_stats["linear"].timeouts == 2
+        assert router.tier_stats["baseline"].wins == 2
+    finally:
+        router.close()
+
+
+def test_model_reloader_swaps_after_warmup_and_rolls_back(tmp_path):
+    import json
+
+    from miner_model_energy.hot_reload import RELOAD_REQUEST_NAME, RELOAD_STATUS_NAME, ModelReloader
+
+    class _Predictor:
+        def __init__(self, value):
+            self.value = value
+            self.last_prediction_context = {}
+
+        def predict(self, timestamp: str):
+            return self.value
+
+    for name in ("run_good", "run_nan"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "manifest.json").write_text("{}", encoding="utf-8")
+    candidates = {"run_good": _Predictor(250.0), "run_nan": _Predictor(float("nan"))}
+    loaded = []
+
+    def load_candidate(request):
+        loaded.append(request.manifest_path)
+        return candidates[request.manifest_path.parent.name], f"artifact:{request.manifest_path.parent.name}"
+
+    baseline = _Predictor(100.0)
+    router = PredictorRouter(baseline)
+    reloader = ModelReloader(router, load_candidate, tmp_path, upcoming=lambda n: ["t0", "t1"][:n])
+
+    def request(payload):
+        (tmp_path / RELOAD_REQUEST_NAME).write_text(json.dumps(payload), encoding="utf-8")
+        status = reloader.check_once()
+        assert not (tmp_path / RELOAD_REQUEST_NAME).exists()
+        assert json.loads((tmp_path / RELOAD_STATUS_NAME).read_text(encoding="utf-8")) == status
+        return status
+
+    try:
+        assert reloader.check_once() is None
+        status = request({"manifest": "run_good"})
+        assert status["ok"] and status["mode"] == "artifact:run_good" and status["previous_mode"] == "baseline"
+        assert loaded == [tmp_path / "run_good" / "manifest.json"]
+        assert router.predictor is candidates["run_good"] and router.generation == 1
+
+        # The warmup rejects a model that cannot answer; the running one keeps serving.
+        status = request({"manifest": str(tmp_path / "run_nan" / "manifest.json")})
+        assert not status["ok"] and "warmup prediction for t0" in status["error"]
+        assert router.predictor is candidates["run_good"] and router.mode == "artifact:run_good"
+
+        assert not request({"manifest": "missing_run"})["ok"]
+        assert request({"rollback": True})["mode"] == "baseline"
+        assert router.predictor is baseline and router.generation == 2
+    finally:
+        router.close()
+
+
+def test_background_train_swaps_trained_model_in_after_baseline(tmp_path):
+    from types import SimpleNamespace
+
+    from miner_model_energy.hot_reload import ModelReloader, ReloadRequest, parse_reload_request
+
+    train_path, test_path = _write_dataset(tmp_path)
+    cfg = load_model_config(str(_write_config(tmp_path, train_path, test_path, {"use_time_features": True})))
+
+    class _Baseline:
+        last_prediction_context = {}
+
+        def predict(self, timestamp: str):
+            return 100.0
+
+    miner_stub = SimpleNamespace(_reload_model_config=lambda: cfg)
+    router = PredictorRouter(_Baseline())
+    reloader = ModelReloader(
+        router,
+        lambda request: miner_module.PredictionService._load_reload_candidate(miner_stub, request),
+        cfg.persistence["artifact_dir"],
+        upcoming=lambda n: ["2026-03-09T16:00:00-04:00"],
+    )
+    try:
+        assert parse_reload_request({"train": "LSTM"}, tmp_path) == ReloadRequest(kind="train", model_type="lstm")
+        worker = reloader.reload_in_background(ReloadRequest(kind="train", model_type="linear"))
+        assert router.mode == "baseline"  # answered by the baseline until the swap
+        worker.join(60)
+        assert not reloader.is_reloading
+        assert reloader.last_status["ok"], reloader.last_status
+        assert router.mode == "advanced:linear"
+        assert isinstance(router.predictor, AdvancedModelPredictor)
+        assert list(Path(cfg.persistence["artifact_dir"]).glob("*_linear_miner/manifest.json"))
+    finally:
+        router.close()
+
+
+def test_blacklist_and_priority_use_hotkey_index():
+    import asyncio
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from bittbridge.utils.uids import HotkeyIndex
+
+    metagraph = SimpleNamespace(
+        hotkeys=["hk-miner", "hk-validator"],
+        S=np.array([1.5, 250.0], dtype=np.float32),
+        validator_permit=np.array([False, True]),
+    )
+
+    def miner(allow_non_registered=False, force_validator_permit=True):
+        blacklist = SimpleNamespace(
+            allow_non_registered=allow_non_registered, force_validator_permit=force_validator_permit
+        )
+        return SimpleNamespace(
+            config=SimpleNamespace(blacklist=blacklist), hotkey_index=HotkeyIndex.from_metagraph(metagraph)
+        )
+
+    def request(hotkey):
+        return SimpleNamespace(dendrite=SimpleNamespace(hotkey=hotkey))
+
+    def blacklist(m, hotkey):
+        return asyncio.run(miner_module.Miner.blacklist(m, request(hotkey)))
+
+    def priority(m, hotkey):
+        return asyncio.run(miner_module.Miner.priority(m, request(hotkey)))
+
+    strict = miner()
+    assert blacklist(strict, "hk-validator") == (False, "Hotkey recognized!")
+    assert blacklist(strict, "hk-miner") == (True, "Non-validator hotkey")
+    # Unknown hotkeys are rejected instead of raising ValueError from list.index.
+    assert blacklist(strict, "hk-unknown") == (True, "Unrecognized hotkey")
+    assert blacklist(miner(allow_non_registered=True), "hk-unknown") == (True, "Non-validator hotkey")
+    assert blacklist(miner(allow_non_registered=True, force_validator_permit=False), "hk-unknown")[0] is False
+    assert priority(strict, "hk-validator") == 250.0
+    assert priority(strict, "hk-unknown") == 0.0
+
+    # A resync replaces the whole index.
+    metagraph.hotkeys = ["hk-validator"]
+    metagraph.S = np.array([300.0])
+    metagraph.validator_permit = np.array([True])
+    strict.hotkey_index = HotkeyIndex.from_metagraph(metagraph)
+    assert priority(strict, "hk-validator") == 300.0
+    assert blacklist(strict, "hk-miner") == (True, "Unrecognized hotkey")
+
+
 def test_empty_weather_whitelist_drops_raw_columns(tmp_path):
     """Default YAML semantics: [] removes *-tmpf etc.; need engineered features to train."""
     train_path, test_path = _write_dataset(tmp_path)
@@ -401,6 +977,319 @@ def test_lstm_standardize_inputs_and_reload(tmp_path):
     assert reloaded.scaler is not None
 
 
+@pytest.mark.parametrize("model_type", ["lstm", "rnn"])
+@pytest.mark.parametrize("standardize", [False, True])
+def test_sequence_kernel_matches_keras_predict(tmp_path, model_type, standardize):
+    pytest.importorskip("tensorflow")
+    import numpy as np
+
+    train_path, test_path = _write_dataset(tmp_path)
+    cfg_path = _write_config(
+        tmp_path,
+        train_path,
+        test_path,
+        {"use_time_features": True, "use_load_lags": True},
+    )
+    raw = yaml.safe_load(cfg_path.read_text(encoding="utf-8"))
+    raw["models"][model_type].update(standardize_inputs=standardize, n_steps=4, epochs=1)
+    cfg_path.write_text(yaml.safe_dump(raw, sort_keys=False), encoding="utf-8")
+    cfg = load_model_config(str(cfg_path))
+    result = train_model(model_type, cfg)
+    bundle = result.model_bundle
+    assert bundle.kernel is not None
+
+    X = result.train_frame[result.features].astype(float).to_numpy()[:24]
+    windows = np.stack([X[i : i + bundle.n_steps] for i in range(len(X) - bundle.n_steps)])
+    scaled = windows if bundle.scaler is None else bundle.scaler.transform(
+        windows.reshape(-1, windows.shape[2])
+    ).reshape(windows.shape)
+    keras_pred = bundle.model.predict(np.asarray(scaled, dtype=np.float32), verbose=0).reshape(-1)
+    np.testing.assert_allclose(bundle.kernel.predict(windows), keras_pred, rtol=1e-4, atol=1e-3)
+
+    saved = persist_training_result(result, cfg, run_id=f"pytest_{model_type}_kernel")
+    manifest = load_manifest(saved["manifest_path"])
+    assert manifest.get(f"{model_type}_kernel_path") == f"model_{model_type}_kernel.npz"
+    reloaded = load_training_bundle_from_manifest(saved["manifest_path"])
+    assert reloaded.model is None
+    predict = predict_lstm if model_type == "lstm" else predict_rnn
+    np.testing.assert_allclose(predict(reloaded, windows), predict(bundle, windows), rtol=1e-6)
+
+
+def _reference_lstm_step(x, h, c, W, U, b):
+    import numpy as np
+
+    sig = lambda v: 1.0 / (1.0 + np.exp(-v))
+    z = x @ W + h @ U + b
+    i, f, g, o = np.split(z, 4)
+    c = sig(f) * c + sig(i) * np.tanh(g)
+    return sig(o) * np.tanh(c), c
+
+
+def test_sequence_kernel_reloads_from_npz_without_tensorflow(tmp_path):
+    import numpy as np
+    from sklearn.preprocessing import StandardScaler
+
+    import joblib
+
+    from miner_model_energy.models_lstm import LSTM_KERNEL_FILENAME, LstmBundle, load_lstm
+    from miner_model_energy.sequence_kernels import SequenceKernel, save_sequence_kernel
+
+    rng = np.random.default_rng(0)
+    n_features, units, n_steps = 5, 6, 4
+    history = rng.normal(100.0, 20.0, size=(40, n_features))
+    scaler = StandardScaler().fit(history)
+    kernel = SequenceKernel(
+        cell="lstm",
+        kernel=rng.normal(0, 0.3, (n_features, 4 * units)).astype(np.float32),
+        recurrent_kernel=rng.normal(0, 0.3, (units, 4 * units)).astype(np.float32),
+        bias=rng.normal(0, 0.1, 4 * units).astype(np.float32),
+        dense=[
+            (rng.normal(0, 0.3, (units, 3)).astype(np.float32), np.zeros(3, np.float32), "relu"),
+            (rng.normal(0, 0.3, (3, 1)).astype(np.float32), np.ones(1, np.float32), "linear"),
+        ],
+        scaler_mean=scaler.mean_,
+        scaler_scale=scaler.scale_,
+    )
+    save_sequence_kernel(kernel, str(tmp_path / LSTM_KERNEL_FILENAME))
+    joblib.dump(scaler, tmp_path / LSTM_SCALER_FILENAME)
+    bundle = load_lstm(
+        str(tmp_path / "model_lstm.keras"),  # never opened: the kernel file is present
+        features=[f"f{i}" for i in range(n_features)],
+        n_steps=n_steps,
+        scaler_path=str(tmp_path / LSTM_SCALER_FILENAME),
+        kernel_path=str(tmp_path / LSTM_KERNEL_FILENAME),
+    )
+    assert isinstance(bundle, LstmBundle) and bundle.model is None
+    assert bundle.scaler is None  # folded into the kernel, so the joblib file is not read
+    assert "tensorflow" not in sys.modules
+
+    window = scaler.transform(history[-n_steps:])
+    h, c = np.zeros(units), np.zeros(units)
+    for x in window:
+        h, c = _reference_lstm_step(x, h, c, kernel.kernel, kernel.recurrent_kernel, kernel.bias)
+    (W1, b1, _), (W2, b2, _) = kernel.dense
+    expected = np.maximum(h @ W1 + b1, 0.0) @ W2 + b2
+    np.testing.assert_allclose(predict_lstm(bundle, history), expected, rtol=1e-4)
+
+
+@pytest.mark.parametrize("model_type", ["lstm", "rnn"])
+def test_manifest_numpy_inference_false_serves_from_keras(tmp_path, monkeypatch, model_type):
+    import json
+    import types
+
+    import numpy as np
+
+    from miner_model_energy import models_lstm, models_rnn
+    from miner_model_energy.pipeline import load_training_bundle_from_manifest
+    from miner_model_energy.sequence_kernels import SequenceKernel, save_sequence_kernel
+
+    class _KerasModel:
+        def predict(self, X, verbose=0):
+            return np.full((len(X), 1), 42.0)
+
+    keras_models = types.ModuleType("tensorflow.keras.models")
+    keras_models.load_model = lambda path: _KerasModel()
+    monkeypatch.setitem(sys.modules, "tensorflow", types.ModuleType("tensorflow"))
+    monkeypatch.setitem(sys.modules, "tensorflow.keras", types.ModuleType("tensorflow.keras"))
+    monkeypatch.setitem(sys.modules, "tensorflow.keras.models", keras_models)
+
+    def _no_export(*args, **kwargs):
+        raise AssertionError("kernel exported although numpy_inference is false")
+
+    module = models_lstm if model_type == "lstm" else models_rnn
+    monkeypatch.setattr(module, "export_sequence_kernel", _no_export)
+
+    rng = np.random.default_rng(0)
+    n_features, units, n_steps = 2, 3, 4
+    gates = 4 if model_type == "lstm" else 1
+    kernel = SequenceKernel(
+        cell="lstm" if model_type == "lstm" else "simple_rnn",
+        kernel=rng.normal(0, 0.3, (n_features, gates * units)).astype(np.float32),
+        recurrent_kernel=rng.normal(0, 0.3, (units, gates * units)).astype(np.float32),
+        bias=np.zeros(gates * units, np.float32),
+        dense=[(rng.normal(0, 0.3, (units, 1)).astype(np.float32), np.zeros(1, np.float32), "linear")],
+    )
+    # A stray kernel file from an earlier run must not be picked up either.
+    save_sequence_kernel(kernel, str(tmp_path / f"model_{model_type}_kernel.npz"))
+    manifest = {
+        "model_type": model_type,
+        "model_path": f"model_{model_type}.keras",
+        "features": ["a", "b"],
+        f"{model_type}_n_steps": n_steps,
+        f"{model_type}_kernel_path": f"model_{model_type}_kernel.npz",
+        f"{model_type}_numpy_inference": False,
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    bundle = load_training_bundle_from_manifest(str(tmp_path / "manifest.json"))
+    assert bundle.kernel is None and isinstance(bundle.model, _KerasModel)
+    predict = predict_lstm if model_type == "lstm" else predict_rnn
+    assert predict(bundle, np.zeros((n_steps, n_features)))[0] == 42.0
+
+
+@pytest.mark.parametrize("cell", ["lstm", "simple_rnn"])
+def test_streaming_sequence_state_advances_one_step_per_slot(cell):
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from miner_model_energy.pipeline import make_streaming_state
+    from miner_model_energy.sequence_kernels import SequenceKernel, StreamingSequenceState
+
+    rng = np.random.default_rng(1)
+    n_features, units, n_steps = 3, 5, 6
+    gates = 4 * units if cell == "lstm" else units
+    kernel = SequenceKernel(
+        cell=cell,
+        kernel=rng.normal(0, 0.3, (n_features, gates)).astype(np.float32),
+        recurrent_kernel=rng.normal(0, 0.3, (units, gates)).astype(np.float32),
+        bias=rng.normal(0, 0.1, gates).astype(np.float32),
+        dense=[(rng.normal(0, 0.3, (units, 1)).astype(np.float32), np.zeros(1, np.float32), "linear")],
+    )
+    history = rng.normal(0, 1, (40, n_features))
+    streaming = StreamingSequenceState(kernel, resync_steps=3)
+    run_calls = []
+    real_run = kernel.run
+    kernel.run = lambda X, state=None: run_calls.append(np.shape(X)[1]) or real_run(X, state)
+
+    def window(end):  # history rows end - n_steps + 1 .. end - 1, then a forecast row
+        return np.vstack([history[end - n_steps + 1 : end], rng.normal(0, 1, (1, n_features))])
+
+    for slot, end in enumerate(range(10, 18)):
+        w = window(end)
+        pred = streaming.predict(w)
+        if slot % 4 == 0:
+            # Fresh start or more than resync_steps streamed rows: rebuilt from the window itself.
+            assert streaming.last_update == "resync"
+            assert pred == pytest.approx(float(kernel.predict(w[np.newaxis])[0]), rel=1e-5)
+            resync_from = end - n_steps + 1
+        else:
+            assert streaming.last_update == "advance"
+            assert run_calls[-2:] == [1, 1]  # one new history row, then the forecast row
+            # Same as running from the last resync point over every row since.
+            carried = np.vstack([history[resync_from:end], w[-1:]])
+            assert pred == pytest.approx(float(kernel.predict(carried[np.newaxis])[0]), rel=1e-5)
+    assert (streaming.resyncs, streaming.streamed_rows) == (2, 6)
+
+    # Same history again (another forecast row): nothing to advance.
+    streaming.predict(window(17))
+    assert streaming.last_update == "reuse"
+    # Several forecast rows on that history run as one batched step from the held state.
+    shared = np.stack([window(17), window(17)])
+    assert streaming.predict_batch(shared) == pytest.approx([streaming.predict(w) for w in shared], rel=1e-5)
+    assert run_calls[-3] == 1 and streaming.last_update == "reuse"
+    # Windows on different history tails: one stacked full-window pass, held state untouched.
+    mixed = np.stack([window(17), window(16)])
+    assert streaming.predict_batch(mixed) == pytest.approx(kernel.predict(mixed), rel=1e-5)
+    assert run_calls[-1] == n_steps
+    # A window that does not continue the held one (e.g. after a gap) resyncs.
+    streaming.predict(window(30))
+    assert streaming.last_update == "resync"
+
+    bundle = SimpleNamespace(kernel=kernel)
+    config = SimpleNamespace(models={"lstm": {"streaming_resync_steps": 12}})
+    assert make_streaming_state(SimpleNamespace(model_type="lstm", model_bundle=bundle), config).resync_steps == 12
+    assert make_streaming_state(SimpleNamespace(model_type="rnn", model_bundle=bundle), config) is None
+    assert make_streaming_state(SimpleNamespace(model_type="linear", model_bundle=bundle), config) is None
+
+
+@pytest.mark.parametrize("model_type", ["linear", "cart"])
+def test_compiled_bundle_matches_sklearn_and_reloads_without_it(tmp_path, model_type):
+    import numpy as np
+
+    from miner_model_energy.models_cart import predict_cart
+    from miner_model_energy.models_linear import predict_linear
+
+    train_path, test_path = _write_dataset(tmp_path)
+    cfg_path = _write_config(
+        tmp_path,
+        train_path,
+        test_path,
+        {"use_time_features": True, "use_load_lags": True, "use_station_agg_features": True},
+    )
+    cfg = load_model_config(str(cfg_path))
+    result = train_model(model_type, cfg)
+    bundle = result.model_bundle
+    assert bundle.compiled is not None
+
+    X = result.train_frame[result.features].astype(float).to_numpy()
+    rng = np.random.default_rng(7)
+    X = np.vstack([X, X + rng.normal(0.0, 3.0, X.shape)])
+    if model_type == "linear":
+        expected = bundle.model.predict(bundle.scaler.transform(X))
+        predict = predict_linear
+    else:
+        X[::5, 0] = np.nan  # follows sklearn's missing-value routing
+        expected = bundle.model.predict(X)
+        predict = predict_cart
+    np.testing.assert_allclose(predict(bundle, X), expected, rtol=1e-9)
+    for i in range(0, len(X), 17):
+        np.testing.assert_allclose(predict(bundle, X[i : i + 1]), expected[i : i + 1], rtol=1e-9)
+
+    saved = persist_training_result(result, cfg, run_id=f"pytest_{model_type}_compiled")
+    manifest = load_manifest(saved["manifest_path"])
+    assert manifest.get(f"{model_type}_compiled_path") == f"model_{model_type}_compiled.npz"
+    reloaded = load_training_bundle_from_manifest(saved["manifest_path"])
+    assert reloaded.model is None
+    assert reloaded.features == result.features
+    np.testing.assert_allclose(predict(reloaded, X), expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("n_steps", [None, 4])
+def test_custom_predictor_csv_mode_prepares_frames_once(tmp_path, monkeypatch, n_steps):
+    import numpy as np
+
+    from miner_model_energy import pipeline as pipeline_module
+    from miner_model_energy.inference_runtime import CustomModelPredictor
+
+    start = datetime(2025, 1, 1, 0, 0, 0)
+    rows = [_weather_row(i, start) for i in range(96)]
+    train = pd.DataFrame(rows[:90])
+    test = pd.DataFrame(rows[90:]).drop(columns=["Total Load"]).iloc[::-1]  # file order is not dt order
+    train.to_csv(tmp_path / "train.csv", index=False)
+    test.to_csv(tmp_path / "test.csv", index=False)
+    cfg = load_model_config(
+        str(_write_config(tmp_path, tmp_path / "train.csv", tmp_path / "test.csv", {"use_load_lags": True}))
+    )
+    train_frame, test_frame, features = prepare_training_data(cfg, show_progress=False)
+
+    calls = []
+    real_prepare = pipeline_module.prepare_training_data
+    monkeypatch.setattr(
+        pipeline_module,
+        "prepare_training_data",
+        lambda *a, **kw: calls.append(1) or real_prepare(*a, **kw),
+    )
+
+    class _SumWrapper:
+        kind = "sklearn"
+
+        def predict_values(self, X):
+            return np.asarray(X, dtype=np.float64).reshape(len(X), -1).sum(axis=1)
+
+    predictor = CustomModelPredictor(wrapper=_SumWrapper(), config=cfg, features=features, sequence_n_steps=n_steps)
+    assert len(calls) == 1
+
+    test_sorted = test_frame.sort_values("dt").reset_index(drop=True)
+    prior = train_frame[features].dropna().astype(float).to_numpy()[-(n_steps - 1) :] if n_steps else None
+    for offset_min, expected_pos in [(0, 0), (5, 1), (12, 2), (13, 3), (25, 5), (400, 5), (-60, 0)]:
+        ts = (test_sorted["dt"].iloc[0] + timedelta(minutes=offset_min)).isoformat()
+        row = test_sorted[features].astype(float).to_numpy(dtype=np.float32)[expected_pos]
+        X = row[np.newaxis, :] if prior is None else np.vstack([prior.astype(np.float32), row])[np.newaxis]
+        assert predictor.predict(ts) == pytest.approx(float(X.astype(np.float64).sum()))
+        assert predictor.last_prediction_context["custom_model_input_shape"] == list(X.shape)
+    # Timestamps with an offset are matched on UTC wall clock, like the Supabase path.
+    aware = (test_sorted["dt"].iloc[2] - timedelta(hours=5)).isoformat() + "-05:00"
+    assert predictor.predict(aware) == predictor.predict(test_sorted["dt"].iloc[2].isoformat())
+    assert len(calls) == 1
+
+    # One stacked model call scores several timestamps with the same values as predict().
+    batch_ts = [test_sorted["dt"].iloc[i].isoformat() for i in (0, 3, 5)]
+    batched = predictor.predict_batch(batch_ts)
+    assert [pred for pred, _ in batched] == [pytest.approx(predictor.predict(ts)) for ts in batch_ts]
+    assert all(ctx["batch_size"] == 3 for _, ctx in batched)
+
+
 class _FakeResponse:
     def __init__(self, data):
         self.data = data
@@ -561,6 +1450,160 @@ def test_fetch_supabase_test_row_for_probe_falls_back_to_latest_matching_horizon
     assert row["dt"] == "2026-03-15 18:00:00"
 
 
+def test_fetch_live_inputs_sync_and_async_agree():
+    import asyncio
+
+    from miner_model_energy.supabase_io import fetch_live_inputs, fetch_live_inputs_async
+
+    train_rows = [
+        {"dt": f"2026-04-13 20:{m:02d}:00+00:00", "total_load": 1000.0 + m, "4B8-tmpf": 55.0}
+        for m in range(0, 60, 5)
+    ]
+    test_rows = [
+        {"dt": "2026-04-13 10:35:00", "horizon_min": 5, "4B8-tmpf": 51.0},
+        {"dt": "2026-04-13 14:40:00", "horizon_min": 5, "4B8-tmpf": 52.0},
+    ]
+    tables = {"train_table": train_rows, "test_table": test_rows}
+
+    class _AsyncQuery(_FakeQuery):
+        async def execute(self):
+            await asyncio.sleep(0)
+            return _FakeQuery.execute(self)
+
+    class _AsyncSchemaClient(_FakeSchemaClient):
+        def table(self, name):
+            return _AsyncQuery(self._tables[name])
+
+    class _AsyncClient(_FakeSupabaseClient):
+        def schema(self, _schema_name):
+            return _AsyncSchemaClient(self._tables)
+
+    args = ("hackathon", "train_table", "test_table", 4, "2026-04-13T10:37:00-04:00", 5)
+    history, row = fetch_live_inputs(_FakeSupabaseClient(tables), *args)
+    history_a, row_a = asyncio.run(fetch_live_inputs_async(_AsyncClient(tables), *args))
+
+    assert list(history["Total Load"]) == [1040.0, 1045.0, 1050.0, 1055.0]
+    pd.testing.assert_frame_equal(history, history_a)
+    # No exact row at 14:37 UTC / 10:37 local: the 5-minute window picks the wall-clock row.
+    assert row == row_a == test_rows[1]
+
+
+def test_supabase_live_predictor_batch_stacks_windows_into_one_forward_pass():
+    import asyncio
+
+    import numpy as np
+
+    from miner_model_energy.models_rnn import RnnBundle
+    from miner_model_energy.pipeline import TrainingResult
+    from miner_model_energy.sequence_kernels import SequenceKernel
+
+    train_rows = [
+        {"dt": f"2026-04-13 20:{m:02d}:00+00:00", "total_load": 1.0 + m / 60, "4B8-tmpf": m / 60}
+        for m in range(0, 60, 5)
+    ]
+    test_rows = [
+        {"dt": f"2026-04-13 14:{m:02d}:00", "horizon_min": 5, "4B8-tmpf": value} for m, value in ((35, -1.0), (40, 1.0))
+    ]
+    fetched: list[str] = []
+
+    class _CountingClient(_FakeSupabaseClient):
+        def schema(self, schema_name):
+            client = self
+
+            class _Schema(_FakeSchemaClient):
+                def table(self, name):
+                    fetched.append(name)
+                    return _FakeQuery(client._tables[name])
+
+            return _Schema(self._tables)
+
+    rng = np.random.default_rng(3)
+    kernel = SequenceKernel(
+        cell="simple_rnn",
+        kernel=rng.normal(0, 0.3, (2, 4)).astype(np.float32),
+        recurrent_kernel=rng.normal(0, 0.3, (4, 4)).astype(np.float32),
+        bias=np.zeros(4, np.float32),
+        dense=[(rng.normal(0, 0.3, (4, 1)).astype(np.float32), np.zeros(1, np.float32), "linear")],
+    )
+    batch_shapes: list[tuple] = []
+    real_predict = kernel.predict
+    kernel.predict = lambda X: batch_shapes.append(np.shape(X)) or real_predict(X)
+    features = ["4B8-tmpf", "load_lag_1"]
+    result = TrainingResult(
+        model_type="rnn",
+        model_bundle=RnnBundle(model=None, features=features, n_steps=3, kernel=kernel),
+        metrics={},
+        features=features,
+        train_frame=pd.DataFrame(),
+        test_frame=pd.DataFrame(),
+        shapes={},
+    )
+    cfg = ModelConfig(
+        data={
+            "source": "supabase",
+            "supabase_schema": "hackathon",
+            "supabase_train_table": "train_table",
+            "supabase_test_table": "test_table",
+            "forecast_horizon_min": 5,
+        },
+        features={"include_weather_suffix_groups": ["tmpf"], "use_load_lags": True, "load_lag_steps": [1]},
+        training={},
+        models={},
+        persistence={},
+    )
+
+    class _Clients:
+        def sync(self):
+            return _CountingClient({"train_table": train_rows, "test_table": test_rows})
+
+        async def async_client(self):
+            return None
+
+    predictor = inference_runtime.SupabaseLiveAdvancedPredictor(result=result, config=cfg, clients=_Clients())
+    timestamps = ["2026-04-13T10:35:00-04:00", "2026-04-13T10:40:00-04:00", "2026-04-13T12:00:00-04:00"]
+    singles = [predictor.predict(t) for t in timestamps[:2]]
+    fetched.clear()
+    batch_shapes.clear()
+
+    batched = asyncio.run(predictor.predict_batch_async(timestamps))
+
+    assert [pred for pred, _ in batched[:2]] == pytest.approx(singles, rel=1e-6)
+    assert singles[0] != pytest.approx(singles[1])  # different forecast rows, same history
+    assert batch_shapes == [(2, 3, 2)]  # one stacked forward pass for both windows
+    assert fetched.count("train_table") == 1
+    assert batched[0][1]["batch_size"] == 2
+    assert batched[2][0] is None and "no forecast row" in batched[2][1]["error"]
+
+
+def test_supabase_live_predictor_reuses_one_client(monkeypatch):
+    from miner_model_energy import supabase_io
+
+    created: list[tuple[str, str]] = []
+    monkeypatch.setattr(supabase_io, "_shared_clients", {})
+    monkeypatch.setattr(
+        supabase_io, "create_supabase_data_client", lambda url, key: created.append((url, key)) or object()
+    )
+    seen: list[object] = []
+    monkeypatch.setattr(
+        inference_runtime,
+        "predict_for_timestamp_with_context",
+        lambda result, config, ts, client=None, engine=None, streaming=None: seen.append(client) or (1.0, {}),
+    )
+    cfg = ModelConfig(
+        data={"source": "supabase", "supabase_url": "https://x.supabase.co", "supabase_key": "k"},
+        features={},
+        training={},
+        models={},
+        persistence={},
+    )
+    predictor = inference_runtime.SupabaseLiveAdvancedPredictor(result=None, config=cfg)
+    other = inference_runtime.SupabaseLiveAdvancedPredictor(result=None, config=cfg)
+    for p in (predictor, predictor, other):
+        assert p.predict("2026-04-13T10:35:00-04:00") == 1.0
+    assert created == [("https://x.supabase.co", "k")]
+    assert seen[0] is seen[1] is seen[2]
+
+
 def test_required_history_rows_for_live_rnn_load_lag_24_covers_sequence_window():
     """After shift(max_lag), only tail rows are non-NaN in load_lag_*; fetch enough for RNN window."""
 